@@ -23,7 +23,7 @@ qiskit extension module for solving ordinary differential equations.
 """
 from .version import __version__
 
-from .solve import solve_ode, solve_lmde
+from .solve import solve_ode, solve_lmde, solve_lmde_iter
 
 from . import models
 from . import signals
@@ -18,6 +18,7 @@ Module for frame handling classes.
 from abc import ABC, abstractmethod
 from typing import Union, List, Optional, Tuple
 import numpy as np
+from scipy.sparse import issparse, csr_matrix, diags as sparse_diags
 
 from qiskit import QiskitError
 from qiskit.quantum_info.operators import Operator
@@ -218,7 +219,8 @@ class BaseFrame(ABC):
 
         Given operator :math:`G`, and ``op_to_add_in_fb`` :math:`B`, returns
         :math:`exp(-tF)Gexp(tF) + B`, where :math:`B` is assumed to be
-        specified in the frame basis.
+        specified in the frame basis. If :math:`B` is a 1d array, it is
+        interpreted as the diagonal of a diagonal matrix.
 
         Args:
             t: time.
@@ -321,7 +323,7 @@ class BaseFrame(ABC):
             return self._conjugate_and_add(
                 t,
                 operator,
-                op_to_add_in_fb=-np.diag(self.frame_diag),
+                op_to_add_in_fb=-self.frame_diag,
                 operator_in_frame_basis=operator_in_frame_basis,
                 return_in_frame_basis=return_in_frame_basis,
             )
@@ -356,7 +358,7 @@ class BaseFrame(ABC):
             return self._conjugate_and_add(
                 -t,
                 operator,
-                op_to_add_in_fb=Array(np.diag(self.frame_diag)),
+                op_to_add_in_fb=self.frame_diag,
                 operator_in_frame_basis=operator_in_frame_basis,
                 return_in_frame_basis=return_in_frame_basis,
             )
@@ -454,6 +456,9 @@ class BaseFrame(ABC):
         then use `self.operator_into_frame` or `self.generator_into_frame`
         the frame transformation as required, using `operator_in_frame=True`.
 
+        If ``operators`` is a list of ``scipy.sparse`` matrices, the two lists of operators are
+        returned as lists of CSR matrices.
+
         Args:
             operators: list of operators
             cutoff_freq: cutoff frequency
@@ -493,6 +498,11 @@ class Frame(BaseFrame):
         self._frame_operator = frame_operator
         frame_operator = to_array(frame_operator)
 
+        # the frame is diagonalized, so is handled as a dense array
+        if issparse(frame_operator):
+            frame_operator = Array(frame_operator.toarray())
+
+        self._frame_basis_is_identity = False
         if frame_operator is None:
             self._dim = None
             self._frame_diag = None
@@ -509,6 +519,7 @@ class Frame(BaseFrame):
             self._frame_basis = Array(np.eye(len(frame_operator)))
             self._frame_basis_adjoint = self.frame_basis
             self._dim = len(self._frame_diag)
+            self._frame_basis_is_identity = True
         # if not, diagonalize it
         else:
 
@@ -516,13 +527,25 @@ class Frame(BaseFrame):
             # if Hermitian convert to anti-Hermitian
             frame_operator = _is_herm_or_anti_herm(frame_operator, atol=atol, rtol=rtol)
 
-            # diagonalize with eigh, utilizing assumption of anti-hermiticity
-            frame_diag, frame_basis = np.linalg.eigh(1j * frame_operator)
+            # a diagonal frame operator does not require a change of basis
+            frame_diag = None
+            if not _is_traced(frame_operator):
+                frame_diag = _diagonal_or_none(frame_operator)
+
+            if frame_diag is not None:
+                self._frame_diag = Array(frame_diag)
+                self._frame_basis = Array(np.eye(len(frame_diag)))
+                self._frame_basis_adjoint = self.frame_basis
+                self._dim = len(self._frame_diag)
+                self._frame_basis_is_identity = True
+            else:
+                # diagonalize with eigh, utilizing assumption of anti-hermiticity
+                frame_diag, frame_basis = np.linalg.eigh(1j * frame_operator)
 
-            self._frame_diag = Array(-1j * frame_diag)
-            self._frame_basis = Array(frame_basis)
-            self._frame_basis_adjoint = frame_basis.conj().transpose()
-            self._dim = len(self._frame_diag)
+                self._frame_diag = Array(-1j * frame_diag)
+                self._frame_basis = Array(frame_basis)
+                self._frame_basis_adjoint = frame_basis.conj().transpose()
+                self._dim = len(self._frame_diag)
 
     @property
     def dim(self) -> int:
@@ -549,28 +572,54 @@ class Frame(BaseFrame):
         """Adjoint of the diagonalizing unitary."""
         return self._frame_basis_adjoint
 
+    def frame_phases(self, t: Union[float, Array]) -> Array:
+        r"""Return the phases :math:`e^{tD}`, where :math:`D` is the diagonal of the frame
+        operator. For a uniformly spaced 1d array of times, the phases are evaluated by
+        recurrence, as a cumulative product of the phases over one time step.
+
+        Args:
+            t: time, or a 1d array of times.
+
+        Returns:
+            Array: the phases, with the last axis indexing the diagonal of the frame operator.
+        """
+        t = t.data if isinstance(t, Array) else t
+        if self._frame_diag.backend == "numpy" and isinstance(t, np.ndarray) and t.ndim == 1:
+            return Array(_grid_phases(t.astype(float), self._frame_diag.data))
+
+        if np.ndim(t) == 1:
+            t = np.expand_dims(t, -1)
+        return np.exp(t * self._frame_diag)
+
     def state_into_frame_basis(self, y: Array) -> Array:
-        if self._frame_operator is None:
+        if self._frame_operator is None or self._frame_basis_is_identity:
             return to_array(y)
 
         return self.frame_basis_adjoint @ y
 
     def state_out_of_frame_basis(self, y: Array) -> Array:
-        if self._frame_operator is None:
+        if self._frame_operator is None or self._frame_basis_is_identity:
             return to_array(y)
 
         return self.frame_basis @ y
 
     def operator_into_frame_basis(self, op: Union[Operator, List[Operator], Array]) -> Array:
+        if isinstance(op, list) and len(op) > 0 and issparse(op[0]):
+            return [self.operator_into_frame_basis(sub_op) for sub_op in op]
+
         op = to_array(op)
-        if self._frame_operator is None:
+        if self._frame_operator is None or self._frame_basis_is_identity:
             return op
+        if issparse(op):
+            return csr_matrix(self.frame_basis_adjoint.data @ (op @ self.frame_basis.data))
         return self.frame_basis_adjoint @ op @ self.frame_basis
 
     def operator_out_of_frame_basis(self, op: Union[Operator, Array]) -> Array:
         op = to_array(op)
-        if self._frame_operator is None:
+        if self._frame_operator is None or self._frame_basis_is_identity:
             return op
+        if issparse(op):
+            return csr_matrix(self.frame_basis.data @ (op @ self.frame_basis_adjoint.data))
         return self.frame_basis @ op @ self.frame_basis_adjoint
 
     def state_into_frame(
@@ -582,9 +631,12 @@ class Frame(BaseFrame):
     ):
         """Take a state into the frame, i.e. return exp(-tF) @ y.
 
+        If ``t`` is a 1d array, ``y`` is a stack of states whose first axis indexes the times,
+        and all states are transformed in a single vectorized pass.
+
         Args:
-            t: time
-            y: state (array of appropriate size)
+            t: time, or a 1d array of times
+            y: state (array of appropriate size), or stack of states
             y_in_frame_basis: whether or not the array y is already in
                               the basis in which the frame is diagonal
             return_in_frame_basis: whether or not to return the result
@@ -596,18 +648,60 @@ class Frame(BaseFrame):
         if self._frame_operator is None:
             return to_array(y)
 
-        out = y
+        return self._scale_state(
+            self.frame_phases(t).conj(), y, y_in_frame_basis, return_in_frame_basis
+        )
+
+    def state_out_of_frame(
+        self,
+        t: float,
+        y: Array,
+        y_in_frame_basis: Optional[bool] = False,
+        return_in_frame_basis: Optional[bool] = False,
+    ):
+        """Take a state out of the frame, i.e. return exp(tF) @ y.
+
+        If ``t`` is a 1d array, ``y`` is a stack of states whose first axis indexes the times,
+        and all states are transformed in a single vectorized pass.
+
+        Args:
+            t: time, or a 1d array of times
+            y: state (array of appropriate size), or stack of states
+            y_in_frame_basis: whether or not the array y is already in
+                              the basis in which the frame is diagonal
+            return_in_frame_basis: whether or not to return the result
+                                   in the frame basis
+
+        Returns:
+            Array: state out of frame
+        """
+        if self._frame_operator is None:
+            return to_array(y)
+
+        return self._scale_state(self.frame_phases(t), y, y_in_frame_basis, return_in_frame_basis)
+
+    def _scale_state(
+        self, phases: Array, y: Array, y_in_frame_basis: bool, return_in_frame_basis: bool
+    ) -> Array:
+        """Multiply a state by the diagonal matrix with entries ``phases`` in the frame basis.
+        If ``phases`` is 2d, ``y`` is a stack of states, with the first axis of both indexing
+        the times.
+        """
+        out = to_array(y)
+        batched = phases.ndim == 2
 
         # if not in frame basis convert it
-        if not y_in_frame_basis:
-            out = self.state_into_frame_basis(out)
+        if not y_in_frame_basis and not self._frame_basis_is_identity:
+            out = _stack_matmul(self.frame_basis_adjoint, out, batched)
 
-        # go into the frame
-        out = np.diag(np.exp(-t * self.frame_diag)) @ out
+        # apply the diagonal frame transformation along the state axis
+        if out.ndim == phases.ndim + 1:
+            phases = np.expand_dims(phases, -1)
+        out = phases * out
 
         # if output is requested to not be in the frame basis, convert it
-        if not return_in_frame_basis:
-            out = self.state_out_of_frame_basis(out)
+        if not return_in_frame_basis and not self._frame_basis_is_identity:
+            out = _stack_matmul(self.frame_basis, out, batched)
 
         return out
 
@@ -624,12 +718,23 @@ class Frame(BaseFrame):
 
         Note: B is added in the frame basis before any potential final change
         out of the frame basis.
+
+        If ``t`` is a 1d array, ``operator`` is either a single operator or a 3d array of
+        operators with one for each time, and a 3d array with the result for each time is
+        returned.
+
+        If ``operator`` is a ``scipy.sparse`` matrix, the result is a CSR matrix. In this case
+        ``t`` must be a single time.
+
+        The frame transformation is applied as a rank-1 scaling of the entries of the operator
+        in the frame basis, and if ``op_to_add_in_fb`` is 1d, it is added directly to the
+        diagonal.
         """
         if self._frame_operator is None:
             if op_to_add_in_fb is None:
                 return to_array(operator)
             else:
-                return to_array(operator + op_to_add_in_fb)
+                return _add_in_frame_basis(to_array(operator), op_to_add_in_fb, in_place=False)
 
         out = to_array(operator)
 
@@ -637,15 +742,18 @@ class Frame(BaseFrame):
         if not operator_in_frame_basis:
             out = self.operator_into_frame_basis(out)
 
-        # get frame transformation matrix in diagonal basis
+        # get frame transformation diagonal, and apply it as scalings of the rows and columns
         # assumption that F is anti-Hermitian implies conjugation of
         # diagonal gives inversion
-        exp_freq = np.exp(t * self.frame_diag)
-        frame_mat = np.outer(exp_freq.conj(), exp_freq)
-        out = frame_mat * out
+        exp_freq = self.frame_phases(t)
+        if issparse(out):
+            exp_freq = Array(exp_freq).data
+            out = (sparse_diags(exp_freq.conj()) @ out @ sparse_diags(exp_freq)).tocsr()
+        else:
+            out = np.expand_dims(exp_freq.conj(), -1) * out * np.expand_dims(exp_freq, -2)
 
         if op_to_add_in_fb is not None:
-            out = out + op_to_add_in_fb
+            out = _add_in_frame_basis(out, op_to_add_in_fb, in_place=True)
 
         # if output is requested to not be in the frame basis, convert it
         if not return_in_frame_basis:
@@ -665,13 +773,15 @@ class Frame(BaseFrame):
         if cutoff_freq is None:
             return ops_in_frame_basis, ops_in_frame_basis
 
+        sparse = isinstance(ops_in_frame_basis, list)
+
         # if no carrier frequencies set, set to 0
         if carrier_freqs is None:
             carrier_freqs = np.zeros(len(operators))
         carrier_freqs = Array(carrier_freqs)
 
         # create difference matrix for diagonal elements
-        dim = len(ops_in_frame_basis[0])
+        dim = ops_in_frame_basis[0].shape[0]
         freq_diffs = None
         if self._frame_operator is None:
             freq_diffs = Array(np.zeros((1, dim, dim)))
@@ -683,12 +793,106 @@ class Frame(BaseFrame):
         im_angular_freqs = 1j * 2 * np.pi * np.reshape(carrier_freqs, (len(carrier_freqs), 1, 1))
         freq_array = im_angular_freqs + freq_diffs
         cutoff_array = ((np.abs(freq_array.imag) / (2 * np.pi)) < cutoff_freq).astype(int)
+
+        # apply the cutoffs entrywise to each sparse operator
+        if sparse:
+            cutoff_array = Array(cutoff_array).data
+            return (
+                [
+                    op.multiply(cutoff).tocsr()
+                    for op, cutoff in zip(ops_in_frame_basis, cutoff_array)
+                ],
+                [
+                    op.multiply(cutoff.transpose()).tocsr()
+                    for op, cutoff in zip(ops_in_frame_basis, cutoff_array)
+                ],
+            )
+
         return (
             cutoff_array * ops_in_frame_basis,
             cutoff_array.transpose([0, 2, 1]) * ops_in_frame_basis,
         )
 
 
+def _grid_phases(t: np.ndarray, frame_diag: np.ndarray, resync_interval: int = 32) -> np.ndarray:
+    """Evaluate the phases at a 1d array of times, using a recurrence if the times are uniformly
+    spaced. To control the accumulation of rounding errors, the phases are recomputed exactly
+    every ``resync_interval`` times.
+    """
+    num_times = len(t)
+    if num_times < 3:
+        return np.exp(np.multiply.outer(t, frame_diag))
+
+    h = t[1] - t[0]
+    tol = 4 * np.finfo(float).eps * np.max(np.abs(t))
+    if np.any(np.abs(np.diff(t) - h) > tol):
+        return np.exp(np.multiply.outer(t, frame_diag))
+
+    # exact phases at the start of each block, multiplied by powers of the step factor
+    block_len = min(resync_interval, num_times)
+    block_starts = np.exp(np.multiply.outer(t[::block_len], frame_diag))
+    powers = np.ones((block_len, len(frame_diag)), dtype=complex)
+    powers[1:] = np.exp(h * frame_diag)
+    powers = np.cumprod(powers, axis=0)
+
+    phases = np.expand_dims(block_starts, 1) * powers
+    return phases.reshape(-1, len(frame_diag))[:num_times]
+
+
+def _add_in_frame_basis(
+    out: Union[Array, csr_matrix], op: Union[Array, csr_matrix], in_place: bool
+) -> Union[Array, csr_matrix]:
+    """Add ``op`` to ``out``, where a 1d ``op`` is interpreted as the diagonal of a diagonal
+    matrix. If ``in_place``, a numpy ``out`` may be modified in place.
+    """
+    if not issparse(op) and Array(op).ndim == 1:
+        if issparse(out):
+            return out + sparse_diags(Array(op).data, format="csr")
+
+        if in_place and out.backend == "numpy":
+            out_data = out.data
+            idx = np.arange(len(op))
+            out_data[..., idx, idx] += Array(op).data
+            return Array(out_data)
+
+        return out + np.diag(op)
+
+    if issparse(out) and not issparse(op):
+        op = csr_matrix(Array(op).data)
+    return out + op
+
+
+def _stack_matmul(mat: Array, y: Array, batched: bool) -> Array:
+    """Left multiply a state, or each state in a stack of states if ``batched``, by ``mat``."""
+    if batched and y.ndim == 2:
+        return y @ mat.transpose()
+
+    return mat @ y
+
+
+def _diagonal_or_none(mat: Union[Array, csr_matrix]) -> Optional[Array]:
+    """Return the diagonal of a matrix if it is diagonal, and otherwise ``None``."""
+    if issparse(mat):
+        diag = mat.diagonal()
+        return Array(diag) if mat.count_nonzero() == np.count_nonzero(diag) else None
+
+    mat = Array(mat)
+    diag = np.diag(mat)
+    return diag if np.count_nonzero(mat - np.diag(diag)) == 0 else None
+
+
+def _is_traced(mat: Array) -> bool:
+    """Whether ``mat`` is being traced by ``jax``, in which case its values are unknown."""
+    mat = Array(mat)
+    if mat.backend != "jax":
+        return False
+
+    # pylint: disable=import-outside-toplevel
+    from jax.core import Tracer
+
+    return isinstance(mat.data, Tracer)
+
+
 def _is_herm_or_anti_herm(mat: Array, atol: Optional[float] = 1e-10, rtol: Optional[float] = 1e-10):
     r"""Given `mat`, the logic of this function is:
         - if `mat` is hermitian, return `-1j * mat`
@@ -19,12 +19,13 @@ from abc import ABC, abstractmethod
 from typing import Callable, Union, List, Optional
 from copy import deepcopy
 import numpy as np
+from scipy.sparse import issparse, csr_matrix
 
 from qiskit import QiskitError
 from qiskit.quantum_info.operators import Operator
 from qiskit_ode import dispatch
 from qiskit_ode.dispatch import Array
-from qiskit_ode.type_utils import to_array
+from qiskit_ode.type_utils import to_array, to_csr
 from qiskit_ode.signals import VectorSignal, BaseSignal
 from .frame import BaseFrame, Frame
 
@@ -97,7 +98,10 @@ class BaseGeneratorModel(ABC):
         Returns:
             Array: the product
         """
-        return np.dot(self.evaluate(time, in_frame_basis), y)
+        gen = self.evaluate(time, in_frame_basis)
+        if issparse(gen):
+            return Array(gen @ to_array(y).data)
+        return np.dot(gen, y)
 
     def rmult(self, time: float, y: Array, in_frame_basis: bool = False) -> Array:
         r"""Return the product y @ evaluate(t). Default implementation is to
@@ -111,7 +115,10 @@ class BaseGeneratorModel(ABC):
         Returns:
             Array: the product
         """
-        return np.dot(y, self.evaluate(time, in_frame_basis))
+        gen = self.evaluate(time, in_frame_basis)
+        if issparse(gen):
+            return Array(to_array(y).data @ gen)
+        return np.dot(y, gen)
 
     @property
     @abstractmethod
@@ -224,6 +231,14 @@ class GeneratorModel(BaseGeneratorModel):
     For specifying a frame, this object works with the concrete
     :class:`Frame`, a subclass of :class:`BaseFrame`.
 
+    The operators can be stored and evaluated in one of two ``evaluation_mode``\s:
+    ``'dense'``, in which the operators are stored as a 3d :class:`Array`, or ``'sparse'``,
+    in which they are stored as a list of ``scipy.sparse`` CSR matrices, and the model is
+    evaluated as a CSR matrix. The sparse mode is suited to large operators with few
+    non-zero entries, and is selected by default if the operators are given as
+    ``scipy.sparse`` matrices. Note that transforming the operators into the frame basis
+    does not preserve sparsity unless the frame operator is diagonal.
+
     To do:
         insert mathematical description of frame/cutoff_freq handling
     """
@@ -234,11 +249,13 @@ class GeneratorModel(BaseGeneratorModel):
         signals: Optional[Union[VectorSignal, List[BaseSignal]]] = None,
         frame: Optional[Union[Operator, Array, BaseFrame]] = None,
         cutoff_freq: Optional[float] = None,
+        evaluation_mode: Optional[str] = None,
     ):
         """Initialize.
 
         Args:
-            operators: A rank-3 Array of operator components.
+            operators: A rank-3 Array of operator components, or a list of
+                       ``scipy.sparse`` matrices.
             signals: Specifiable as either a VectorSignal, a list of
                      Signal objects, or as the inputs to signal_mapping.
                      GeneratorModel can be instantiated without specifying
@@ -247,8 +264,17 @@ class GeneratorModel(BaseGeneratorModel):
                             array, it is interpreted as the diagonal of a
                             diagonal matrix.
             cutoff_freq: Frequency cutoff when evaluating the model.
+            evaluation_mode: Either ``'dense'`` or ``'sparse'``. If ``None``, defaults to
+                             ``'sparse'`` if the operators are ``scipy.sparse`` matrices, and
+                             ``'dense'`` otherwise.
         """
-        self.operators = to_array(operators)
+        if evaluation_mode is None:
+            evaluation_mode = "sparse" if _is_sparse(operators) else "dense"
+
+        self.operators = operators
+        self._evaluation_mode = None
+        self._sparse = None
+        self.evaluation_mode = evaluation_mode
 
         self._cutoff_freq = cutoff_freq
 
@@ -330,16 +356,46 @@ class GeneratorModel(BaseGeneratorModel):
             self._cutoff_freq = cutoff_freq
             self._reset_internal_ops()
 
+    @property
+    def evaluation_mode(self) -> str:
+        """Return the evaluation mode."""
+        return self._evaluation_mode
+
+    @evaluation_mode.setter
+    def evaluation_mode(self, evaluation_mode: str):
+        """Set the evaluation mode, converting the stored operators.
+
+        Raises:
+            QiskitError: If the evaluation mode is not recognized.
+        """
+        if evaluation_mode not in ["dense", "sparse"]:
+            raise QiskitError("""evaluation_mode must be either 'dense' or 'sparse'.""")
+
+        self._set_operator_format(sparse=evaluation_mode == "sparse")
+        self._evaluation_mode = evaluation_mode
+
+    def _set_operator_format(self, sparse: bool):
+        """Convert the stored operators to a list of CSR matrices if ``sparse``, and
+        to a dense Array otherwise.
+        """
+        self.operators = to_csr(self.operators) if sparse else to_array(self.operators)
+
+        if sparse != self._sparse:
+            self._sparse = sparse
+            self._reset_internal_ops()
+
     def evaluate(self, time: float, in_frame_basis: bool = False) -> Array:
         """Evaluate the model in array format.
 
         Args:
-            time: Time to evaluate the model
+            time: Time to evaluate the model, or a 1d array of times
             in_frame_basis: Whether to evaluate in the basis in which the frame
                             operator is diagonal
 
         Returns:
-            Array: the evaluated model
+            Array: the evaluated model, or a 3d array of the model evaluated
+                   at each time if ``time`` is an array. In sparse evaluation mode,
+                   a CSR matrix.
 
         Raises:
             QiskitError: If model cannot be evaluated.
@@ -357,6 +413,66 @@ class GeneratorModel(BaseGeneratorModel):
             time, op_combo, operator_in_frame_basis=True, return_in_frame_basis=in_frame_basis
         )
 
+    def lmult(self, time: float, y: Array, in_frame_basis: bool = False) -> Array:
+        r"""Return the product evaluate(t) @ y.
+
+        In the frame basis, the model is :math:`G'(t) = D(t)^\dagger \tilde{G}(t) D(t) - F`,
+        where :math:`\tilde{G}(t)` is the linear combination of the operators with cutoffs,
+        :math:`D(t) = e^{tF}` is diagonal, and :math:`F` is the diagonalized frame operator.
+        The product is computed by applying :math:`D(t)` as a diagonal scaling of ``y``,
+        contracting the operator-state products with the signal values, and scaling the result
+        by :math:`D(t)^\dagger`, so that :math:`G'(t)` is never formed.
+
+        Args:
+            time: Time at which to create the generator.
+            y: operator or vector to apply the model to.
+            in_frame_basis: whether to evaluate in the frame basis
+
+        Returns:
+            Array: the product
+
+        Raises:
+            QiskitError: If model cannot be evaluated.
+        """
+        return self._lmult_in_frame(time, y, frame_shift=-1.0, in_frame_basis=in_frame_basis)
+
+    def _lmult_in_frame(
+        self, time: float, y: Array, frame_shift: complex, in_frame_basis: bool = False
+    ) -> Array:
+        """Compute the product of the model in the frame with ``y``, where the frame part of
+        the model is ``frame_shift`` times the diagonalized frame operator.
+        """
+        if self._signals is None:
+            raise QiskitError("""GeneratorModel cannot be evaluated without signals.""")
+
+        # arrays of times are handled by the default evaluation
+        if np.ndim(time) > 0:
+            return super().lmult(time, y, in_frame_basis=in_frame_basis)
+
+        sig_vals = self._signals.value(time)
+        y = to_array(y)
+
+        if self.frame.frame_operator is None:
+            return self._lmult_in_frame_basis_with_cutoffs(sig_vals, y)
+
+        if not in_frame_basis:
+            y = self.frame.state_into_frame_basis(y)
+
+        # the phases and frame operator act as diagonal scalings along the first axis of y
+        frame_diag = self.frame.frame_diag
+        exp_freq = self.frame.frame_phases(time)
+        if y.ndim == 2:
+            frame_diag = np.expand_dims(frame_diag, -1)
+            exp_freq = np.expand_dims(exp_freq, -1)
+
+        out = exp_freq.conj() * self._lmult_in_frame_basis_with_cutoffs(sig_vals, exp_freq * y)
+        out = out + frame_shift * frame_diag * y
+
+        if not in_frame_basis:
+            out = self.frame.state_out_of_frame_basis(out)
+
+        return out
+
     @property
     def drift(self) -> Array:
         """Return the part of the model with only Constant coefficients as a
@@ -438,9 +554,78 @@ class GeneratorModel(BaseGeneratorModel):
 
         Returns:
             Array: operator model evaluated for a given list of signal values
+
+        Raises:
+            QiskitError: If evaluating at multiple times in sparse evaluation mode.
         """
 
+        if self._sparse:
+            sig_vals = Array(sig_vals).data
+            if sig_vals.ndim > 1:
+                raise QiskitError("Sparse evaluation mode does not support arrays of times.")
+
+            op_combo = csr_matrix(self._ops_in_fb_w_cutoff[0].shape, dtype=complex)
+            for sig_val, op, conj_op in zip(
+                sig_vals, self._ops_in_fb_w_cutoff, self._ops_in_fb_w_conj_cutoff
+            ):
+                op_combo = op_combo + (0.5 * sig_val) * op + (0.5 * sig_val.conj()) * conj_op
+
+            return op_combo
+
         return 0.5 * (
             np.tensordot(sig_vals, self._ops_in_fb_w_cutoff, axes=1)
             + np.tensordot(sig_vals.conj(), self._ops_in_fb_w_conj_cutoff, axes=1)
         )
+
+    def _lmult_in_frame_basis_with_cutoffs(self, sig_vals: Array, y: Array) -> Array:
+        """Compute the product of the operator returned by
+        ``_evaluate_in_frame_basis_with_cutoffs`` with ``y``. For vectors, or for matrices with
+        few columns relative to the dimension, this is done by contracting the signal values
+        with the operator-state products. Otherwise the operator is evaluated and then
+        multiplied, as this is cheaper.
+
+        Args:
+            sig_vals: Signals evaluated at some time.
+            y: Array to multiply.
+
+        Returns:
+            Array: the product
+        """
+
+        num_cols = 1 if y.ndim == 1 else y.shape[-1]
+        if num_cols > 1 and len(self.operators) * num_cols >= y.shape[0]:
+            op_combo = self._evaluate_in_frame_basis_with_cutoffs(sig_vals)
+            if issparse(op_combo):
+                return Array(op_combo @ Array(y).data)
+            return np.dot(op_combo, y)
+
+        if self._sparse:
+            sig_vals = Array(sig_vals).data
+            y = Array(y).data
+            out = np.zeros(y.shape, dtype=complex)
+            if self.cutoff_freq is None:
+                for sig_val, op in zip(sig_vals.real, self._ops_in_fb_w_cutoff):
+                    out += sig_val * (op @ y)
+            else:
+                for sig_val, op, conj_op in zip(
+                    sig_vals, self._ops_in_fb_w_cutoff, self._ops_in_fb_w_conj_cutoff
+                ):
+                    out += (0.5 * sig_val) * (op @ y) + (0.5 * sig_val.conj()) * (conj_op @ y)
+
+            return Array(out)
+
+        # without a cutoff the two sets of operators are the same
+        if self.cutoff_freq is None:
+            return np.tensordot(sig_vals.real, np.dot(self._ops_in_fb_w_cutoff, y), axes=1)
+
+        return 0.5 * (
+            np.tensordot(sig_vals, np.dot(self._ops_in_fb_w_cutoff, y), axes=1)
+            + np.tensordot(sig_vals.conj(), np.dot(self._ops_in_fb_w_conj_cutoff, y), axes=1)
+        )
+
+
+def _is_sparse(operators: Union[Array, List]) -> bool:
+    """Whether operators are given as ``scipy.sparse`` matrices."""
+    if isinstance(operators, list):
+        return len(operators) > 0 and issparse(operators[0])
+    return issparse(operators)
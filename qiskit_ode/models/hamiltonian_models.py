@@ -17,6 +17,8 @@ Hamiltonian models module.
 
 from typing import Union, List, Optional
 import numpy as np
+from scipy.sparse import issparse
+from scipy.sparse.linalg import norm as sparse_norm
 
 from qiskit.quantum_info.operators import Operator
 from qiskit_ode.dispatch import Array
@@ -59,11 +61,12 @@ class HamiltonianModel(GeneratorModel):
         frame: Optional[Union[Operator, Array]] = None,
         cutoff_freq: Optional[float] = None,
         validate: bool = True,
+        evaluation_mode: Optional[str] = None,
     ):
         """Initialize, ensuring that the operators are Hermitian.
 
         Args:
-            operators: list of Operator objects.
+            operators: list of Operator objects, or of ``scipy.sparse`` matrices.
             signals: Specifiable as either a VectorSignal, a list of
                      Signal objects, or as the inputs to signal_mapping.
                      OperatorModel can be instantiated without specifying
@@ -73,19 +76,32 @@ class HamiltonianModel(GeneratorModel):
                             diagonal matrix.
             cutoff_freq: Frequency cutoff when evaluating the model.
             validate: If True check input operators are Hermitian.
+            evaluation_mode: Either ``'dense'`` or ``'sparse'``, see :class:`GeneratorModel`.
 
         Raises:
             Exception: if operators are not Hermitian
         """
         # verify operators are Hermitian, and if so instantiate
-        operators = to_array(operators)
-
-        if validate:
-            adj = np.transpose(np.conjugate(operators), (0, 2, 1))
-            if np.linalg.norm(adj - operators) > 1e-10:
-                raise Exception("""HamiltonianModel only accepts Hermitian operators.""")
-
-        super().__init__(operators=operators, signals=signals, frame=frame, cutoff_freq=cutoff_freq)
+        if isinstance(operators, list) and len(operators) > 0 and issparse(operators[0]):
+            if validate:
+                herm_err = np.sqrt(sum(sparse_norm(op.conj().T - op) ** 2 for op in operators))
+                if herm_err > 1e-10:
+                    raise Exception("""HamiltonianModel only accepts Hermitian operators.""")
+        else:
+            operators = to_array(operators)
+
+            if validate:
+                adj = np.transpose(np.conjugate(operators), (0, 2, 1))
+                if np.linalg.norm(adj - operators) > 1e-10:
+                    raise Exception("""HamiltonianModel only accepts Hermitian operators.""")
+
+        super().__init__(
+            operators=operators,
+            signals=signals,
+            frame=frame,
+            cutoff_freq=cutoff_freq,
+            evaluation_mode=evaluation_mode,
+        )
 
     def evaluate(self, time: float, in_frame_basis: bool = False) -> Array:
         """Evaluate the Hamiltonian at a given time.
@@ -96,12 +112,14 @@ class HamiltonianModel(GeneratorModel):
         See the class doc string for details.
 
         Args:
-            time: Time to evaluate the model
+            time: Time to evaluate the model, or a 1d array of times
             in_frame_basis: Whether to evaluate in the basis in which the frame
                             operator is diagonal
 
         Returns:
-            Array: the evaluated model
+            Array: the evaluated model, or a 3d array of the model evaluated
+                   at each time if ``time`` is an array. In sparse evaluation mode,
+                   a CSR matrix.
 
         Raises:
             Exception: if signals are not present
@@ -119,7 +137,7 @@ class HamiltonianModel(GeneratorModel):
 
         op_to_add_in_fb = None
         if self.frame.frame_operator is not None:
-            op_to_add_in_fb = -1j * np.diag(self.frame.frame_diag)
+            op_to_add_in_fb = -1j * self.frame.frame_diag
 
         return self.frame._conjugate_and_add(
             time,
@@ -129,6 +147,20 @@ class HamiltonianModel(GeneratorModel):
             return_in_frame_basis=in_frame_basis,
         )
 
+    def lmult(self, time: float, y: Array, in_frame_basis: bool = False) -> Array:
+        """Return the product evaluate(t) @ y, without forming the Hamiltonian in the frame.
+        See :meth:`GeneratorModel.lmult` for details.
+
+        Args:
+            time: Time at which to create the Hamiltonian.
+            y: operator or vector to apply the model to.
+            in_frame_basis: whether to evaluate in the frame basis
+
+        Returns:
+            Array: the product
+        """
+        return self._lmult_in_frame(time, y, frame_shift=-1j, in_frame_basis=in_frame_basis)
+
     def __call__(self, t: float, y: Optional[Array] = None, in_frame_basis: Optional[bool] = False):
         """Evaluate generator RHS functions. Needs to be overriden from base class
         to include :math:`-i`. I.e. if ``y is None``, returns :math:`-iH(t)`,
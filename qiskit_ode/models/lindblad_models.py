@@ -18,10 +18,15 @@ Lindblad models module.
 from typing import Union, List, Optional
 import numpy as np
 
+from scipy.sparse import csr_matrix
+
+from qiskit import QiskitError
 from qiskit.quantum_info.operators import Operator
+from qiskit_ode.dispatch import Array
 from qiskit_ode.signals import VectorSignal, BaseSignal
-from qiskit_ode.type_utils import vec_commutator, vec_dissipator, to_array
-from .generator_models import GeneratorModel
+from qiskit_ode.type_utils import vec_commutator, vec_dissipator, to_array, to_csr
+from .generator_models import GeneratorModel, _is_sparse
+from .frame import Frame
 from .hamiltonian_models import HamiltonianModel
 
 
@@ -48,6 +53,23 @@ class LindbladModel(GeneratorModel):
           operator, and
         - :math:`\gamma_j(t)` denotes the signal corresponding to the
           :math:`j^{th}` Lindblad operator.
+
+    The model is represented as a :class:`GeneratorModel` acting on density matrices
+    vectorized in column stacking convention, and is evaluated according to the
+    ``evaluation_mode``:
+
+        - ``'dense_vectorized'``: The vectorized operators are stored as a 3d :class:`Array`.
+        - ``'sparse_vectorized'``: The vectorized operators are assembled directly in
+          ``scipy.sparse`` CSR format, without forming the dense operators.
+        - ``'dense'``: The vectorized generator is never formed. Instead, :meth:`lmult`
+          reshapes the vectorized density matrix :math:`\rho` into a matrix, and applies the
+          right hand side of the master equation to it via matrix products, at a cost of
+          :math:`O(d^3)` rather than :math:`O(d^4)` for dimension :math:`d`. The products
+          :math:`L_j^\dagger L_j` are precomputed.
+        - ``'sparse'``: As ``'dense'``, with the operators stored as CSR matrices.
+
+    In the matrix modes ``'dense'`` and ``'sparse'``, the model cannot be evaluated as a
+    matrix, and frames and cutoff frequencies are not supported.
     """
 
     def __init__(
@@ -56,6 +78,7 @@ class LindbladModel(GeneratorModel):
         hamiltonian_signals: Union[List[BaseSignal], VectorSignal],
         noise_operators: Optional[List[Operator]] = None,
         noise_signals: Optional[Union[List[BaseSignal], VectorSignal]] = None,
+        evaluation_mode: Optional[str] = None,
     ):
         """Initialize.
 
@@ -64,20 +87,25 @@ class LindbladModel(GeneratorModel):
             hamiltonian_signals: list of signals in the Hamiltonian
             noise_operators: list of noise operators
             noise_signals: list of noise signals
+            evaluation_mode: One of ``'dense_vectorized'``, ``'sparse_vectorized'``,
+                             ``'dense'``, or ``'sparse'``. If ``None``, defaults to
+                             ``'sparse_vectorized'`` if the Hamiltonian operators are
+                             ``scipy.sparse`` matrices, and ``'dense_vectorized'`` otherwise.
 
         Raises:
             Exception: if signals incorrectly specified
         """
+        if evaluation_mode is None:
+            if _is_sparse(hamiltonian_operators):
+                evaluation_mode = "sparse_vectorized"
+            else:
+                evaluation_mode = "dense_vectorized"
 
-        # combine operators
-        vec_ham_ops = -1j * vec_commutator(to_array(hamiltonian_operators))
-
-        full_operators = None
-        if noise_operators is not None:
-            vec_diss_ops = vec_dissipator(to_array(noise_operators))
-            full_operators = np.append(vec_ham_ops, vec_diss_ops, axis=0)
-        else:
-            full_operators = vec_ham_ops
+        # operators are converted into the representation of the evaluation mode when it is set
+        self._hamiltonian_operators = hamiltonian_operators
+        self._noise_operators = noise_operators
+        self._noise_operators_adj = None
+        self._noise_LdagL = None
 
         # combine signals
         if isinstance(hamiltonian_signals, list):
@@ -93,11 +121,14 @@ class LindbladModel(GeneratorModel):
             full_signals = hamiltonian_signals
         else:
             if noise_signals is None:
-                sig_val = np.ones(len(noise_operators), dtype=complex)
-                carrier_freqs = np.zeros(len(noise_operators), dtype=float)
-                phases = np.zeros(len(noise_operators), dtype=float)
+                num_noise = len(noise_operators)
+                carrier_freqs = np.zeros(num_noise, dtype=float)
+                phases = np.zeros(num_noise, dtype=float)
                 noise_signals = VectorSignal(
-                    envelope=lambda t: sig_val, carrier_freqs=carrier_freqs, phases=phases
+                    envelope=lambda t: np.ones(np.shape(t) + (num_noise,), dtype=complex),
+                    carrier_freqs=carrier_freqs,
+                    phases=phases,
+                    vectorized=True,
                 )
             elif isinstance(noise_signals, list):
                 noise_signals = VectorSignal.from_signal_list(noise_signals)
@@ -108,7 +139,9 @@ class LindbladModel(GeneratorModel):
                 )
 
             def full_envelope(t):
-                return np.append(hamiltonian_signals.envelope(t), noise_signals.envelope(t))
+                return np.append(
+                    hamiltonian_signals.envelope_value(t), noise_signals.envelope_value(t), axis=-1
+                )
 
             full_carrier_freqs = np.append(
                 hamiltonian_signals.carrier_freqs, noise_signals.carrier_freqs
@@ -123,9 +156,210 @@ class LindbladModel(GeneratorModel):
                 carrier_freqs=full_carrier_freqs,
                 phases=full_carrier_phases,
                 drift_array=full_drift_array,
+                vectorized=True,
+            )
+
+        super().__init__(operators=None, signals=full_signals, evaluation_mode=evaluation_mode)
+
+    @property
+    def evaluation_mode(self) -> str:
+        """Return the evaluation mode."""
+        return self._evaluation_mode
+
+    @evaluation_mode.setter
+    def evaluation_mode(self, evaluation_mode: str):
+        """Set the evaluation mode, converting the stored operators.
+
+        Raises:
+            QiskitError: If the evaluation mode is not recognized.
+        """
+        if evaluation_mode not in ["dense_vectorized", "sparse_vectorized", "dense", "sparse"]:
+            raise QiskitError(
+                """evaluation_mode must be one of 'dense_vectorized', 'sparse_vectorized',
+                'dense', or 'sparse'."""
+            )
+
+        matrix_mode = evaluation_mode in ["dense", "sparse"]
+        frame = getattr(self, "_frame", None)
+        if matrix_mode and frame is not None and frame.frame_operator is not None:
+            raise QiskitError("Frames are not supported in matrix evaluation modes.")
+
+        sparse = evaluation_mode in ["sparse", "sparse_vectorized"]
+        convert = to_csr if sparse else to_array
+        ham_ops = convert(self._hamiltonian_operators)
+        noise_ops = convert(self._noise_operators)
+        self._hamiltonian_operators = ham_ops
+        self._noise_operators = noise_ops
+
+        if not matrix_mode:
+            # vectorized operators of the master equation
+            if sparse:
+                self.operators = [-1j * op for op in vec_commutator(ham_ops)]
+                if noise_ops is not None:
+                    self.operators = self.operators + vec_dissipator(noise_ops)
+            else:
+                self.operators = -1j * vec_commutator(ham_ops)
+                if noise_ops is not None:
+                    self.operators = np.append(self.operators, vec_dissipator(noise_ops), axis=0)
+        else:
+            # operators are only stored to be paired with the signals
+            self.operators = ham_ops
+            if noise_ops is not None:
+                if sparse:
+                    self.operators = ham_ops + noise_ops
+                    self._noise_operators_adj = [op.conj().transpose().tocsr() for op in noise_ops]
+                    self._noise_LdagL = [
+                        (op_adj @ op).tocsr()
+                        for op, op_adj in zip(noise_ops, self._noise_operators_adj)
+                    ]
+                else:
+                    self.operators = np.append(ham_ops, noise_ops, axis=0)
+                    self._noise_operators_adj = np.transpose(noise_ops.conj(), (0, 2, 1))
+                    self._noise_LdagL = self._noise_operators_adj @ noise_ops
+
+        self._sparse = sparse
+        self._evaluation_mode = evaluation_mode
+        self._reset_internal_ops()
+
+    @property
+    def frame(self) -> Frame:
+        """Return the frame."""
+        return self._frame
+
+    @frame.setter
+    def frame(self, frame: Union[Operator, Array, Frame]):
+        """Set the frame; either an already instantiated :class:`Frame` object
+        a valid argument for the constructor of :class:`Frame`, or `None`.
+
+        Raises:
+            QiskitError: If a frame is set in a matrix evaluation mode.
+        """
+        frame = Frame(frame)
+        if self.evaluation_mode in ["dense", "sparse"] and frame.frame_operator is not None:
+            raise QiskitError("Frames are not supported in matrix evaluation modes.")
+
+        GeneratorModel.frame.fset(self, frame)
+
+    @property
+    def drift(self) -> Array:
+        """Return the part of the model with only Constant coefficients as a
+        numpy array. In the matrix evaluation modes, returns ``None``.
+        """
+        if self.evaluation_mode in ["dense", "sparse"]:
+            return None
+
+        return super().drift
+
+    def evaluate(self, time: float, in_frame_basis: bool = False) -> Array:
+        """Evaluate the vectorized generator of the model.
+
+        Args:
+            time: Time to evaluate the model, or a 1d array of times
+            in_frame_basis: Whether to evaluate in the basis in which the frame
+                            operator is diagonal
+
+        Returns:
+            Array: the evaluated model
+
+        Raises:
+            QiskitError: If the model is in a matrix evaluation mode.
+        """
+        if self.evaluation_mode in ["dense", "sparse"]:
+            raise QiskitError(
+                """LindbladModel cannot be evaluated in a matrix evaluation mode, use lmult
+                instead."""
             )
 
-        super().__init__(operators=full_operators, signals=full_signals)
+        return super().evaluate(time, in_frame_basis=in_frame_basis)
+
+    def lmult(self, time: float, y: Array, in_frame_basis: bool = False) -> Array:
+        """Return the right hand side of the master equation for the vectorized density
+        matrix ``y``, i.e. the product of the vectorized generator with ``y``.
+
+        Args:
+            time: Time at which to create the generator.
+            y: Density matrix vectorized in column stacking convention, or a 2d array
+               whose columns are vectorized density matrices.
+            in_frame_basis: whether to evaluate in the frame basis
+
+        Returns:
+            Array: the product
+        """
+        if self.evaluation_mode not in ["dense", "sparse"]:
+            return super().lmult(time, y, in_frame_basis=in_frame_basis)
+
+        return self._evaluate_rhs_matrix(time, y)
+
+    def rmult(self, time: float, y: Array, in_frame_basis: bool = False) -> Array:
+        """Return the product y @ evaluate(t).
+
+        Args:
+            time: Time at which to create the generator.
+            y: operator or vector to apply the model to.
+            in_frame_basis: whether to evaluate in the frame basis
+
+        Returns:
+            Array: the product
+
+        Raises:
+            QiskitError: If the model is in a matrix evaluation mode.
+        """
+        if self.evaluation_mode in ["dense", "sparse"]:
+            raise QiskitError("rmult is not supported in matrix evaluation modes.")
+
+        return super().rmult(time, y, in_frame_basis=in_frame_basis)
+
+    def _evaluate_rhs_matrix(self, time: float, y: Array) -> Array:
+        r"""Evaluate the right hand side of the master equation with matrix products.
+
+        Args:
+            time: Time.
+            y: Density matrix vectorized in column stacking convention, or a 2d array whose
+               columns are vectorized density matrices, which are evaluated as a single
+               stack of matrices.
+
+        Returns:
+            Array: The right hand side, vectorized in column stacking convention.
+
+        Raises:
+            QiskitError: If a cutoff frequency is set.
+        """
+        if self.cutoff_freq is not None:
+            raise QiskitError("Cutoff frequencies are not supported in matrix evaluation modes.")
+
+        y = Array(y)
+        dim = self._hamiltonian_operators[0].shape[-1]
+        num_cols = 1 if y.ndim == 1 else y.shape[-1]
+        rho = y.reshape((dim, dim, num_cols), order="F").transpose((2, 0, 1))
+
+        coeffs = np.real(Array(self.signals.value(time)))
+        num_ham = len(self._hamiltonian_operators)
+        ham_coeffs, noise_coeffs = coeffs[:num_ham], coeffs[num_ham:]
+
+        if self._sparse:
+            rho = rho.data
+            ham = _sparse_linear_combination(ham_coeffs, self._hamiltonian_operators)
+            out = -1j * (_sparse_lmult(ham, rho) - _sparse_rmult(rho, ham))
+            if self._noise_operators is not None:
+                LdagL = _sparse_linear_combination(noise_coeffs, self._noise_LdagL)
+                out = out - 0.5 * (_sparse_lmult(LdagL, rho) + _sparse_rmult(rho, LdagL))
+                for coeff, op, op_adj in zip(
+                    noise_coeffs, self._noise_operators, self._noise_operators_adj
+                ):
+                    out = out + coeff * _sparse_lmult(op, _sparse_rmult(rho, op_adj))
+        else:
+            ham = np.tensordot(ham_coeffs, self._hamiltonian_operators, axes=1)
+            out = -1j * (ham @ rho - rho @ ham)
+            if self._noise_operators is not None:
+                LdagL = np.tensordot(noise_coeffs, self._noise_LdagL, axes=1)
+                out = out - 0.5 * (LdagL @ rho + rho @ LdagL)
+                # the axis of length len(noise_operators) is inserted before the matrix axes
+                noise_terms = (
+                    self._noise_operators @ np.expand_dims(rho, -3) @ self._noise_operators_adj
+                )
+                out = out + np.tensordot(noise_coeffs, noise_terms, axes=(0, -3))
+
+        return Array(out).transpose((1, 2, 0)).reshape(y.shape, order="F")
 
     @classmethod
     def from_hamiltonian(
@@ -133,6 +367,7 @@ class LindbladModel(GeneratorModel):
         hamiltonian: HamiltonianModel,
         noise_operators: Optional[List[Operator]] = None,
         noise_signals: Optional[Union[List[BaseSignal], VectorSignal]] = None,
+        evaluation_mode: Optional[str] = None,
     ):
         """Construct from a :class:`HamiltonianModel`.
 
@@ -140,6 +375,7 @@ class LindbladModel(GeneratorModel):
             hamiltonian: the :class:`HamiltonianModel`.
             noise_operators: list of noise operators.
             noise_signals: list of noise signals.
+            evaluation_mode: Evaluation mode of the model.
 
         Returns:
             LindbladModel: Linblad model from parameters.
@@ -150,4 +386,26 @@ class LindbladModel(GeneratorModel):
             hamiltonian_signals=hamiltonian.signals,
             noise_operators=noise_operators,
             noise_signals=noise_signals,
+            evaluation_mode=evaluation_mode,
         )
+
+
+def _sparse_linear_combination(coeffs: Array, operators: List[csr_matrix]) -> csr_matrix:
+    """Linear combination of a list of CSR matrices."""
+    out = csr_matrix(operators[0].shape, dtype=complex)
+    for coeff, op in zip(Array(coeffs).data, operators):
+        out = out + coeff * op
+    return out
+
+
+def _sparse_lmult(op: csr_matrix, rho: np.ndarray) -> np.ndarray:
+    """Left multiply each matrix in a 3d stack of dense matrices by a CSR matrix."""
+    num_mats, dim, num_cols = rho.shape
+    out = op @ rho.transpose((1, 0, 2)).reshape((dim, num_mats * num_cols))
+    return out.reshape((op.shape[0], num_mats, num_cols)).transpose((1, 0, 2))
+
+
+def _sparse_rmult(rho: np.ndarray, op: csr_matrix) -> np.ndarray:
+    """Right multiply each matrix in a 3d stack of dense matrices by a CSR matrix."""
+    num_mats, num_rows, dim = rho.shape
+    return (rho.reshape((num_mats * num_rows, dim)) @ op).reshape((num_mats, num_rows, op.shape[1]))
@@ -40,7 +40,8 @@ Transfer Functions
    :toctree: ../stubs/
 
    Convolution
+   FFTConvolution
 """
 
 from .signals import BaseSignal, Signal, VectorSignal, PiecewiseConstant, Constant
-from .transfer_functions import Convolution, Sampler, IQMixer
+from .transfer_functions import Convolution, FFTConvolution, Sampler, IQMixer
@@ -28,7 +28,11 @@ from qiskit_ode.dispatch import Array
 
 
 class BaseSignal(ABC):
-    """Base class for a time-dependent mixed signal."""
+    """Base class for a time-dependent mixed signal.
+
+    The methods ``envelope_value`` and ``value`` accept either a single time, or an array of
+    times, in which case an array of values of the same shape is returned.
+    """
 
     def __init__(self, name: str = None):
         """Init function."""
@@ -51,12 +55,12 @@ class BaseSignal(ABC):
         """Return a new signal that is the complex conjugate of self."""
 
     @abstractmethod
-    def envelope_value(self, t: float = 0.0) -> complex:
-        """Evaluates the envelope at time t."""
+    def envelope_value(self, t: Union[float, Array] = 0.0) -> complex:
+        """Evaluates the envelope at time t, or at an array of times."""
 
     @abstractmethod
-    def value(self, t: float = 0.0) -> complex:
-        """Return the value of the signal at time t."""
+    def value(self, t: Union[float, Array] = 0.0) -> complex:
+        """Return the value of the signal at time t, or at an array of times."""
 
     def to_pwc(self, dt: float, n_samples: int, start_time: float = 0.0) -> "PiecewiseConstant":
         """
@@ -70,7 +74,7 @@ class BaseSignal(ABC):
         Returns:
             A piecewiseConstant signal.
         """
-        samples = [self.envelope_value(dt * idx + start_time) for idx in range(n_samples)]
+        samples = self.envelope_value(dt * np.arange(n_samples) + start_time)
 
         return PiecewiseConstant(
             dt, samples, start_time=start_time, carrier_freq=self.carrier_freq, phase=self.phase
@@ -97,10 +101,7 @@ class BaseSignal(ABC):
             n: number of points to sample in interval.
         """
         x_vals = np.linspace(t0, tf, n)
-
-        sig_vals = []
-        for x in x_vals:
-            sig_vals.append(self.value(x))
+        sig_vals = Array(self.value(x_vals)).data
 
         plt.plot(x_vals, np.real(sig_vals))
         plt.plot(x_vals, np.imag(sig_vals))
@@ -114,10 +115,7 @@ class BaseSignal(ABC):
             n: number of points to sample in interval.
         """
         x_vals = np.linspace(t0, tf, n)
-
-        sig_vals = []
-        for x in x_vals:
-            sig_vals.append(self.envelope_value(x))
+        sig_vals = Array(self.envelope_value(x_vals)).data
 
         plt.plot(x_vals, np.real(sig_vals))
         plt.plot(x_vals, np.imag(sig_vals))
@@ -126,6 +124,10 @@ class BaseSignal(ABC):
 class Signal(BaseSignal):
     """The most general mixed signal type, represented by a callable
     envelope function and a carrier frequency.
+
+    If the envelope is declared ``vectorized``, it is called directly on arrays of times.
+    Otherwise, it is treated as a function of a single time, and evaluation on arrays of
+    times falls back to ``np.vectorize``.
     """
 
     def __init__(
@@ -134,6 +136,7 @@ class Signal(BaseSignal):
         carrier_freq: float = 0.0,
         phase: float = 0.0,
         name: str = None,
+        vectorized: bool = False,
     ):
         """
         Initializes a signal given by an envelop and an optional carrier.
@@ -143,6 +146,7 @@ class Signal(BaseSignal):
             carrier_freq: Frequency of the carrier.
             phase: The phase of the carrier.
             name: name of signal.
+            vectorized: Whether ``envelope`` evaluates elementwise on arrays of times.
         """
         super().__init__(name)
 
@@ -150,25 +154,36 @@ class Signal(BaseSignal):
             envelope = complex(envelope)
 
         if isinstance(envelope, complex):
-            self.envelope = lambda t: envelope
+            self.envelope = lambda t: _constant_value(envelope, t)
+            vectorized = True
         else:
             self.envelope = envelope
 
+        self.vectorized = vectorized
+
         self._carrier_freq = Array(carrier_freq)
         self._phase = Array(phase)
 
-    def envelope_value(self, t: float = 0.0) -> Array:
-        """Evaluates the envelope at time t."""
+    def envelope_value(self, t: Union[float, Array] = 0.0) -> Array:
+        """Evaluates the envelope at time t, or at an array of times."""
+        if not self.vectorized and np.ndim(t) > 0:
+            return _evaluate_on_times(self.envelope, t)
+
         return Array(self.envelope(t))
 
-    def value(self, t: float = 0.0) -> Array:
-        """Return the value of the signal at time t."""
+    def value(self, t: Union[float, Array] = 0.0) -> Array:
+        """Return the value of the signal at time t, or at an array of times."""
         arg = 1j * 2 * np.pi * self.carrier_freq * t + 1j * self.phase
         return self.envelope_value(t) * np.exp(arg)
 
     def conjugate(self):
         """Return a new signal that is the complex conjugate of this one"""
-        return Signal(lambda t: self.envelope_value(t).conjugate(), -self.carrier_freq, -self.phase)
+        return Signal(
+            lambda t: self.envelope_value(t).conjugate(),
+            -self.carrier_freq,
+            -self.phase,
+            vectorized=True,
+        )
 
 
 class Constant(BaseSignal):
@@ -186,11 +201,11 @@ class Constant(BaseSignal):
         self._value = value
         super().__init__(name)
 
-    def envelope_value(self, t: float = 0.0) -> complex:
-        return self._value
+    def envelope_value(self, t: Union[float, Array] = 0.0) -> complex:
+        return _constant_value(self._value, t)
 
-    def value(self, t: float = 0.0) -> complex:
-        return self._value
+    def value(self, t: Union[float, Array] = 0.0) -> complex:
+        return _constant_value(self._value, t)
 
     def conjugate(self):
         return Constant(self._value.conjugate())
@@ -269,14 +284,14 @@ class PiecewiseConstant(BaseSignal):
         """
         return self._start_time
 
-    def envelope_value(self, t: float = 0.0) -> complex:
+    def envelope_value(self, t: Union[float, Array] = 0.0) -> complex:
 
         idx = Array((t - self._start_time) // self._dt, dtype=int)
 
         return Array(self._samples.data[idx.data])
 
-    def value(self, t: float = 0.0) -> Array:
-        """Return the value of the signal at time t."""
+    def value(self, t: Union[float, Array] = 0.0) -> Array:
+        """Return the value of the signal at time t, or at an array of times."""
         arg = 1j * 2 * np.pi * self.carrier_freq * t + 1j * self.phase
         return self.envelope_value(t) * np.exp(arg)
 
@@ -351,6 +366,7 @@ def signal_multiply(
         lambda t: sig1.envelope_value(t) * sig2.envelope_value(t),
         sig1.carrier_freq + sig2.carrier_freq,
         sig1.phase + sig2.phase,
+        vectorized=True,
     )
 
 
@@ -392,6 +408,7 @@ def signal_add(
         lambda t: (sig1.value(t) + sig2.value(t)) * np.exp(-2.0j * np.pi * t * avg_freq),
         avg_freq,
         0,
+        vectorized=True,
     )
 
 
@@ -403,6 +420,10 @@ class VectorSignal:
     VectorSignal when all "time-dependent terms" are off. E.g. if it is
     composed of a list of Signal objects, this corresponds to the output when
     all non-Constant signal objects are zero.
+
+    If the envelope is declared ``vectorized``, calling it on a 1d array of times returns
+    a 2d array whose rows are the envelope values at each time. Otherwise, evaluation on
+    arrays of times falls back to ``np.vectorize``.
     """
 
     def __init__(
@@ -411,6 +432,10 @@ class VectorSignal:
         carrier_freqs: Array,
         phases: Array,
         drift_array: Optional[Array] = None,
+        dt: Optional[float] = None,
+        start_time: Optional[float] = None,
+        vectorized: bool = False,
+        samples: Optional[Array] = None,
     ):
         """Initialize with vector-valued envelope, carrier frequencies for
         each entry, and a drift_array, which corresponds to the value of the
@@ -423,14 +448,28 @@ class VectorSignal:
             phases: list of carrier phases for each component of the envelope.
             drift_array: a default array meant to be the value of the envelope
                          when all "time-dependent terms" are off.
+            dt: if the envelope is piecewise constant, the duration of each sample.
+            start_time: if the envelope is piecewise constant, the time at which
+                        the samples start.
+            vectorized: whether the envelope can be evaluated on a 1d array of times.
+            samples: if the envelope is piecewise constant, a 2d array whose rows are the
+                     values of the envelope on each sample interval. When constructed with
+                     :meth:`from_signal_list`, the samples of signals shorter than the longest
+                     one are padded with zeros.
         """
         carrier_freqs = Array(carrier_freqs)
         phases = Array(phases)
 
         self.envelope = envelope
+        self.vectorized = vectorized
         self.carrier_freqs = carrier_freqs
         self.phases = phases
 
+        # sample grid on which the envelope is constant, if any
+        self.dt = dt
+        self.start_time = start_time
+        self.samples = None if samples is None else Array(samples)
+
         self._im_angular_freqs = 1j * 2 * np.pi * carrier_freqs
 
         # if not supplied nothing is assumed, constant array is taken as all
@@ -445,6 +484,14 @@ class VectorSignal:
         """Instantiate from a list of Signal objects. The drift_array will
         correspond to the Constant objects.
 
+        If all non-constant signals are :class:`PiecewiseConstant` with the same ``dt`` and
+        ``start_time``, their samples are stacked into ``samples``, and the envelope is
+        evaluated with a single lookup. The signals may have different durations, in which
+        case the samples of the shorter signals are padded with zeros up to the duration of
+        the longest one. The envelope is then zero for these signals between the end of their
+        samples and the end of the longest signal, as for the channels of a pulse schedule
+        that end at different times.
+
         Args:
             signal_list: list of Signal objects.
 
@@ -452,10 +499,6 @@ class VectorSignal:
             VectorSignal: that evaluates the signal list
         """
 
-        # define the envelope as iteratively evaluating the envelopes
-        def env_func(t):
-            return Array([Array(sig.envelope_value(t)).data for sig in signal_list])
-
         # construct carrier frequency and phase list
         # if signal doesn't have a carrier, set to 0.
         carrier_freqs = Array(
@@ -472,35 +515,82 @@ class VectorSignal:
             else:
                 drift_array.append(0.0)
 
+        # if all non-constant signals are piecewise constant on a common grid
+        # record the grid
+        dt, start_time = None, None
+        pwc_signals = [sig for sig in signal_list if not isinstance(sig, Constant)]
+        if len(pwc_signals) > 0 and all(isinstance(sig, PiecewiseConstant) for sig in pwc_signals):
+            dt, start_time = pwc_signals[0].dt, pwc_signals[0].start_time
+            for sig in pwc_signals[1:]:
+                if sig.dt != dt or sig.start_time != start_time:
+                    dt, start_time = None, None
+                    break
+
+        if dt is not None:
+            # stack the samples into a single array, so that the envelope is evaluated
+            # with a single lookup
+            samples = _stack_pwc_samples(signal_list)
+            return cls(
+                envelope=_pwc_envelope(samples, dt, start_time),
+                carrier_freqs=carrier_freqs,
+                phases=phases,
+                drift_array=Array(drift_array),
+                dt=dt,
+                start_time=start_time,
+                vectorized=True,
+                samples=samples,
+            )
+
+        # otherwise define the envelope as iteratively evaluating the envelopes, with the
+        # signal index as the last axis
+        def env_func(t):
+            return Array([Array(sig.envelope_value(t)).data for sig in signal_list]).transpose()
+
         return cls(
             envelope=env_func,
             carrier_freqs=carrier_freqs,
             phases=phases,
             drift_array=Array(drift_array),
+            vectorized=True,
         )
 
-    def envelope_value(self, t: float) -> Array:
-        """Evaluate the envelope.
+    def envelope_value(self, t: Union[float, Array]) -> Array:
+        """Evaluate the envelope. If ``t`` is a 1d array of times, the
+        envelope is evaluated at each time, and the results are returned
+        as the rows of a 2d array.
 
         Args:
-            t: time
+            t: time, or 1d array of times
 
         Returns:
             Array: the signal envelope at time t
         """
+        if np.ndim(t) == 1:
+            if self.vectorized:
+                return Array(self.envelope(t))
+
+            return _evaluate_on_times(self.envelope, t, signature="()->(n)")
+
         return self.envelope(t)
 
-    def value(self, t: float) -> Array:
-        """Evaluate the full value of the VectorSignal.
+    def value(self, t: Union[float, Array]) -> Array:
+        """Evaluate the full value of the VectorSignal. If ``t`` is a 1d
+        array of times, the value is evaluated at each time, and the results
+        are returned as the rows of a 2d array.
 
         Args:
-            t (float): time
+            t (Union[float, Array]): time, or 1d array of times
 
         Returns:
             Array: the value of the signal (including carrier frequencies)
                       at time t
         """
-        carrier_val = np.exp(t * self._im_angular_freqs + 1.0j * self.phases)
+        if np.ndim(t) == 1:
+            carrier_val = np.exp(
+                np.expand_dims(t, -1) * self._im_angular_freqs + 1.0j * self.phases
+            )
+        else:
+            carrier_val = np.exp(t * self._im_angular_freqs + 1.0j * self.phases)
         return self.envelope_value(t) * carrier_val
 
     def conjugate(self):
@@ -514,4 +604,72 @@ class VectorSignal:
             -self.carrier_freqs,
             -self.phases,
             np.conjugate(self.drift_array),
+            dt=self.dt,
+            start_time=self.start_time,
+            vectorized=True,
+            samples=None if self.samples is None else np.conjugate(self.samples),
+        )
+
+
+def _stack_pwc_samples(signal_list: List[BaseSignal]) -> Array:
+    """Stack the samples of a list of :class:`PiecewiseConstant` and :class:`Constant` signals
+    on a common grid into a 2d array, with the rows indexing the samples and the columns
+    indexing the signals. Signals with fewer samples than the longest signal are padded with
+    zeros at the end, so that they are zero until the end of the longest signal, and constants
+    are repeated.
+    """
+    num_samples = max(sig.duration for sig in signal_list if isinstance(sig, PiecewiseConstant))
+
+    columns = []
+    for sig in signal_list:
+        if isinstance(sig, Constant):
+            column = sig.value() * Array(np.ones(num_samples, dtype=complex))
+        else:
+            column = Array(sig.samples, dtype=complex)
+            if sig.duration < num_samples:
+                column = np.append(column, np.zeros(num_samples - sig.duration, dtype=complex))
+        columns.append(Array(column).data)
+
+    return Array(columns).transpose()
+
+
+def _pwc_envelope(samples: Array, dt: float, start_time: float) -> Callable:
+    """Envelope function looking up the rows of a 2d array of samples on a grid with sample
+    duration ``dt`` starting at ``start_time``. Evaluating on a 1d array of times returns the
+    corresponding rows.
+    """
+
+    def envelope(t):
+        idx = Array((t - start_time) // dt, dtype=int)
+        return Array(samples.data[idx.data])
+
+    return envelope
+
+
+def _constant_value(value: complex, t: Union[float, Array]) -> Union[complex, Array]:
+    """Return ``value``, broadcast to the shape of ``t`` if ``t`` is an array of times."""
+    if np.ndim(t) == 0:
+        return value
+
+    return Array(np.full(np.shape(t), value))
+
+
+def _evaluate_on_times(envelope: Callable, t: Array, signature: Optional[str] = None) -> Array:
+    """Evaluate an envelope of a single time at each time in an array of times.
+
+    Args:
+        envelope: Function of a single time.
+        t: Array of times.
+        signature: Signature of ``envelope`` for ``np.vectorize``, if it is array-valued.
+
+    Returns:
+        Array: the envelope values, with the leading axes indexing the times.
+    """
+    t = Array(t)
+    if t.backend == "numpy":
+        vectorized = np.vectorize(
+            lambda x: Array(envelope(x)).data, otypes=[complex], signature=signature
         )
+        return Array(vectorized(t.data))
+
+    return Array([Array(envelope(x)).data for x in t.data])
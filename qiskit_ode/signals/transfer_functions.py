@@ -18,8 +18,9 @@ Module for transformations between signals.
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable, Union, List
+from typing import Callable, Union, List, Optional
 import numpy as np
+from scipy.fft import fft, ifft, rfft, irfft, next_fast_len
 
 from qiskit import QiskitError
 from qiskit_ode.dispatch import Array
@@ -119,7 +120,7 @@ class Convolution(BaseTransferFunction):
             dt = signal.dt
             func_samples = Array([self._func(dt * i) for i in range(signal.duration)])
             func_samples = func_samples / sum(func_samples)
-            sig_samples = Array([signal.value(dt * i) for i in range(signal.duration)])
+            sig_samples = Array(signal.value(dt * np.arange(signal.duration)))
 
             convoluted_samples = list(np.convolve(func_samples, sig_samples))
 
@@ -131,18 +132,136 @@ class Convolution(BaseTransferFunction):
 class FFTConvolution(BaseTransferFunction):
     """
     Applies a convolution by moving into the fourier domain.
+
+    The convolution is computed with fast Fourier transforms, with a cost of ``O(n log n)`` in
+    the number of samples. Real transforms are used if both the signal and the convolution
+    function are real.
+
+    For signals starting at time zero, the result is the same as that of :class:`Convolution`.
+    Unlike :class:`Convolution`, which samples the signal from time zero and returns a signal
+    starting at time zero, the signal is sampled on its own grid starting at
+    ``signal.start_time``, and the returned signal starts at the same time.
+
+    If ``chunk_size`` is given, the signal is processed in chunks of ``chunk_size`` samples,
+    and the convolutions of the chunks are added into the output (overlap-add). The length of
+    the transforms is then set by the chunk size and the kernel duration rather than by the
+    duration of the signal, which makes it possible to convolve very long signals with short
+    kernels. The kernel duration must then be given explicitly. The spectra of the sampled convolution function are cached on the instance,
+    keyed by ``dt``, the kernel duration, the transform length, and whether real transforms
+    are used.
     """
 
-    def __init__(self, func: Callable):
+    def __init__(
+        self,
+        func: Callable,
+        kernel_duration: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            func: The convolution function specified in time.
+                  This function will be normalized to one before doing
+                  the convolution. To scale signals multiply them by a float.
+            kernel_duration: The number of samples of ``func`` to use. Defaults to the
+                             duration of the signal, as in :class:`Convolution`. Required if
+                             ``chunk_size`` is given.
+            chunk_size: Number of samples of the signal to process at a time. If ``None``,
+                        the whole signal is transformed at once.
+
+        Raises:
+            QiskitError: if ``chunk_size`` is given without ``kernel_duration``.
+        """
+        if chunk_size is not None and kernel_duration is None:
+            raise QiskitError(
+                "FFTConvolution requires kernel_duration when chunk_size is given, as the "
+                "kernel otherwise spans the whole signal."
+            )
+
         self._func = func
+        self._kernel_duration = kernel_duration
+        self._chunk_size = chunk_size
+        self._samples_cache = {}
+        self._spectrum_cache = {}
 
     @property
     def n_inputs(self):
         return 1
 
     # pylint: disable=arguments-differ
-    def _apply(self, signal: Signal) -> Signal:
-        raise NotImplementedError
+    def _apply(self, signal: BaseSignal) -> BaseSignal:
+        """
+        Applies the convolution to a piecewise constant signal. As with :class:`Convolution`,
+        the carrier is part of the convolved signal, and the output has no carrier. The output
+        has the same ``start_time`` as the signal.
+
+        Args:
+            signal: A piecewise constant signal.
+
+        Returns:
+            signal: The convolved signal.
+
+        Raises:
+            QiskitError: if the signal is not pwc.
+        """
+        if not isinstance(signal, PiecewiseConstant):
+            raise QiskitError("Transfer function not defined on input.")
+
+        dt = signal.dt
+        duration = signal.duration
+        kernel_duration = self._kernel_duration or duration
+        sig_samples = Array(signal.value(signal.start_time + dt * np.arange(duration))).data
+
+        real = not np.any(np.imag(sig_samples)) and not np.any(
+            np.imag(self._kernel_samples(dt, kernel_duration))
+        )
+        if real:
+            sig_samples = np.real(sig_samples)
+
+        chunk_size = min(self._chunk_size or duration, duration)
+        fft_len = next_fast_len(chunk_size + kernel_duration - 1, real=real)
+        spectrum = self._kernel_spectrum(dt, kernel_duration, fft_len, real)
+
+        convolved_samples = np.zeros(duration + kernel_duration - 1, dtype=sig_samples.dtype)
+        for start in range(0, duration, chunk_size):
+            chunk = sig_samples[start : start + chunk_size]
+            if real:
+                convolved_chunk = irfft(rfft(chunk, fft_len) * spectrum, fft_len)
+            else:
+                convolved_chunk = ifft(fft(chunk, fft_len) * spectrum, fft_len)
+
+            chunk_len = len(chunk) + kernel_duration - 1
+            convolved_samples[start : start + chunk_len] += convolved_chunk[:chunk_len]
+
+        return PiecewiseConstant(
+            dt, convolved_samples, start_time=signal.start_time, carrier_freq=0.0, phase=0.0
+        )
+
+    def _kernel_samples(self, dt: float, kernel_duration: int) -> np.ndarray:
+        """Sample the convolution function at ``kernel_duration`` multiples of ``dt``,
+        normalized to sum to one.
+        """
+        key = (dt, kernel_duration)
+        if key not in self._samples_cache:
+            samples = np.vectorize(lambda t: complex(Array(self._func(t)).data), otypes=[complex])(
+                dt * np.arange(kernel_duration)
+            )
+            self._samples_cache[key] = samples / np.sum(samples)
+
+        return self._samples_cache[key]
+
+    def _kernel_spectrum(
+        self, dt: float, kernel_duration: int, fft_len: int, real: bool
+    ) -> np.ndarray:
+        """Fourier transform of the sampled convolution function, padded to ``fft_len``."""
+        key = (dt, kernel_duration, fft_len, real)
+        if key not in self._spectrum_cache:
+            samples = self._kernel_samples(dt, kernel_duration)
+            if real:
+                self._spectrum_cache[key] = rfft(np.real(samples), fft_len)
+            else:
+                self._spectrum_cache[key] = fft(samples, fft_len)
+
+        return self._spectrum_cache[key]
 
 
 class Sampler(BaseTransferFunction):
@@ -235,4 +354,4 @@ class IQMixer(BaseTransferFunction):
             osc_q = np.cos(wp * t + phi_q - np.pi / 2) + np.cos(wm * t + phi_q + np.pi / 2)
             return si.envelope_value(t) * osc_i / 2 + sq.envelope_value(t) * osc_q / 2
 
-        return Signal(mixer_func, carrier_freq=0, phase=0)
+        return Signal(mixer_func, carrier_freq=0, phase=0, vectorized=True)
@@ -60,12 +60,15 @@ or a subclass of :class:`~qiskit_ode.models.generator_models.BaseGeneratorModel`
 
    solve_ode
    solve_lmde
+   solve_lmde_iter
 """
 
-from typing import Optional, Union, Callable, Tuple, Any, Type, List
+from typing import Optional, Union, Callable, Tuple, Any, Type, List, Iterator
 import inspect
 
+import numpy as np
 from scipy.integrate import OdeSolver
+from scipy.sparse import csr_matrix, issparse
 
 # pylint: disable=unused-import
 from scipy.integrate._ivp.ivp import OdeResult
@@ -79,20 +82,62 @@ from qiskit.quantum_info import SuperOp, Operator
 from qiskit import QiskitError
 from qiskit_ode import dispatch
 from qiskit_ode.dispatch import Array, requires_backend
-
-from .solvers.fixed_step_solvers import scipy_expm_solver, jax_expm_solver
-from .solvers.scipy_solve_ivp import scipy_solve_ivp, SOLVE_IVP_METHODS
+from qiskit_ode.type_utils import to_array
+
+from .solvers.fixed_step_solvers import (
+    scipy_expm_solver,
+    scipy_expm_solver_iter,
+    jax_expm_solver,
+    scipy_expm_parallel_solver,
+    jax_expm_parallel_solver,
+    scipy_rk4_solver,
+    jax_rk4_solver,
+    scipy_magnus_solver,
+    scipy_magnus_solver_iter,
+    jax_magnus_solver,
+    scipy_expm_multiply_solver,
+    scipy_expm_multiply_solver_iter,
+    scipy_pwc_expm_solver,
+    scipy_pwc_expm_solver_iter,
+    scipy_rk4_solver_iter,
+)
+from .solvers.scipy_solve_ivp import (
+    scipy_solve_ivp,
+    scipy_solve_ivp_iter,
+    SOLVE_IVP_METHODS,
+    JAC_METHODS,
+)
+from .solvers.solver_utils import map_dense_output, collect_solver_iter
+from .solvers.adaptive_step_solvers import (
+    scipy_adaptive_expm_solver,
+    scipy_adaptive_expm_solver_iter,
+)
 from .solvers.jax_odeint import jax_odeint
 
-from .models.frame import Frame
-from .models.generator_models import BaseGeneratorModel, CallableGenerator
-from .models import HamiltonianModel
+from .models.frame import Frame, _diagonal_or_none
+from .models.generator_models import BaseGeneratorModel, CallableGenerator, GeneratorModel
+from .models import HamiltonianModel, LindbladModel
 
 try:
     from jax.lax import scan
 except ImportError:
     pass
 
+# jax fixed step methods taking all steps in a single jax.lax.scan
+JAX_SCAN_METHODS = ["jax_expm", "jax_rk4", "jax_magnus"]
+
+# LMDE methods computing matrix exponentials of the generator
+DENSE_EXPM_METHODS = [
+    "scipy_expm",
+    "jax_expm",
+    "scipy_expm_parallel",
+    "jax_expm_parallel",
+    "scipy_adaptive_expm",
+    "scipy_magnus",
+    "jax_magnus",
+    "scipy_pwc_expm",
+]
+
 
 def solve_ode(
     rhs: Callable,
@@ -121,8 +166,14 @@ def solve_ode(
       ``scipy`` :class:`OdeSolver` instance.
     - ``jax.experimental.ode.odeint`` - accessed via passing
       ``method='jax_odeint'``.
+    - Fixed-step classical fourth order Runge-Kutta, implemented in ``numpy`` or ``jax`` -
+      accessed via passing ``method='scipy_rk4'`` or ``method='jax_rk4'``, respectively.
+      Requires additional kwarg ``max_dt``.
 
-    Results are returned as a :class:`OdeResult` object.
+    Results are returned as a :class:`OdeResult` object. For the ``scipy.integrate.solve_ivp``
+    methods, passing ``dense_output=True`` additionally returns an interpolant ``results.sol``,
+    which evaluates the solution, in the same format as ``y0``, at a time or a 1d array of
+    times.
 
     Args:
         rhs: RHS function :math:`f(t, y)`.
@@ -150,10 +201,18 @@ def solve_ode(
         results = scipy_solve_ivp(rhs, t_span, y0, method, t_eval, **kwargs)
     elif isinstance(method, str) and method == "jax_odeint":
         results = jax_odeint(rhs, t_span, y0, t_eval, **kwargs)
+    elif isinstance(method, str) and method == "scipy_rk4":
+        results = scipy_rk4_solver(rhs, t_span, y0, t_eval=t_eval, **kwargs)
+    elif isinstance(method, str) and method == "jax_rk4":
+        results = jax_rk4_solver(rhs, t_span, y0, t_eval=t_eval, **kwargs)
     else:
         raise QiskitError("""Specified method is not a supported ODE method.""")
     if y0_cls is not None:
         results.y = [final_state_converter(i, y0_cls) for i in results.y]
+        if getattr(results, "sol", None) is not None:
+            results.sol = map_dense_output(
+                results.sol, lambda _, y: final_state_converter(y, y0_cls), stack=False
+            )
     return results
 
 
@@ -167,6 +226,8 @@ def solve_lmde(
     solver_frame: Optional[Union[str, Array]] = "auto",
     output_frame: Optional[Union[str, Array]] = "auto",
     solver_cutoff_freq: Optional[float] = None,
+    batched_y0: Optional[bool] = False,
+    observables: Optional[Union[List, Array, Callable]] = None,
     **kwargs,
 ):
     r"""General interface for solving Linear Matrix Differential Equations (LMDEs).
@@ -196,8 +257,82 @@ def solve_lmde(
     - ``'scipy_expm'``: A matrix-exponential solver using ``scipy.linalg.expm``.
                         Requires additional kwarg ``max_dt``.
     - ``'jax_expm'``: A ``jax``-based exponential solver. Requires additional kwarg ``max_dt``.
-
-    Results are returned as a :class:`OdeResult` object.
+    - ``'scipy_expm_parallel'``, ``'jax_expm_parallel'``: Parallel-in-time versions of
+      ``'scipy_expm'`` and ``'jax_expm'``, in which the propagators for all steps are computed
+      simultaneously and combined using tree-structured products. Requires additional kwarg
+      ``max_dt``.
+    - ``'scipy_adaptive_expm'``: An adaptive step size matrix-exponential solver using
+      ``scipy.linalg.expm``, with steps given by a fourth order Magnus expansion, and the local
+      error estimated by comparison with a second order expansion. Accepts the optional kwargs
+      ``rtol``, ``atol``, ``first_step``, and ``max_dt``. The number of generator evaluations,
+      accepted steps, and rejected steps are reported in the ``nfev``, ``n_steps``, and
+      ``n_rejected`` attributes of the results.
+    - ``'scipy_magnus'``: A Magnus expansion based solver using ``scipy.linalg.expm``.
+      Requires additional kwarg ``max_dt``, and accepts the optional kwarg ``order``
+      (one of ``2``, ``4``, or ``6``, defaulting to ``4``).
+    - ``'jax_magnus'``: A ``jax``-based Magnus expansion solver, with the same arguments as
+      ``'scipy_magnus'``.
+    - ``'scipy_expm_multiply'``: A matrix-exponential solver using
+      ``scipy.sparse.linalg.expm_multiply``, which applies the exponential of the generator to
+      the state without forming the exponential. Suitable for large, and in particular sparse,
+      generators. Requires additional kwarg ``max_dt``.
+    - ``'scipy_pwc_expm'``: An exact matrix-exponential solver for generators that are constant
+      on each sample of a grid with spacing ``dt``, with steps aligned to the sample boundaries
+      and the exponentials cached for repeated samples. If the generator is a
+      :class:`GeneratorModel` whose signals are all :class:`PiecewiseConstant` (or
+      :class:`Constant`) on a common grid with no carrier frequencies, the grid and the cache keys
+      are determined automatically, otherwise the additional kwarg ``dt`` (and optionally
+      ``start_time``) is required. The solver frame must be ``None``, and defaults to ``None``
+      if ``solver_frame == 'auto'``.
+
+    For a :class:`HamiltonianModel` the generator is known to be anti-Hermitian, and the above
+    methods compute matrix exponentials using a Hermitian eigendecomposition rather than
+    ``expm``. This can be controlled explicitly via the kwarg ``anti_hermitian``.
+
+    For a :class:`GeneratorModel` in dense evaluation mode, the ``'scipy_expm'`` and
+    ``'scipy_expm_parallel'`` methods evaluate the generator at the midpoints of many steps with
+    a single vectorized call, and compute the step propagators as a single batch of matrix
+    exponentials. ``'scipy_expm_parallel'`` does this for all steps at once. ``'scipy_expm'``
+    does this for chunks of steps, and is the only method accepting the kwarg ``chunk_size``,
+    which sets the number of steps per chunk. Vectorized evaluation can be controlled
+    explicitly via the kwarg ``vectorized_generator``.
+    In sparse evaluation mode, the generator is evaluated as a ``scipy.sparse`` matrix, which
+    is used directly by the ``'scipy_expm_multiply'`` method and the methods of
+    ``scipy.integrate.solve_ivp``. The other methods computing matrix exponentials do not
+    support sparse evaluation mode.
+
+    A :class:`LindbladModel` in one of the matrix evaluation modes ``'dense'`` or ``'sparse'``
+    never forms the vectorized generator, and can only be solved with methods that use the
+    right hand side function, such as the methods of ``scipy.integrate.solve_ivp``. No solver
+    frame is used by default for such models. Similarly, for models in the sparse evaluation
+    modes ``'sparse'`` and ``'sparse_vectorized'``, the drift is only used as the default solver
+    frame if it is diagonal, as diagonalizing it would make the operators dense.
+
+    Multiple initial states can be solved simultaneously by setting ``batched_y0=True``, in
+    which case the first axis of ``y0`` indexes the initial states. Internally the states are
+    stacked as the columns of a single state, so that all generator evaluations, frame
+    transformations, and matrix exponentials are shared across the batch. The returned states
+    have the same leading batch axis, i.e. ``results.y[k][i]`` is the evolution of ``y0[i]`` at
+    time ``results.t[k]``.
+
+    Results are returned as a :class:`OdeResult` object. For methods supporting dense output
+    (e.g. the methods of ``scipy.integrate.solve_ivp`` with ``dense_output=True``), the
+    interpolant ``results.sol`` returns states in the output frame, in the same format as
+    ``results.y``.
+
+    If only quantities derived from the states are required, these can be specified via
+    ``observables``, in which case ``results.observables`` is returned in place of
+    ``results.y``, and ``results.sol`` (if present) returns observables rather than states.
+    ``observables`` may either be a list of operators, in which case
+    ``results.observables[k]`` contains their expectation values at time ``results.t[k]``
+    (see :meth:`expectation_values`), or a function ``observables(t, y)`` of the time and the
+    state in the output frame. For the ``numpy`` based fixed step methods,
+    ``'scipy_adaptive_expm'``, and the methods of ``scipy.integrate.solve_ivp``, each state is
+    reduced within the stepping loop as soon as it has been computed, so that the states are
+    never stored. For ``'jax_expm'``, ``'jax_rk4'``, and ``'jax_magnus'``, a list of operators
+    is reduced within the ``jax.lax.scan`` over the steps. When the output frame is the same
+    as the solver frame, expectation values are computed without transforming the states out
+    of the solver frame.
 
     Args:
         generator: Representaiton of generator function :math:`G(t)`.
@@ -215,18 +350,304 @@ def solve_lmde(
                      defaults to using the frame the generator is specified in.
         solver_cutoff_freq: Cutoff frequency to use (if any) for doing the rotating
                             wave approximation.
+        batched_y0: Whether or not ``y0`` is a stack of initial states to be solved
+                    simultaneously, indexed by the first axis.
+        observables: List of operators to compute the expectation values of, or function
+                     ``observables(t, y)`` to apply to the output states.
         kwargs: Additional arguments to pass to the solver.
 
     Returns:
         OdeResult: Results object.
 
     Raises:
-        QiskitError: If specified method does not exist, or if dimension of y0 is incompatible
-                     with generator dimension.
+        QiskitError: If specified method does not exist, if dimension of y0 is incompatible
+                     with generator dimension, if a batch of initial states is not specified
+                     as an array, or if the method does not support the evaluation mode of
+                     the generator.
     """
     t_span = Array(t_span)
+    generator, output_frame, y0, y0_cls, output_reshape = setup_lmde_problem(
+        generator=generator,
+        t_span=t_span,
+        y0=y0,
+        method=method,
+        input_frame=input_frame,
+        solver_frame=solver_frame,
+        output_frame=output_frame,
+        solver_cutoff_freq=solver_cutoff_freq,
+        batched_y0=batched_y0,
+    )
+
+    # reduce states as they are computed, only storing the results
+    if observables is not None:
+        reduce_state = lmde_observables_reducer(
+            observables, generator.frame, output_frame, output_reshape, y0_cls, batched_y0
+        )
+        results = collect_solver_iter(
+            solve_lmde_stream(
+                generator,
+                t_span,
+                y0,
+                method,
+                t_eval,
+                kwargs,
+                output_func=reduce_state,
+                trace_output_func=not callable(observables),
+            )
+        )
+        results.observables = results.pop("y")
+
+        if results.get("sol") is not None:
+            results.sol = map_dense_output(results.sol, reduce_state)
+
+        return results
+
+    results = solve_lmde_in_solver_frame(generator, t_span, y0, method, t_eval, kwargs)
+
+    # convert any states in results to correct basis/frame
+    output_states = None
+    convert_output_state = lmde_output_state_converter(
+        generator.frame, output_frame, output_reshape, y0_cls
+    )
+
+    # pylint: disable=too-many-boolean-expressions
+    if (
+        results.y.backend == "jax"
+        and (generator.frame.frame_diag is None or generator.frame.frame_diag.backend == "jax")
+        and (output_frame.frame_diag is None or output_frame.frame_diag.backend == "jax")
+        and y0_cls is None
+    ):
+        # if all relevant objects are jax-compatible, run jax-customized version
+        output_states = _jax_lmde_output_state_converter(
+            results.t, results.y, generator.frame, output_frame, output_reshape, y0_cls
+        )
+    else:
+        output_states = _batched_lmde_output_state_converter(
+            results.t, results.y, generator.frame, output_frame, output_reshape, y0_cls
+        )
+
+    results.y = output_states
+
+    # dense output is converted only when evaluated
+    if getattr(results, "sol", None) is not None:
+        results.sol = map_dense_output(results.sol, convert_output_state, stack=y0_cls is None)
+
+    return results
+
+
+def solve_lmde_iter(
+    generator: Union[Callable, BaseGeneratorModel],
+    t_span: Array,
+    y0: Union[Array, QuantumState, BaseOperator],
+    method: Optional[Union[str, OdeSolver]] = "DOP853",
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    input_frame: Optional[Union[str, Array]] = "auto",
+    solver_frame: Optional[Union[str, Array]] = "auto",
+    output_frame: Optional[Union[str, Array]] = "auto",
+    solver_cutoff_freq: Optional[float] = None,
+    batched_y0: Optional[bool] = False,
+    **kwargs,
+) -> Iterator[Tuple[float, Any]]:
+    r"""Iterator version of :meth:`solve_lmde`, yielding the solution at each time in
+    ``t_eval`` as soon as it has been computed.
+
+    The arguments are the same as for :meth:`solve_lmde`, and the yielded times and states are
+    the same as ``results.t`` and ``results.y`` returned by :meth:`solve_lmde`, with each state
+    converted to the output frame. The solve can be stopped early by stopping iteration.
+
+    For the ``numpy`` based fixed step methods, ``'scipy_adaptive_expm'``, and the methods of
+    ``scipy.integrate.solve_ivp``, a single solver is stepped through ``t_span``, with each
+    state yielded as soon as the corresponding point of ``t_eval`` has been passed, and only
+    the current state is kept in memory. Other methods solve the whole problem before the
+    states are yielded. See :meth:`solve_lmde_stream`.
+
+    Args:
+        generator: Representaiton of generator function :math:`G(t)`.
+        t_span: ``Tuple`` or `list` of initial and final time.
+        y0: State at initial time.
+        method: Solving method to use.
+        t_eval: Times at which to yield the solution. Must lie within ``t_span``. If unspecified,
+                the solution will be yielded at the points in ``t_span``.
+        input_frame: Frame that the initial state is specified in. If ``input_frame == 'auto'``,
+                     defaults to using the frame the generator is specified in.
+        solver_frame: Frame to solve the system in. If ``solver_frame == 'auto'``, defaults to
+                      using the drift of the generator when specified as a
+                      :class:`BaseGeneratorModel`.
+        output_frame: Frame to return the results in. If ``output_frame == 'auto'``,
+                     defaults to using the frame the generator is specified in.
+        solver_cutoff_freq: Cutoff frequency to use (if any) for doing the rotating
+                            wave approximation.
+        batched_y0: Whether or not ``y0`` is a stack of initial states to be solved
+                    simultaneously, indexed by the first axis.
+        kwargs: Additional arguments to pass to the solver.
+
+    Yields:
+        tuple: The time and the state at that time.
+
+    Raises:
+        QiskitError: If specified method does not exist, if dimension of y0 is incompatible
+                     with generator dimension, or if a batch of initial states is not specified
+                     as an array.
+    """
+    t_span = Array(t_span)
+    generator, output_frame, y, y0_cls, output_reshape = setup_lmde_problem(
+        generator=generator,
+        t_span=t_span,
+        y0=y0,
+        method=method,
+        input_frame=input_frame,
+        solver_frame=solver_frame,
+        output_frame=output_frame,
+        solver_cutoff_freq=solver_cutoff_freq,
+        batched_y0=batched_y0,
+    )
+    convert_output_state = lmde_output_state_converter(
+        generator.frame, output_frame, output_reshape, y0_cls
+    )
+
+    for time, y in solve_lmde_stream(generator, t_span, y, method, t_eval, kwargs):
+        yield time, convert_output_state(time, y)
+
+
+def solve_lmde_stream(
+    generator: BaseGeneratorModel,
+    t_span: Array,
+    y0: Array,
+    method: Optional[Union[str, OdeSolver]] = "DOP853",
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    kwargs: Optional[dict] = None,
+    output_func: Optional[Callable] = None,
+    trace_output_func: Optional[bool] = False,
+) -> Iterator[Tuple[float, Array]]:
+    """Helper function for solving an LMDE set up by :meth:`setup_lmde_problem` with the given
+    method, yielding the state in the solver frame and basis at each output time, i.e. each
+    of the times in ``results.t`` returned by :meth:`solve_lmde_in_solver_frame`.
+
+    The ``numpy`` based fixed step methods, ``'scipy_adaptive_expm'``, and the methods of
+    ``scipy.integrate.solve_ivp`` are stepped through ``t_span`` with a single solver, yielding
+    each state as soon as it has been computed. The yielded states are the same as those
+    returned by :meth:`solve_lmde_in_solver_frame`, but only the current state is kept in
+    memory. All other methods are solved with :meth:`solve_lmde_in_solver_frame`, after which
+    the states are yielded.
+
+    Args:
+        generator: The generator, as set up by :meth:`setup_lmde_problem`.
+        t_span: Interval to solve over.
+        y0: Initial state in the solver frame and basis.
+        method: Solving method to use.
+        t_eval: Times at which to yield the solution.
+        kwargs: Additional arguments to pass to the solver. Not modified.
+        output_func: Optional function ``output_func(t, y)``, whose values are yielded in place
+                     of the states.
+        trace_output_func: Whether ``output_func`` can be traced by ``jax``, in which case the
+                           methods ``'jax_expm'``, ``'jax_rk4'``, and ``'jax_magnus'`` evaluate
+                           it within the ``jax.lax.scan`` over the steps.
+
+    Yields:
+        tuple: The time and the state (or its output) at that time.
+
+    Returns:
+        OdeResult: Results object containing any information about the solve other than the
+        states, e.g. the number of function evaluations, or a dense output interpolant of the
+        states.
+    """
+    solver_generator, solver_rhs, solver_kwargs = setup_lmde_solver(generator, method, kwargs)
+
+    solver_iter = None
+    if method == "scipy_expm":
+        solver_iter = scipy_expm_solver_iter(
+            solver_generator, t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method == "scipy_adaptive_expm":
+        solver_iter = scipy_adaptive_expm_solver_iter(
+            solver_generator, t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method == "scipy_magnus":
+        solver_iter = scipy_magnus_solver_iter(
+            solver_generator, t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method == "scipy_expm_multiply":
+        solver_iter = scipy_expm_multiply_solver_iter(
+            solver_generator, t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method == "scipy_pwc_expm":
+        solver_iter = scipy_pwc_expm_solver_iter(
+            solver_generator, t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method == "scipy_rk4":
+        solver_iter = scipy_rk4_solver_iter(
+            dispatch.wrap(solver_rhs), t_span, y0, t_eval=t_eval, **solver_kwargs
+        )
+    elif method in SOLVE_IVP_METHODS or (inspect.isclass(method) and issubclass(method, OdeSolver)):
+        solver_iter = scipy_solve_ivp_iter(
+            dispatch.wrap(solver_rhs), t_span, y0, method, t_eval, **solver_kwargs
+        )
+
+    if solver_iter is not None:
+        while True:
+            try:
+                time, y = next(solver_iter)
+            except StopIteration as stop:
+                return stop.value
+
+            yield time, y if output_func is None else output_func(time, y)
+
+    kwargs = dict(kwargs or {})
+    if trace_output_func and output_func is not None and method in JAX_SCAN_METHODS:
+        kwargs["output_func"] = output_func
+        output_func = None
+
+    results = solve_lmde_in_solver_frame(generator, t_span, y0, method, t_eval, kwargs)
+    for time, y in zip(results.t, results.y):
+        yield time, Array(y) if output_func is None else output_func(time, Array(y))
+
+    del results["t"], results["y"]
+    return results
+
+
+def setup_lmde_problem(
+    generator: Union[Callable, BaseGeneratorModel],
+    t_span: Array,
+    y0: Union[Array, QuantumState, BaseOperator],
+    method: Optional[Union[str, OdeSolver]] = "DOP853",
+    input_frame: Optional[Union[str, Array]] = "auto",
+    solver_frame: Optional[Union[str, Array]] = "auto",
+    output_frame: Optional[Union[str, Array]] = "auto",
+    solver_cutoff_freq: Optional[float] = None,
+    batched_y0: Optional[bool] = False,
+) -> Tuple[BaseGeneratorModel, Frame, Array, Type, Callable]:
+    """Helper function for setting up the problem solved by :meth:`solve_lmde` and
+    :meth:`solve_lmde_iter`: the internally used generator, and the initial state in the solver
+    frame and basis.
+
+    Args:
+        generator: User-supplied generator.
+        t_span: Interval to solve over.
+        y0: User-supplied initial state.
+        method: Solving method to use.
+        input_frame: Input frame for the problem.
+        solver_frame: Frame to solve in.
+        output_frame: Output frame for the problem.
+        solver_cutoff_freq: Cutoff frequency to use when solving.
+        batched_y0: Whether or not ``y0`` is a stack of initial states.
+
+    Returns:
+        BaseGeneratorModel, Frame, Array, Type, Callable: internal generator, output frame,
+        initial state in the solver frame and basis, output state class, and function for
+        reshaping internal states into the shape of the input.
+
+    Raises:
+        QiskitError: If a batch of initial states is not specified as an array.
+    """
     y0, y0_cls = initial_state_converter(y0, return_class=True)
 
+    if batched_y0 and y0_cls is not None:
+        raise QiskitError("A batch of initial states must be specified as an array.")
+
+    # the generator is only piecewise constant outside of a rotating frame
+    if method == "scipy_pwc_expm" and isinstance(solver_frame, str) and solver_frame == "auto":
+        solver_frame = None
+
     # setup input frame, output frame, and the internal solver generator based on args
     input_frame, output_frame, generator = setup_lmde_frames_and_generator(
         input_generator=generator,
@@ -238,58 +659,139 @@ def solve_lmde(
 
     # store shape of y0, and reshape y0 if necessary
     return_shape = y0.shape
-    y0 = lmde_y0_reshape(generator_dim=generator(t_span[0]).shape[0], y0=y0)
+    if _is_matrix_lindblad_model(generator):
+        # the generator is not formed, and acts on vectorized density matrices
+        generator_dim = generator.operators[0].shape[-1] ** 2
+    else:
+        generator_dim = generator(t_span[0]).shape[0]
+    if batched_y0:
+        y0 = lmde_batch_y0_reshape(generator_dim=generator_dim, y0=y0)
+    else:
+        y0 = lmde_y0_reshape(generator_dim=generator_dim, y0=y0)
+
+    # function for reshaping internal states back into the shape of the input
+    def output_reshape(y):
+        if batched_y0:
+            return lmde_batch_output_reshape(generator_dim, y, return_shape)
+        return y.reshape(return_shape, order="F")
 
     # map y0 from input frame into solver frame and basis
     y0 = input_frame.state_out_of_frame(t_span[0], y0)
     y0 = generator.frame.state_into_frame(t_span[0], y0, return_in_frame_basis=True)
 
-    # define rhs functions in frame basis
-    def solver_generator(t):
-        return generator(t, in_frame_basis=True)
+    return generator, output_frame, y0, y0_cls, output_reshape
 
-    def solver_rhs(t, y):
-        return generator(t, y, in_frame_basis=True)
+
+def solve_lmde_in_solver_frame(
+    generator: BaseGeneratorModel,
+    t_span: Array,
+    y0: Array,
+    method: Optional[Union[str, OdeSolver]] = "DOP853",
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    kwargs: Optional[dict] = None,
+) -> OdeResult:
+    """Helper function for solving an LMDE set up by :meth:`setup_lmde_problem` with the given
+    method, with states in the solver frame and basis.
+
+    Args:
+        generator: The generator, as set up by :meth:`setup_lmde_problem`.
+        t_span: Interval to solve over.
+        y0: Initial state in the solver frame and basis.
+        method: Solving method to use.
+        t_eval: Times at which to return the solution.
+        kwargs: Additional arguments to pass to the solver. Not modified.
+
+    Returns:
+        OdeResult: Results object, with states in the solver frame and basis.
+    """
+    solver_generator, solver_rhs, kwargs = setup_lmde_solver(generator, method, kwargs)
 
     if method == "scipy_expm":
         results = scipy_expm_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
     elif method == "jax_expm":
         results = jax_expm_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "scipy_expm_parallel":
+        results = scipy_expm_parallel_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "jax_expm_parallel":
+        results = jax_expm_parallel_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "scipy_adaptive_expm":
+        results = scipy_adaptive_expm_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "scipy_magnus":
+        results = scipy_magnus_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "jax_magnus":
+        results = jax_magnus_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "scipy_expm_multiply":
+        results = scipy_expm_multiply_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
+    elif method == "scipy_pwc_expm":
+        results = scipy_pwc_expm_solver(solver_generator, t_span, y0, t_eval=t_eval, **kwargs)
     else:
         # method is not LMDE-specific, so pass to solve_ode using rhs
         results = solve_ode(solver_rhs, t_span, y0, method=method, t_eval=t_eval, **kwargs)
 
-    # convert any states in results to correct basis/frame
-    output_states = None
+    return results
 
-    # pylint: disable=too-many-boolean-expressions
-    if (
-        results.y.backend == "jax"
-        and (generator.frame.frame_diag is None or generator.frame.frame_diag.backend == "jax")
-        and (output_frame.frame_diag is None or output_frame.frame_diag.backend == "jax")
-        and y0_cls is None
-    ):
-        # if all relevant objects are jax-compatible, run jax-customized version
-        output_states = _jax_lmde_output_state_converter(
-            results.t, results.y, generator.frame, output_frame, return_shape, y0_cls
-        )
-    else:
-        output_states = []
-        for idx in range(len(results.y)):
-            time = results.t[idx]
-            out_y = results.y[idx]
 
-            # transform out of solver frame/basis into output frame
-            out_y = generator.frame.state_out_of_frame(time, out_y, y_in_frame_basis=True)
-            out_y = output_frame.state_into_frame(time, out_y)
+def setup_lmde_solver(
+    generator: BaseGeneratorModel,
+    method: Optional[Union[str, OdeSolver]] = "DOP853",
+    kwargs: Optional[dict] = None,
+) -> Tuple[Callable, Callable, dict]:
+    """Helper function for setting up the functions and arguments passed to the solver for an
+    LMDE set up by :meth:`setup_lmde_problem`.
 
-            # reshape to match input shape if necessary
-            out_y = final_state_converter(out_y.reshape(return_shape, order="F").data, y0_cls)
-            output_states.append(out_y)
+    Args:
+        generator: The generator, as set up by :meth:`setup_lmde_problem`.
+        method: Solving method to use.
+        kwargs: User-supplied solver arguments. Not modified.
 
-    results.y = output_states
+    Returns:
+        Callable, Callable, dict: The generator and rhs functions in the frame basis, and the
+        solver arguments.
 
-    return results
+    Raises:
+        QiskitError: If the method computes dense matrix exponentials and the generator is a
+                     model in sparse evaluation mode.
+    """
+    kwargs = dict(kwargs or {})
+
+    # define rhs functions in frame basis
+    def solver_generator(t):
+        return generator(t, in_frame_basis=True)
+
+    def solver_rhs(t, y):
+        return generator(t, y, in_frame_basis=True)
+
+    if method in DENSE_EXPM_METHODS:
+        # matrix exponentials are computed with dense linear algebra
+        if _is_sparse_model(generator):
+            raise QiskitError(
+                "Method {} does not support models in sparse evaluation mode. ".format(method)
+                + "Use one of the methods 'scipy_expm_multiply', "
+                + "{}, or a dense evaluation mode.".format(
+                    ", ".join("'{}'".format(name) for name in SOLVE_IVP_METHODS)
+                )
+            )
+
+        # exponentials of anti-Hermitian generators can be computed via eigendecomposition
+        kwargs.setdefault("anti_hermitian", isinstance(generator, HamiltonianModel))
+
+    # models built from operators and signals can be evaluated on a whole grid of times at once
+    if method in ["scipy_expm", "scipy_expm_parallel"]:
+        kwargs.setdefault(
+            "vectorized_generator",
+            isinstance(generator, GeneratorModel)
+            and generator.evaluation_mode in ["dense", "dense_vectorized"]
+            and not _is_matrix_lindblad_model(generator),
+        )
+
+    if method == "scipy_pwc_expm":
+        kwargs = setup_pwc_solver_kwargs(generator, kwargs)
+
+    # solve_ivp methods using a Jacobian (or a real embedding) can use the generator
+    if method in JAC_METHODS and not _is_matrix_lindblad_model(generator):
+        kwargs.setdefault("generator", solver_generator)
+
+    return solver_generator, solver_rhs, kwargs
 
 
 def setup_lmde_frames_and_generator(
@@ -339,9 +841,15 @@ def setup_lmde_frames_and_generator(
         generator.frame = None
 
         if isinstance(generator, HamiltonianModel):
-            generator.frame = -1j * generator.drift
+            frame_operator = -1j * generator.drift
         else:
-            generator.frame = anti_herm_part(generator.drift)
+            frame_operator = anti_herm_part(generator.drift)
+
+        # diagonalizing the drift would densify the operators of a sparse model
+        if _is_sparse_model(generator):
+            frame_operator = _diagonal_or_none(frame_operator)
+
+        generator.frame = frame_operator
     else:
         generator.frame = Frame(solver_frame)
 
@@ -350,6 +858,46 @@ def setup_lmde_frames_and_generator(
     return input_frame, output_frame, generator
 
 
+def setup_pwc_solver_kwargs(generator: BaseGeneratorModel, kwargs: dict) -> dict:
+    """Helper function for setting up the arguments of the ``'scipy_pwc_expm'`` method
+    of :meth:`solve_lmde`.
+
+    If the sample grid is not given in ``kwargs``, it is taken from the signals of the
+    generator, in which case the signal envelopes are used as the keys for caching matrix
+    exponentials.
+
+    Args:
+        generator: The generator, as set up by :meth:`setup_lmde_frames_and_generator`.
+        kwargs: User-supplied solver arguments.
+
+    Returns:
+        dict: Solver arguments.
+
+    Raises:
+        QiskitError: If the generator is not piecewise constant or the sample grid cannot be
+                     determined.
+    """
+    kwargs = dict(kwargs)
+
+    if generator.frame.frame_operator is not None:
+        raise QiskitError("scipy_pwc_expm requires the solver frame to be None.")
+
+    signals = getattr(generator, "signals", None)
+    if isinstance(generator, GeneratorModel) and signals is not None:
+        if np.any(Array(signals.carrier_freqs, backend="numpy").data != 0.0):
+            raise QiskitError("scipy_pwc_expm requires all carrier frequencies to be 0.")
+
+        if "dt" not in kwargs and signals.dt is not None:
+            kwargs["dt"] = signals.dt
+            kwargs["start_time"] = signals.start_time
+            kwargs.setdefault("cache_key", signals.envelope_value)
+
+    if "dt" not in kwargs:
+        raise QiskitError("scipy_pwc_expm requires the sample duration dt.")
+
+    return kwargs
+
+
 def lmde_y0_reshape(generator_dim: int, y0: Array) -> Array:
     """Either: G(t)y0 is already well defined, or we assume that y0 is the input state of
     the more general form of lmde f(t, y) with f linear in y, and we assume the generator
@@ -375,6 +923,209 @@ def lmde_y0_reshape(generator_dim: int, y0: Array) -> Array:
     return y0
 
 
+def lmde_batch_y0_reshape(generator_dim: int, y0: Array) -> Array:
+    """Combine a batch of initial states into a single state for a batched solve.
+
+    The first axis of ``y0`` is assumed to index the batch. Each state in the batch is
+    interpreted as in :meth:`lmde_y0_reshape`, i.e. it is vectorized in column stacking
+    convention if it is not already of a shape compatible with the generator. The states
+    are then stacked as the columns of a single 2d array, so that the generator acts on all of
+    them with a single matrix-matrix product.
+
+    Args:
+        generator_dim: dimension of the generator
+        y0: batch of input states
+
+    Return:
+        y0: The batch of states combined into a single 2d array.
+
+    Raises:
+        QiskitError: If shape of the states in y0 does not conform to any interpretation of the
+                     generator dim.
+    """
+
+    batch_size = y0.shape[0]
+    state_shape = y0.shape[1:]
+
+    if len(state_shape) == 0:
+        raise QiskitError("y0.shape is incompatible with specified generator.")
+
+    if state_shape[0] != generator_dim:
+        if len(state_shape) == 2 and state_shape[0] * state_shape[1] == generator_dim:
+            # column stacking vectorization of each state
+            y0 = y0.transpose((0, 2, 1)).reshape((batch_size, generator_dim))
+        else:
+            raise QiskitError("y0.shape is incompatible with specified generator.")
+
+    return np.moveaxis(y0, 0, 1).reshape((generator_dim, -1))
+
+
+def lmde_batch_output_reshape(generator_dim: int, y: Array, batch_shape: Tuple) -> Array:
+    """Inverse of :meth:`lmde_batch_y0_reshape`, splitting a single state into a batch
+    of states of shape ``batch_shape``.
+
+    Args:
+        generator_dim: dimension of the generator
+        y: single 2d state whose columns contain the batch
+        batch_shape: shape of the batch of input states
+
+    Return:
+        Array: The batch of states.
+    """
+    batch_size = batch_shape[0]
+    state_shape = batch_shape[1:]
+
+    if state_shape[0] != generator_dim:
+        # undo the column stacking vectorization
+        y = y.transpose().reshape((batch_size, state_shape[1], state_shape[0]))
+        return y.transpose((0, 2, 1))
+
+    return np.moveaxis(y.reshape((generator_dim, batch_size) + state_shape[1:]), 1, 0)
+
+
+def lmde_output_state_converter(
+    solver_frame: Frame, output_frame: Frame, output_reshape: Callable, y0_cls: Optional[Type]
+) -> Callable:
+    """Helper function constructing the conversion of states of :meth:`solve_lmde` from the
+    solver frame and basis into the output frame and format.
+
+    Args:
+        solver_frame: Frame of the solver.
+        output_frame: Frame to be converted to.
+        output_reshape: Function for reshaping output states.
+        y0_cls: Output state return class.
+
+    Returns:
+        Callable: Function ``convert_output_state(time, y)``.
+    """
+
+    def convert_output_state(time, out_y):
+        # transform out of solver frame/basis into output frame
+        out_y = solver_frame.state_out_of_frame(time, out_y, y_in_frame_basis=True)
+        out_y = output_frame.state_into_frame(time, out_y)
+
+        # reshape to match input shape if necessary
+        return final_state_converter(output_reshape(out_y).data, y0_cls)
+
+    return convert_output_state
+
+
+def lmde_observables_reducer(
+    observables: Union[List, Array, Callable],
+    solver_frame: Frame,
+    output_frame: Frame,
+    output_reshape: Callable,
+    y0_cls: Optional[Type],
+    batched_y0: Optional[bool] = False,
+) -> Callable:
+    """Helper function constructing the reduction of states of :meth:`solve_lmde`, in the solver
+    frame and basis, to the values of ``observables``.
+
+    Args:
+        observables: List of operators, or function ``observables(t, y)`` of output states.
+        solver_frame: Frame of the solver.
+        output_frame: Output frame.
+        output_reshape: Function for reshaping output states.
+        y0_cls: Output state return class.
+        batched_y0: Whether or not the states are a batch of states.
+
+    Returns:
+        Callable: Function ``reduce_state(time, y)``.
+    """
+    if callable(observables):
+        convert_output_state = lmde_output_state_converter(
+            solver_frame, output_frame, output_reshape, y0_cls
+        )
+
+        def reduce_state(time, y):
+            return observables(time, convert_output_state(time, y))
+
+        return reduce_state
+
+    observables = to_array(observables)
+
+    # if the frames agree, the output state is the solver state in the standard basis
+    if _frames_equal(solver_frame, output_frame):
+
+        # pylint: disable=unused-argument
+        def reduce_state(time, y):
+            y = output_reshape(solver_frame.state_out_of_frame_basis(y))
+            return expectation_values(observables, y, batched=batched_y0)
+
+        return reduce_state
+
+    convert_output_state = lmde_output_state_converter(
+        solver_frame, output_frame, output_reshape, None
+    )
+
+    def reduce_state(time, y):
+        return expectation_values(observables, convert_output_state(time, y), batched=batched_y0)
+
+    return reduce_state
+
+
+def expectation_values(observables: Array, y: Array, batched: Optional[bool] = False) -> Array:
+    r"""Compute the expectation values of a list of operators :math:`O_k` of dimension
+    :math:`d` in a state :math:`y`. The type of state is determined by its shape:
+
+        - shape ``(d,)``: a pure state, with expectation values :math:`y^\dagger O_k y`,
+        - shape ``(d, d)``: a density matrix, with expectation values :math:`Tr(O_k y)`, or
+        - shape ``(d**2,)``: a density matrix vectorized in column stacking convention.
+
+    Args:
+        observables: Array of operators of shape ``(k, d, d)``.
+        y: State.
+        batched: Whether or not ``y`` is a batch of states indexed by the first axis.
+
+    Returns:
+        Array: Expectation values, with the last axis indexing the observables.
+
+    Raises:
+        QiskitError: If the shape of the state is incompatible with the observables.
+    """
+    observables = Array(observables).data
+    y = Array(y).data
+    dim = observables.shape[-1]
+    state_shape = y.shape[1:] if batched else y.shape
+
+    if state_shape == (dim,):
+        return Array(np.einsum("...i,kij,...j->...k", y.conj(), observables, y))
+    if state_shape == (dim, dim):
+        return Array(np.einsum("kij,...ji->...k", observables, y))
+    if state_shape == (dim ** 2,):
+        # reshaping a column stacked vector in row-major order gives the transpose
+        rho_t = y.reshape(y.shape[:-1] + (dim, dim))
+        return Array(np.einsum("kij,...ij->...k", observables, rho_t))
+
+    raise QiskitError("State shape is incompatible with the shape of the observables.")
+
+
+def _is_sparse_model(generator: BaseGeneratorModel) -> bool:
+    """Check whether a generator is a :class:`GeneratorModel` evaluated as a sparse matrix."""
+    return (
+        isinstance(generator, GeneratorModel)
+        and generator.evaluation_mode in ["sparse", "sparse_vectorized"]
+        and not _is_matrix_lindblad_model(generator)
+    )
+
+
+def _is_matrix_lindblad_model(generator: BaseGeneratorModel) -> bool:
+    """Check whether a generator is a :class:`LindbladModel` in a matrix evaluation mode."""
+    return isinstance(generator, LindbladModel) and generator.evaluation_mode in ["dense", "sparse"]
+
+
+def _frames_equal(frame_a: Frame, frame_b: Frame) -> bool:
+    """Check whether two frames are the same."""
+    if frame_a.frame_diag is None or frame_b.frame_diag is None:
+        return frame_a.frame_diag is None and frame_b.frame_diag is None
+
+    return (
+        frame_a.frame_diag.shape == frame_b.frame_diag.shape
+        and np.allclose(frame_a.frame_diag, frame_b.frame_diag)
+        and np.allclose(frame_a.frame_basis, frame_b.frame_basis)
+    )
+
+
 def anti_herm_part(mat: Array) -> Array:
     """Get the anti-hermitian part of an operator."""
     if mat is None:
@@ -433,13 +1184,46 @@ def final_state_converter(obj: Any, cls: Optional[Type] = None) -> Any:
     return cls(obj)
 
 
+def _batched_lmde_output_state_converter(
+    times: Array,
+    ys: Array,
+    solver_frame: Frame,
+    output_frame: Frame,
+    output_reshape: Callable,
+    y0_cls: object,
+) -> Union[List, Array]:
+    """Output state converter for solve_lmde, transforming all states out of the solver frame
+    and into the output frame in a single vectorized pass.
+
+    Args:
+        times: Array of times.
+        ys: Array of output states.
+        solver_frame: Frame of the solver (that the ys are specified in).
+        output_frame: Frame to be converted to.
+        output_reshape: Function for reshaping output states.
+        y0_cls: Output state return class.
+
+    Returns:
+        Union[List, Array]: output states
+    """
+    times = Array(times, backend="numpy").data
+    ys = solver_frame.state_out_of_frame(times, Array(ys), y_in_frame_basis=True)
+    ys = output_frame.state_into_frame(times, ys)
+
+    output_states = [final_state_converter(Array(output_reshape(y)).data, y0_cls) for y in ys]
+    if y0_cls is None:
+        return Array(output_states)
+
+    return output_states
+
+
 @requires_backend("jax")
 def _jax_lmde_output_state_converter(
     times: Array,
     ys: Array,
     solver_frame: Frame,
     output_frame: Frame,
-    return_shape: Tuple,
+    output_reshape: Callable,
     y0_cls: object,
 ) -> Union[List, Array]:
     """Jax control-flow based output state converter for solve_lmde.
@@ -450,7 +1234,7 @@ def _jax_lmde_output_state_converter(
         solver_frame: Frame of the solver (that the ys are specified in). Assumed
                       to be implemented with Jax backend.
         output_frame: Frame to be converted to.
-        return_shape: Shape for output states.
+        output_reshape: Function for reshaping output states.
         y0_cls: Output state return class.
 
     Returns:
@@ -461,7 +1245,7 @@ def _jax_lmde_output_state_converter(
         time, out_y = x
         out_y = solver_frame.state_out_of_frame(time, out_y, y_in_frame_basis=True)
         out_y = output_frame.state_into_frame(time, out_y)
-        out_y = out_y.reshape(return_shape, order="F").data
+        out_y = output_reshape(out_y).data
         return None, out_y
 
     # scan, ensuring that the times and ys are in fact an Array
@@ -17,6 +17,18 @@ Wrappers for calling differential equations solvers,
 providing standardized method signatures and return types.
 """
 
-from .fixed_step_solvers import scipy_expm_solver, jax_expm_solver
+from .fixed_step_solvers import (
+    scipy_expm_solver,
+    jax_expm_solver,
+    scipy_expm_parallel_solver,
+    jax_expm_parallel_solver,
+    scipy_rk4_solver,
+    jax_rk4_solver,
+    scipy_magnus_solver,
+    jax_magnus_solver,
+    scipy_expm_multiply_solver,
+    scipy_pwc_expm_solver,
+)
+from .adaptive_step_solvers import scipy_adaptive_expm_solver
 from .jax_odeint import jax_odeint
 from .scipy_solve_ivp import scipy_solve_ivp
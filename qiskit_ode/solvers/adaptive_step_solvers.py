@@ -0,0 +1,204 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+# pylint: disable=invalid-name
+
+"""
+Custom adaptive step solvers.
+"""
+
+from typing import Callable, Optional, Union, Tuple, List, Iterator
+import numpy as np
+from scipy.integrate._ivp.ivp import OdeResult
+from scipy.linalg import expm
+
+from qiskit import QiskitError
+from qiskit_ode.dispatch import Array
+
+from .fixed_step_solvers import expm_anti_hermitian
+from .solver_utils import merge_t_args, output_time_mask, collect_solver_iter
+
+# step size controller parameters
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+
+
+def scipy_adaptive_expm_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    rtol: Optional[float] = 1e-8,
+    atol: Optional[float] = 1e-8,
+    first_step: Optional[float] = None,
+    max_dt: Optional[float] = None,
+    anti_hermitian: Optional[bool] = False,
+):
+    r"""Adaptive step size matrix exponential based solver implemented with
+    ``scipy.linalg.expm``.
+
+    Each step is taken using the fourth order Magnus expansion (see
+    :meth:`~qiskit_ode.solvers.fixed_step_solvers.magnus_exponent`), computed from the generator
+    :math:`G_1, G_2` evaluated at the two Gauss-Legendre nodes of the step. The local error is
+    estimated by comparing to the second order exponent :math:`\frac{h}{2}(G_1 + G_2)` built
+    from the same generator evaluations, and the step size is adjusted so that the error
+    estimate satisfies
+
+    .. math::
+
+        \sqrt{\frac{1}{n}\sum_i
+        \left(\frac{|e_i|}{\texttt{atol} + \texttt{rtol}\max(|y_i|, |y_{new, i}|)}\right)^2} < 1,
+
+    in the same manner as the methods of ``scipy.integrate.solve_ivp``. Steps are truncated
+    so as to land exactly on the points in ``t_eval``.
+
+    The returned :class:`OdeResult` additionally contains the number of generator evaluations
+    ``nfev``, the number of accepted steps ``n_steps``, and the number of rejected steps
+    ``n_rejected``.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        t_eval: Optional list of time points at which to return the solution.
+        rtol: Relative tolerance.
+        atol: Absolute tolerance.
+        first_step: Size of the first step. If ``None``, the step is chosen so that the
+                    exponent has norm approximately ``1``, and then adjusted by the step size
+                    controller.
+        max_dt: Optional maximum step size.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+
+    Returns:
+        OdeResult: Results object.
+
+    Raises:
+        QiskitError: If the required step size falls below the floating point resolution
+                     of the current time.
+    """
+
+    return collect_solver_iter(
+        scipy_adaptive_expm_solver_iter(
+            generator,
+            t_span,
+            y0,
+            t_eval=t_eval,
+            rtol=rtol,
+            atol=atol,
+            first_step=first_step,
+            max_dt=max_dt,
+            anti_hermitian=anti_hermitian,
+        )
+    )
+
+
+def scipy_adaptive_expm_solver_iter(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    rtol: Optional[float] = 1e-8,
+    atol: Optional[float] = 1e-8,
+    first_step: Optional[float] = None,
+    max_dt: Optional[float] = None,
+    anti_hermitian: Optional[bool] = False,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_adaptive_expm_solver`, yielding the solution at each
+    output time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_adaptive_expm_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+
+    Returns:
+        OdeResult: The number of generator evaluations, accepted steps, and rejected steps.
+
+    Raises:
+        QiskitError: If the required step size falls below the floating point resolution
+                     of the current time.
+    """
+
+    expm_func = expm_anti_hermitian if anti_hermitian else expm
+
+    def eval_generator(t):
+        return Array(generator(t)).data
+
+    t_list = np.array(merge_t_args(Array(t_span, backend="numpy").data, t_eval))
+    is_output = output_time_mask(t_list, t_span, t_eval)
+    direction = np.sign(t_list[-1] - t_list[0])
+
+    y = Array(y0).data
+    t = t_list[0]
+
+    nfev = 0
+    if first_step is None:
+        gen_norm = np.linalg.norm(eval_generator(t))
+        nfev += 1
+        h_abs = 1.0 / gen_norm if gen_norm > 0 else np.abs(t_list[-1] - t_list[0])
+    else:
+        h_abs = np.abs(first_step)
+
+    if max_dt is not None:
+        h_abs = min(h_abs, max_dt)
+
+    c = np.sqrt(3) / 6
+    n_steps, n_rejected = 0, 0
+    if is_output[0]:
+        yield t, Array(y)
+
+    for idx in range(1, len(t_list)):
+        t_end = t_list[idx]
+        while direction * (t_end - t) > 0:
+            min_step = 10 * np.abs(np.nextafter(t, direction * np.inf) - t)
+            if h_abs < min_step:
+                raise QiskitError("Required step size is less than spacing between numbers.")
+
+            # truncate the step to land on t_end, absorbing any floating point remainder
+            truncated = h_abs + min_step >= np.abs(t_end - t)
+            step_abs = np.abs(t_end - t) if truncated else h_abs
+            h = direction * step_abs
+
+            gen1 = eval_generator(t + (0.5 - c) * h)
+            gen2 = eval_generator(t + (0.5 + c) * h)
+            nfev += 2
+
+            omega2 = 0.5 * h * (gen1 + gen2)
+            omega4 = omega2 + (np.sqrt(3) / 12) * h * h * (gen2 @ gen1 - gen1 @ gen2)
+
+            y_new = expm_func(omega4) @ y
+            error = y_new - expm_func(omega2) @ y
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            error_norm = np.sqrt(np.mean(np.abs(error / scale) ** 2))
+
+            if error_norm < 1:
+                t = t_end if truncated else t + h
+                y = y_new
+                n_steps += 1
+
+                # a truncated step gives no information about the proposed step size
+                if not truncated:
+                    factor = MAX_FACTOR
+                    if error_norm > 0:
+                        factor = min(MAX_FACTOR, SAFETY * error_norm ** (-1 / 3))
+                    h_abs = step_abs * factor
+            else:
+                n_rejected += 1
+                h_abs = step_abs * max(MIN_FACTOR, SAFETY * error_norm ** (-1 / 3))
+
+            if max_dt is not None:
+                h_abs = min(h_abs, max_dt)
+
+        if is_output[idx]:
+            yield t_end, Array(y)
+
+    return OdeResult(nfev=nfev, n_steps=n_steps, n_rejected=n_rejected)
@@ -15,21 +15,26 @@
 Custom fixed step solvers.
 """
 
-from typing import Callable, Optional, Union, Tuple, List
+from typing import Callable, Optional, Union, Tuple, List, Iterator
 import numpy as np
 from scipy.integrate._ivp.ivp import OdeResult
 from scipy.linalg import expm
+from scipy.sparse import issparse
+from scipy.sparse.linalg import expm_multiply
 
+from qiskit import QiskitError
 from qiskit_ode.dispatch import requires_backend, Array
 
 try:
     import jax.numpy as jnp
-    from jax.lax import scan, cond
+    from jax import vmap
+    from jax.lax import scan, associative_scan, cond
     from jax.scipy.linalg import expm as jexpm
+    from jax.numpy.linalg import eigh as jeigh
 except ImportError:
     pass
 
-from .solver_utils import merge_t_args, trim_t_results
+from .solver_utils import merge_t_args, trim_t_results, output_time_mask, collect_solver_iter
 
 
 def scipy_expm_solver(
@@ -38,27 +43,108 @@ def scipy_expm_solver(
     y0: Array,
     max_dt: float,
     t_eval: Optional[Union[Tuple, List, Array]] = None,
+    anti_hermitian: Optional[bool] = False,
+    vectorized_generator: Optional[bool] = False,
+    chunk_size: Optional[int] = 64,
 ):
     """Fixed-step size matrix exponential based solver implemented with
     ``scipy.linalg.expm``. Solves the specified problem by taking steps of
     size no larger than ``max_dt``.
 
+    If ``vectorized_generator`` is ``True``, the steps are processed in chunks of
+    ``chunk_size`` steps: the generator is evaluated at the midpoints of all steps in a chunk
+    with a single call, and the step propagators of the chunk are computed as a single batch
+    of matrix exponentials. See :meth:`get_step_propagators`. The memory used for the
+    propagators is bounded by ``chunk_size`` matrices.
+
     Args:
         generator: Callable, either a generator rhs
         t_span: Interval to solve over.
         y0: Initial state.
         max_dt: Maximum step size.
         t_eval: Optional list of time points at which to return the solution.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+        vectorized_generator: Whether ``generator`` accepts a 1d array of times, returning
+                              a 3d array of generators.
+        chunk_size: Number of steps whose propagators are computed together if
+                    ``vectorized_generator`` is ``True``.
 
     Returns:
         OdeResult: Results object.
     """
 
+    return collect_solver_iter(
+        scipy_expm_solver_iter(
+            generator,
+            t_span,
+            y0,
+            max_dt,
+            t_eval=t_eval,
+            anti_hermitian=anti_hermitian,
+            vectorized_generator=vectorized_generator,
+            chunk_size=chunk_size,
+        )
+    )
+
+
+def scipy_expm_solver_iter(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    anti_hermitian: Optional[bool] = False,
+    vectorized_generator: Optional[bool] = False,
+    chunk_size: Optional[int] = 64,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_expm_solver`, yielding the solution at each output
+    time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_expm_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    expm_func = expm_anti_hermitian if anti_hermitian else expm
+
+    if vectorized_generator:
+        y = Array(y0).data
+
+        t_list, h_list, n_steps_list = get_fixed_step_sizes(t_span, t_eval, max_dt)
+        step_times, step_sizes, interval_end_idx = get_fixed_step_schedule(
+            t_list, h_list, n_steps_list
+        )
+        is_output = output_time_mask(t_list, t_span, t_eval)
+
+        # index into t_list of the time reached after each step, if it ends an interval
+        reached_idx = np.zeros(len(step_times), dtype=int)
+        reached_idx[interval_end_idx] = np.arange(1, len(t_list))
+
+        if is_output[0]:
+            yield t_list[0], Array(y)
+
+        for chunk_start in range(0, len(step_times), chunk_size):
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            propagators = get_step_propagators(
+                generator,
+                step_times[chunk],
+                step_sizes[chunk],
+                expm_func,
+                vectorized_generator=True,
+            )
+            for propagator, idx in zip(propagators, reached_idx[chunk]):
+                y = propagator @ y
+                if idx > 0 and is_output[idx]:
+                    yield t_list[idx], Array(y)
+
+        return
+
     def take_step(generator, t0, y, h):
         eval_time = t0 + (h / 2)
-        return expm(generator(eval_time) * h) @ y
+        return expm_func(generator(eval_time) * h) @ y
 
-    return fixed_step_solver_template(
+    yield from fixed_step_solver_template_iter(
         take_step, rhs_func=generator, t_span=t_span, y0=y0, max_dt=max_dt, t_eval=t_eval
     )
 
@@ -70,6 +156,8 @@ def jax_expm_solver(
     y0: Array,
     max_dt: float,
     t_eval: Optional[Union[Tuple, List, Array]] = None,
+    anti_hermitian: Optional[bool] = False,
+    output_func: Optional[Callable] = None,
 ):
     """Fixed-step size matrix exponential based solver implemented with ``jax``.
     Solves the specified problem by taking steps of size no larger than ``max_dt``.
@@ -80,20 +168,503 @@ def jax_expm_solver(
         y0: Initial state.
         max_dt: Maximum step size.
         t_eval: Optional list of time points at which to return the solution.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+        output_func: Optional function ``output_func(t, y)`` applied to the state at each
+                     output time within the ``jax.lax.scan``, whose values are returned in
+                     ``results.y`` in place of the states. Must be ``jax``-transformable.
 
     Returns:
         OdeResult: Results object.
     """
 
+    expm_func = jax_expm_anti_hermitian if anti_hermitian else jexpm
+
     def take_step(generator, t, y, h):
         eval_time = t + (h / 2)
-        return jexpm(generator(eval_time) * h) @ y
+        return expm_func(generator(eval_time) * h) @ y
+
+    return fixed_step_solver_template_jax(
+        take_step,
+        rhs_func=generator,
+        t_span=t_span,
+        y0=y0,
+        max_dt=max_dt,
+        t_eval=t_eval,
+        output_func=output_func,
+    )
+
+
+def scipy_rk4_solver(
+    rhs: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+):
+    """Fixed-step size classical fourth order Runge-Kutta solver implemented with ``numpy``.
+    Solves the specified problem by taking steps of size no larger than ``max_dt``.
+
+    Args:
+        rhs: Callable, the rhs function ``f(t, y)``.
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    return collect_solver_iter(scipy_rk4_solver_iter(rhs, t_span, y0, max_dt, t_eval=t_eval))
+
+
+def scipy_rk4_solver_iter(
+    rhs: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_rk4_solver`, yielding the solution at each output
+    time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_rk4_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    yield from fixed_step_solver_template_iter(
+        rk4_step, rhs_func=rhs, t_span=t_span, y0=y0, max_dt=max_dt, t_eval=t_eval
+    )
+
+
+@requires_backend("jax")
+def jax_rk4_solver(
+    rhs: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    output_func: Optional[Callable] = None,
+):
+    """Fixed-step size classical fourth order Runge-Kutta solver implemented with ``jax``.
+    Solves the specified problem by taking steps of size no larger than ``max_dt``.
+
+    Args:
+        rhs: Callable, the rhs function ``f(t, y)``.
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+        output_func: Optional function ``output_func(t, y)`` applied to the state at each
+                     output time within the ``jax.lax.scan``, whose values are returned in
+                     ``results.y`` in place of the states. Must be ``jax``-transformable.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    return fixed_step_solver_template_jax(
+        rk4_step,
+        rhs_func=rhs,
+        t_span=t_span,
+        y0=y0,
+        max_dt=max_dt,
+        t_eval=t_eval,
+        output_func=output_func,
+    )
+
+
+def scipy_magnus_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    order: Optional[int] = 4,
+    anti_hermitian: Optional[bool] = False,
+):
+    """Fixed-step size Magnus expansion based solver implemented with
+    ``scipy.linalg.expm``. Solves the specified problem by taking steps of
+    size no larger than ``max_dt``, with each step given by the exponential of a truncated
+    Magnus expansion of order ``2``, ``4``, or ``6``, computed from generator evaluations at
+    Gauss-Legendre nodes. See :meth:`magnus_exponent` for details.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+        order: Order of the Magnus expansion.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    return collect_solver_iter(
+        scipy_magnus_solver_iter(
+            generator,
+            t_span,
+            y0,
+            max_dt,
+            t_eval=t_eval,
+            order=order,
+            anti_hermitian=anti_hermitian,
+        )
+    )
+
+
+def scipy_magnus_solver_iter(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    order: Optional[int] = 4,
+    anti_hermitian: Optional[bool] = False,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_magnus_solver`, yielding the solution at each output
+    time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_magnus_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    expm_func = expm_anti_hermitian if anti_hermitian else expm
+    validate_magnus_order(order)
+
+    def take_step(generator, t0, y, h):
+        return expm_func(magnus_exponent(generator, t0, h, order)) @ y
+
+    yield from fixed_step_solver_template_iter(
+        take_step, rhs_func=generator, t_span=t_span, y0=y0, max_dt=max_dt, t_eval=t_eval
+    )
+
+
+@requires_backend("jax")
+def jax_magnus_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    order: Optional[int] = 4,
+    anti_hermitian: Optional[bool] = False,
+    output_func: Optional[Callable] = None,
+):
+    """Fixed-step size Magnus expansion based solver implemented with ``jax``.
+    See :meth:`scipy_magnus_solver` for details.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+        order: Order of the Magnus expansion.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+        output_func: Optional function ``output_func(t, y)`` applied to the state at each
+                     output time within the ``jax.lax.scan``, whose values are returned in
+                     ``results.y`` in place of the states. Must be ``jax``-transformable.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    expm_func = jax_expm_anti_hermitian if anti_hermitian else jexpm
+    validate_magnus_order(order)
+
+    def take_step(generator, t, y, h):
+        return expm_func(magnus_exponent(generator, t, h, order)) @ y
 
     return fixed_step_solver_template_jax(
+        take_step,
+        rhs_func=generator,
+        t_span=t_span,
+        y0=y0,
+        max_dt=max_dt,
+        t_eval=t_eval,
+        output_func=output_func,
+    )
+
+
+def scipy_expm_parallel_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    anti_hermitian: Optional[bool] = False,
+    vectorized_generator: Optional[bool] = False,
+):
+    """Parallel-in-time version of :meth:`scipy_expm_solver`. As the propagator for each
+    step depends only on the step time, the propagators for all steps are computed together
+    as a single batch of matrix exponentials, and the propagators over each interval in
+    ``t_eval`` are combined using a tree-structured product, with each level of the tree
+    computed as a single batched matrix multiplication.
+
+    Note that, relative to :meth:`scipy_expm_solver`, this requires storing the propagators
+    for all steps in memory simultaneously.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+        vectorized_generator: Whether ``generator`` accepts a 1d array of times, returning
+                              a 3d array of generators.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    expm_func = expm_anti_hermitian if anti_hermitian else expm
+
+    y0 = Array(y0).data
+
+    t_list, h_list, n_steps_list = get_fixed_step_sizes(t_span, t_eval, max_dt)
+    step_times, step_sizes, interval_end_idx = get_fixed_step_schedule(t_list, h_list, n_steps_list)
+
+    propagators = get_step_propagators(
+        generator, step_times, step_sizes, expm_func, vectorized_generator=vectorized_generator
+    )
+
+    ys = [y0]
+    interval_start_idx = np.append(0, interval_end_idx[:-1] + 1)
+    for start, end in zip(interval_start_idx, interval_end_idx):
+        ys.append(tree_product(propagators[start : end + 1]) @ ys[-1])
+    ys = Array(ys)
+
+    results = OdeResult(t=t_list, y=ys)
+
+    return trim_t_results(results, t_span, t_eval)
+
+
+@requires_backend("jax")
+def jax_expm_parallel_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    anti_hermitian: Optional[bool] = False,
+):
+    """Parallel-in-time version of :meth:`jax_expm_solver`. The generator and step
+    propagators for all steps are evaluated using ``jax.vmap``, and the cumulative products
+    of the propagators are computed with ``jax.lax.associative_scan``, from which the solution
+    at each point in ``t_eval`` is obtained.
+
+    Note that, relative to :meth:`jax_expm_solver`, this requires storing the propagators
+    for all steps in memory simultaneously.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    expm_func = jax_expm_anti_hermitian if anti_hermitian else jexpm
+
+    y0 = Array(y0, backend="jax").data
+
+    t_list, h_list, n_steps_list = get_fixed_step_sizes(t_span, t_eval, max_dt)
+    step_times, step_sizes, interval_end_idx = get_fixed_step_schedule(t_list, h_list, n_steps_list)
+
+    def step_propagator(t, h):
+        gen = Array(generator(t + (h / 2)), backend="jax").data
+        return expm_func(gen * h)
+
+    propagators = vmap(step_propagator)(jnp.array(step_times), jnp.array(step_sizes))
+
+    # cumulative products U_k ... U_0 for all k
+    cumulative_propagators = associative_scan(lambda a, b: b @ a, propagators)
+
+    ys = cumulative_propagators[interval_end_idx] @ y0
+    ys = Array(jnp.append(jnp.expand_dims(y0, axis=0), ys, axis=0), backend="jax")
+
+    results = OdeResult(t=t_list, y=ys)
+
+    return trim_t_results(results, t_span, t_eval)
+
+
+def scipy_expm_multiply_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+):
+    """Fixed-step size matrix exponential based solver implemented with
+    ``scipy.sparse.linalg.expm_multiply``. Solves the specified problem by taking steps of
+    size no larger than ``max_dt``, with each step computing the action of the exponential
+    of the generator evaluated at the midpoint on the state, without ever forming the
+    exponential itself. The generator may return either dense arrays or ``scipy.sparse``
+    matrices.
+
+    Args:
+        generator: Callable, either a generator rhs
+        t_span: Interval to solve over.
+        y0: Initial state.
+        max_dt: Maximum step size.
+        t_eval: Optional list of time points at which to return the solution.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    return collect_solver_iter(
+        scipy_expm_multiply_solver_iter(generator, t_span, y0, max_dt, t_eval=t_eval)
+    )
+
+
+def scipy_expm_multiply_solver_iter(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_expm_multiply_solver`, yielding the solution at each output
+    time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_expm_multiply_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    def take_step(generator, t0, y, h):
+        eval_time = t0 + (h / 2)
+        return expm_multiply(generator(eval_time) * h, y)
+
+    yield from fixed_step_solver_template_iter(
         take_step, rhs_func=generator, t_span=t_span, y0=y0, max_dt=max_dt, t_eval=t_eval
     )
 
 
+def scipy_pwc_expm_solver(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    dt: float,
+    start_time: Optional[float] = 0.0,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    cache_key: Optional[Callable] = None,
+    anti_hermitian: Optional[bool] = False,
+):
+    """Matrix exponential based solver for generators that are constant on each
+    interval ``[start_time + k * dt, start_time + (k + 1) * dt]``, implemented with
+    ``scipy.linalg.expm``.
+
+    Steps are aligned with the sample boundaries (and the points in ``t_eval``), so that
+    a single exponential is exact for each step. Exponentials are cached, so that each is only
+    computed once for every distinct pair of generator value and step size. The cache is keyed
+    on the output of ``cache_key`` evaluated at the step midpoint, which should be a cheap to
+    evaluate quantity uniquely determining the generator value (e.g. the vector of signal
+    samples). If ``cache_key is None`` the generator value itself is used as the key.
+
+    Args:
+        generator: Callable, the generator.
+        t_span: Interval to solve over.
+        y0: Initial state.
+        dt: Duration of each sample.
+        start_time: Start time of the samples.
+        t_eval: Optional list of time points at which to return the solution.
+        cache_key: Optional callable of time returning an array identifying the generator value.
+        anti_hermitian: Whether the generator is anti-Hermitian, in which case matrix
+                        exponentials are computed using a Hermitian eigendecomposition.
+
+    Returns:
+        OdeResult: Results object.
+    """
+
+    return collect_solver_iter(
+        scipy_pwc_expm_solver_iter(
+            generator,
+            t_span,
+            y0,
+            dt,
+            start_time=start_time,
+            t_eval=t_eval,
+            cache_key=cache_key,
+            anti_hermitian=anti_hermitian,
+        )
+    )
+
+
+def scipy_pwc_expm_solver_iter(
+    generator: Callable,
+    t_span: Array,
+    y0: Array,
+    dt: float,
+    start_time: Optional[float] = 0.0,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    cache_key: Optional[Callable] = None,
+    anti_hermitian: Optional[bool] = False,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_pwc_expm_solver`, yielding the solution at each output
+    time as soon as it has been computed. The arguments are the same as for
+    :meth:`scipy_pwc_expm_solver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    expm_func = expm_anti_hermitian if anti_hermitian else expm
+
+    y = Array(y0).data
+    t_list = np.array(merge_t_args(t_span, t_eval))
+    is_output = output_time_mask(t_list, t_span, t_eval)
+
+    exp_cache = {}
+
+    def step_propagator(t0, h):
+        eval_time = t0 + (h / 2)
+
+        gen = None
+        if cache_key is None:
+            gen = Array(generator(eval_time)).data
+            key = np.asarray(gen).tobytes()
+        else:
+            key = np.asarray(Array(cache_key(eval_time)).data).tobytes()
+
+        # partial samples at the boundaries of t_eval intervals have differing step sizes
+        key = (key, np.round(h / dt, decimals=10))
+
+        if key not in exp_cache:
+            if gen is None:
+                gen = Array(generator(eval_time)).data
+            exp_cache[key] = expm_func(gen * h)
+
+        return exp_cache[key]
+
+    if is_output[0]:
+        yield t_list[0], Array(y)
+
+    for idx in range(1, len(t_list)):
+        step_times = get_pwc_step_times(t_list[idx - 1], t_list[idx], dt, start_time)
+        for inner_t, h in zip(step_times[:-1], np.diff(step_times)):
+            y = step_propagator(inner_t, h) @ y
+
+        if is_output[idx]:
+            yield t_list[idx], Array(y)
+
+
 def fixed_step_solver_template(
     take_step: Callable,
     rhs_func: Callable,
@@ -131,27 +702,52 @@ def fixed_step_solver_template(
         OdeResult: Results object.
     """
 
-    # ensure the output of rhs_func is a raw array
+    return collect_solver_iter(
+        fixed_step_solver_template_iter(
+            take_step, rhs_func=rhs_func, t_span=t_span, y0=y0, max_dt=max_dt, t_eval=t_eval
+        )
+    )
+
+
+def fixed_step_solver_template_iter(
+    take_step: Callable,
+    rhs_func: Callable,
+    t_span: Array,
+    y0: Array,
+    max_dt: float,
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`fixed_step_solver_template`, yielding the solution at each
+    output time as soon as it has been computed, so that the states need not be stored.
+    The arguments are the same as for :meth:`fixed_step_solver_template`.
+
+    Yields:
+        tuple: The time and the state at that time.
+    """
+
+    # ensure the output of rhs_func is a raw array, or a sparse matrix
     def wrapped_rhs_func(*args):
-        return Array(rhs_func(*args)).data
+        out = rhs_func(*args)
+        if issparse(out):
+            return out
+        return Array(out).data
 
-    y0 = Array(y0).data
+    y = Array(y0).data
 
     t_list, h_list, n_steps_list = get_fixed_step_sizes(t_span, t_eval, max_dt)
+    is_output = output_time_mask(t_list, t_span, t_eval)
 
-    ys = [y0]
-    for current_t, h, n_steps in zip(t_list, h_list, n_steps_list):
-        y = ys[-1]
-        inner_t = current_t
-        for _ in range(n_steps):
+    if is_output[0]:
+        yield t_list[0], Array(y)
+
+    for idx in range(1, len(t_list)):
+        inner_t, h = t_list[idx - 1], h_list[idx - 1]
+        for _ in range(n_steps_list[idx - 1]):
             y = take_step(wrapped_rhs_func, inner_t, y, h)
             inner_t = inner_t + h
-        ys.append(y)
-    ys = Array(ys)
 
-    results = OdeResult(t=t_list, y=ys)
-
-    return trim_t_results(results, t_span, t_eval)
+        if is_output[idx]:
+            yield t_list[idx], Array(y)
 
 
 def fixed_step_solver_template_jax(
@@ -161,11 +757,19 @@ def fixed_step_solver_template_jax(
     y0: Array,
     max_dt: float,
     t_eval: Optional[Union[Tuple, List, Array]] = None,
+    output_func: Optional[Callable] = None,
 ):
     """This function is the jax control-flow version of
     :meth:`fixed_step_solver_template`. See the documentation of :meth:`fixed_step_solver_template`
     for details.
 
+    The steps in all intervals are flattened into a single schedule (see
+    :meth:`get_fixed_step_schedule`) and taken in a single ``jax.lax.scan``, with the state at
+    the end of each interval written into an output buffer. Hence the cost scales with the
+    total number of steps, independently of how they are distributed between intervals. If
+    ``output_func`` is given, its value at the end of each interval is written into the buffer
+    instead of the state.
+
     Args:
         take_step: Callable for fixed step integration.
         rhs_func: Callable, either a generator or rhs function.
@@ -173,6 +777,9 @@ def fixed_step_solver_template_jax(
         y0: Initial state.
         max_dt: Maximum step size.
         t_eval: Optional list of time points at which to return the solution.
+        output_func: Optional function ``output_func(t, y)`` applied to the state at each
+                     output time within the ``jax.lax.scan``, whose values are returned in
+                     ``results.y`` in place of the states. Must be ``jax``-transformable.
 
     Returns:
         OdeResult: Results object.
@@ -182,42 +789,177 @@ def fixed_step_solver_template_jax(
     def wrapped_rhs_func(*args):
         return Array(rhs_func(*args), backend="jax").data
 
+    def wrapped_output_func(t, y):
+        if output_func is None:
+            return y
+        return Array(output_func(t, y), backend="jax").data
+
     y0 = Array(y0, backend="jax").data
 
     t_list, h_list, n_steps_list = get_fixed_step_sizes(t_span, t_eval, max_dt)
+    step_times, step_sizes, interval_end_idx = get_fixed_step_schedule(t_list, h_list, n_steps_list)
 
-    # if jax, need bound on number of iterations in each interval
-    max_steps = n_steps_list.max()
+    # slot in the output buffer for the output after each step, and the time it is evaluated
+    # at, with steps not ending an interval written to an extra dummy slot
+    n_intervals = len(interval_end_idx)
+    output_idx = np.full(len(step_times), n_intervals)
+    output_idx[interval_end_idx] = np.arange(n_intervals)
+    output_times = np.append(t_list[1:], t_list[-1])[output_idx]
 
-    def identity(y):
-        return y
+    # single scan over all steps
+    def scan_take_step(carry, x):
+        y, ys = carry
+        t, h, idx, output_t = x
+        y = take_step(wrapped_rhs_func, t, y, h)
+        ys = cond(
+            idx < n_intervals,
+            lambda ys: ys.at[idx].set(wrapped_output_func(output_t, y)),
+            lambda ys: ys,
+            ys,
+        )
+        return (y, ys), None
 
-    # interval integrator set up for jax.lax.scan
-    def scan_interval_integrate(carry, x):
-        current_t, h, n_steps = x
-        current_y = carry
+    output0 = wrapped_output_func(t_list[0], y0)
+    ys = jnp.zeros((n_intervals + 1,) + output0.shape, dtype=output0.dtype)
+    ys = scan(
+        scan_take_step,
+        init=(y0, ys),
+        xs=(
+            jnp.array(step_times),
+            jnp.array(step_sizes),
+            jnp.array(output_idx),
+            jnp.array(output_times),
+        ),
+    )[0][1]
 
-        def scan_take_step(carry, step):
-            t, y = carry
-            y = cond(step < n_steps, lambda y: take_step(wrapped_rhs_func, t, y, h), identity, y)
-            t = t + h
-            return (t, y), None
+    ys = Array(jnp.append(jnp.expand_dims(output0, axis=0), ys[:-1], axis=0), backend="jax")
 
-        next_y = scan(scan_take_step, (current_t, current_y), jnp.arange(max_steps))[0][1]
+    results = OdeResult(t=t_list, y=ys)
 
-        return next_y, next_y
+    return trim_t_results(results, t_span, t_eval)
 
-    ys = scan(
-        scan_interval_integrate,
-        init=y0,
-        xs=(jnp.array(t_list[:-1]), jnp.array(h_list), jnp.array(n_steps_list)),
-    )[1]
 
-    ys = Array(jnp.append(jnp.expand_dims(y0, axis=0), ys, axis=0), backend="jax")
+def rk4_step(rhs_func: Callable, t: float, y: Array, h: float) -> Array:
+    """Take a single step of the classical fourth order Runge-Kutta method.
 
-    results = OdeResult(t=t_list, y=ys)
+    Args:
+        rhs_func: The rhs function ``f(t, y)``.
+        t: Time at the start of the step.
+        y: State at the start of the step.
+        h: Step size.
 
-    return trim_t_results(results, t_span, t_eval)
+    Returns:
+        Array: State at the end of the step.
+    """
+    k1 = rhs_func(t, y)
+    k2 = rhs_func(t + (h / 2), y + (h / 2) * k1)
+    k3 = rhs_func(t + (h / 2), y + (h / 2) * k2)
+    k4 = rhs_func(t + h, y + h * k3)
+
+    return y + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def validate_magnus_order(order: int):
+    """Validate the order of a Magnus expansion.
+
+    Args:
+        order: The order.
+
+    Raises:
+        QiskitError: If the order is not supported.
+    """
+    if order not in [2, 4, 6]:
+        raise QiskitError("Magnus expansion order must be one of 2, 4, or 6.")
+
+
+def magnus_exponent(generator: Callable, t0: float, h: float, order: int):
+    r"""Compute the truncated Magnus expansion :math:`\Omega` for a step of size ``h``
+    starting at time ``t0``, so that the solution of :math:`\dot{y}(t) = G(t)y(t)` is
+    approximated by :math:`y(t_0 + h) \approx e^{\Omega}y(t_0)`.
+
+    The expansion is computed from evaluations of the generator at Gauss-Legendre nodes
+    in the step, using the schemes in [1]:
+
+        - ``order == 2``: The exponential midpoint rule :math:`\Omega = hG(t_0 + h/2)`.
+        - ``order == 4``: With :math:`G_1, G_2` the generator evaluated at the nodes
+          :math:`t_0 + (1/2 \mp \sqrt{3}/6)h`,
+
+          .. math::
+
+              \Omega = \frac{h}{2}(G_1 + G_2) + \frac{\sqrt{3}h^2}{12}[G_2, G_1].
+
+        - ``order == 6``: Using the three nodes :math:`t_0 + (1/2 - \sqrt{15}/10)h`,
+          :math:`t_0 + h/2`, and :math:`t_0 + (1/2 + \sqrt{15}/10)h`.
+
+    Only matrix products and arithmetic are used, so this function works for both
+    ``numpy`` and ``jax`` arrays.
+
+    [1] S. Blanes, F. Casas, J.A. Oteo, J. Ros, *The Magnus expansion and some of its
+    applications*, Physics Reports 470, 151-238 (2009).
+
+    Args:
+        generator: The generator.
+        t0: Start time of the step.
+        h: Size of the step.
+        order: Order of the expansion.
+
+    Returns:
+        Array: The Magnus exponent.
+    """
+
+    def commutator(a, b):
+        return a @ b - b @ a
+
+    if order == 2:
+        return h * generator(t0 + 0.5 * h)
+
+    if order == 4:
+        c = np.sqrt(3) / 6
+        gen1 = generator(t0 + (0.5 - c) * h)
+        gen2 = generator(t0 + (0.5 + c) * h)
+        return 0.5 * h * (gen1 + gen2) + (np.sqrt(3) / 12) * h * h * commutator(gen2, gen1)
+
+    c = np.sqrt(15) / 10
+    gen1 = generator(t0 + (0.5 - c) * h)
+    gen2 = generator(t0 + 0.5 * h)
+    gen3 = generator(t0 + (0.5 + c) * h)
+
+    alpha1 = h * gen2
+    alpha2 = (np.sqrt(15) * h / 3) * (gen3 - gen1)
+    alpha3 = (10 * h / 3) * (gen3 - 2 * gen2 + gen1)
+
+    comm1 = commutator(alpha1, alpha2)
+    comm2 = -commutator(alpha1, 2 * alpha3 + comm1) / 60
+
+    return alpha1 + alpha3 / 12 + commutator(-20 * alpha1 - alpha3 + comm1, alpha2 + comm2) / 240
+
+
+def expm_anti_hermitian(mat: np.ndarray) -> np.ndarray:
+    r"""Matrix exponential of an anti-Hermitian matrix (or stack of matrices), computed via
+    a Hermitian eigendecomposition. Writing :math:`A = -iH` with :math:`H = V D V^\dagger`,
+    this returns :math:`V e^{-iD} V^\dagger`, which is unitary to machine precision.
+
+    Args:
+        mat: Anti-Hermitian matrix.
+
+    Returns:
+        np.ndarray: The matrix exponential.
+    """
+    evals, evecs = np.linalg.eigh(1j * mat)
+    return (evecs * np.exp(-1j * evals)[..., None, :]) @ np.swapaxes(evecs.conj(), -1, -2)
+
+
+def jax_expm_anti_hermitian(mat: Array) -> Array:
+    """``jax`` version of :meth:`expm_anti_hermitian`.
+
+    Args:
+        mat: Anti-Hermitian matrix.
+
+    Returns:
+        Array: The matrix exponential.
+    """
+    evals, evecs = jeigh(1j * mat)
+    return (evecs * jnp.exp(-1j * evals)[..., None, :]) @ jnp.swapaxes(evecs.conj(), -1, -2)
 
 
 def get_fixed_step_sizes(t_span: Array, t_eval: Array, max_dt: float) -> Tuple[Array, Array, Array]:
@@ -258,3 +1000,111 @@ def get_fixed_step_sizes(t_span: Array, t_eval: Array, max_dt: float) -> Tuple[A
     h_list = np.array(delta_t_list / n_steps_list)
 
     return t_list, h_list, n_steps_list
+
+
+def get_fixed_step_schedule(
+    t_list: np.ndarray, h_list: np.ndarray, n_steps_list: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten the output of :meth:`get_fixed_step_sizes` into a single schedule of steps.
+
+    Args:
+        t_list: Merged time point list.
+        h_list: Step size in each interval.
+        n_steps_list: Number of steps in each interval.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The start time and size of each step,
+        and the index of the last step in each interval.
+    """
+    step_times = np.concatenate(
+        [t + h * np.arange(n) for t, h, n in zip(t_list[:-1], h_list, n_steps_list)]
+    )
+    step_sizes = np.repeat(h_list, n_steps_list)
+    interval_end_idx = np.cumsum(n_steps_list) - 1
+
+    return step_times, step_sizes, interval_end_idx
+
+
+def get_step_propagators(
+    generator: Callable,
+    step_times: np.ndarray,
+    step_sizes: np.ndarray,
+    expm_func: Callable,
+    vectorized_generator: Optional[bool] = False,
+) -> np.ndarray:
+    """Compute the midpoint rule propagators ``expm_func(generator(t + h / 2) * h)`` for all
+    steps in a schedule, as a single batch of matrix exponentials.
+
+    Args:
+        generator: Callable generator.
+        step_times: Start time of each step.
+        step_sizes: Size of each step.
+        expm_func: Function for computing matrix exponentials of a stack of matrices.
+        vectorized_generator: Whether ``generator`` accepts a 1d array of times, returning
+                              a 3d array of generators. If ``False``, the generator is called
+                              once per step.
+
+    Returns:
+        np.ndarray: The stack of step propagators.
+    """
+    eval_times = step_times + (step_sizes / 2)
+
+    if vectorized_generator:
+        generators = Array(generator(eval_times)).data
+    else:
+        generators = np.array([Array(generator(t)).data for t in eval_times])
+
+    return expm_func(generators * step_sizes[:, np.newaxis, np.newaxis])
+
+
+def tree_product(mats: np.ndarray) -> np.ndarray:
+    """Compute the product ``mats[-1] @ ... @ mats[1] @ mats[0]`` of a stack of matrices
+    via pairwise multiplication, with each level of the tree computed as a single batched
+    matrix multiplication.
+
+    Args:
+        mats: Stack of matrices.
+
+    Returns:
+        np.ndarray: The product.
+    """
+    while len(mats) > 1:
+        # multiply adjacent pairs, carrying over the last matrix if there is an odd number
+        products = mats[1::2] @ mats[0 : len(mats) - 1 : 2]
+        if len(mats) % 2 == 1:
+            products = np.append(products, mats[-1:], axis=0)
+        mats = products
+
+    return mats[0]
+
+
+def get_pwc_step_times(t0: float, tf: float, dt: float, start_time: float = 0.0) -> np.ndarray:
+    """Get the times of the steps required to integrate from ``t0`` to ``tf`` for a
+    generator that is constant on the intervals ``[start_time + k * dt, start_time + (k + 1) * dt]``,
+    i.e. ``t0``, ``tf``, and all sample boundaries between them.
+
+    Args:
+        t0: Initial time.
+        tf: Final time.
+        dt: Duration of each sample.
+        start_time: Start time of the samples.
+
+    Returns:
+        np.ndarray: The step times, ordered according to the direction of integration.
+    """
+    t_min, t_max = min(t0, tf), max(t0, tf)
+
+    k_min = np.floor((t_min - start_time) / dt) + 1
+    k_max = np.ceil((t_max - start_time) / dt) - 1
+    boundaries = start_time + dt * np.arange(k_min, k_max + 1)
+
+    # drop boundaries numerically coinciding with the end points
+    tol = 1e-10 * dt
+    boundaries = boundaries[(boundaries - t_min > tol) & (t_max - boundaries > tol)]
+
+    step_times = np.concatenate([[t_min], boundaries, [t_max]])
+
+    if tf < t0:
+        step_times = step_times[::-1]
+
+    return step_times
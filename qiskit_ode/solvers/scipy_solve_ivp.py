@@ -15,21 +15,29 @@
 Wrapper for calling scipy.integrate.solve_ivp.
 """
 
-from typing import Callable, Union, Optional, Tuple, List
+from typing import Callable, Union, Optional, Tuple, List, Iterator
 
 import numpy as np
-from scipy.integrate import solve_ivp, OdeSolver
-from scipy.integrate._ivp.ivp import OdeResult
+from scipy.integrate import solve_ivp, OdeSolver, OdeSolution
+from scipy.integrate._ivp.ivp import OdeResult, METHODS as SCIPY_METHODS, MESSAGES
+from scipy.sparse import (
+    issparse,
+    bmat as sparse_bmat,
+    block_diag as sparse_block_diag,
+)
 
-from qiskit import QiskitError
 from qiskit_ode.dispatch import Array
 from ..type_utils import StateTypeConverter
+from .solver_utils import map_dense_output
 
 # Supported scipy ODE methods
 COMPLEX_METHODS = ["RK45", "RK23", "BDF", "DOP853"]
 REAL_METHODS = ["LSODA", "Radau"]
 SOLVE_IVP_METHODS = COMPLEX_METHODS + REAL_METHODS
 
+# methods using a Jacobian
+JAC_METHODS = ["BDF", "Radau", "LSODA"]
+
 
 def scipy_solve_ivp(
     rhs: Callable,
@@ -37,28 +45,209 @@ def scipy_solve_ivp(
     y0: Array,
     method: Union[str, OdeSolver],
     t_eval: Optional[Union[Tuple, List, Array]] = None,
+    generator: Optional[Callable] = None,
     **kwargs,
 ):
     """Routine for calling `scipy.integrate.solve_ivp`.
 
+    If the problem is an LMDE :math:`f(t, y) = G(t)y` and ``generator`` is given, the methods
+    using a Jacobian (``'BDF'``, ``'Radau'``, and ``'LSODA'``) are supplied with the Jacobian
+    constructed from :math:`G(t)` (see :meth:`lmde_jac`), unless ``jac`` is given in
+    ``kwargs``. Sparse generators give sparse Jacobians, except for ``'LSODA'``, which requires
+    dense Jacobians. For the methods requiring real states (``'LSODA'`` and ``'Radau'``) the
+    real embedding of the problem is constructed directly from :math:`G(t)` (see
+    :meth:`real_lmde_rhs`), rather than by wrapping ``rhs``.
+
+    If ``dense_output=True`` is passed, the returned ``results.sol`` is a callable evaluating
+    the interpolated solution at a time, or at a 1d array of times (with the first axis of the
+    output indexing time). States are converted from the internal representation used by
+    ``solve_ivp`` into the shape of ``y0`` only when the interpolant is evaluated.
+
     Args:
         rhs: Callable of the form :math:`f(t, y)`.
         t_span: Interval to solve over.
         y0: Initial state.
         method: Solver method.
         t_eval: Points at which to evaluate the solution.
+        generator: Optional generator :math:`G(t)`, if ``rhs`` is given by
+                   :math:`f(t, y) = G(t)y`.
         kwargs: Optional arguments to be passed to ``solve_ivp``.
 
     Returns:
         OdeResult: results object
+    """
+
+    rhs, y0, type_converter, embed_real = _setup_solve_ivp(
+        rhs, t_span, y0, method, generator, kwargs
+    )
+
+    results = solve_ivp(rhs, t_span=t_span.data, y0=y0.data, t_eval=t_eval, method=method, **kwargs)
+    if embed_real:
+        results.y = r2c(results.y)
+
+    # convert to the standardized results format
+    # solve_ivp returns the states as a 2d array with columns being the states
+    results.y = results.y.transpose()
+    results.y = Array([type_converter.inner_to_outer(y) for y in results.y])
+
+    if results.sol is not None:
+        inner_sol = results.sol
+
+        # the interpolant also returns states as columns, and embedded if solving as real
+        def time_first_inner_sol(t):
+            y = inner_sol(t)
+            if embed_real:
+                y = r2c(y)
+            return y.transpose()
+
+        results.sol = map_dense_output(
+            time_first_inner_sol, lambda _, y: type_converter.inner_to_outer(y)
+        )
+
+    return OdeResult(**dict(results))
+
+
+def scipy_solve_ivp_iter(
+    rhs: Callable,
+    t_span: Array,
+    y0: Array,
+    method: Union[str, OdeSolver],
+    t_eval: Optional[Union[Tuple, List, Array]] = None,
+    generator: Optional[Callable] = None,
+    dense_output: Optional[bool] = False,
+    **kwargs,
+) -> Iterator[Tuple[float, Array]]:
+    """Iterator version of :meth:`scipy_solve_ivp`, yielding the solution at each output time
+    as soon as it has been computed.
+
+    A single ``scipy`` :class:`OdeSolver` is stepped through the interval in the same manner
+    as in ``scipy.integrate.solve_ivp``: if ``t_eval`` is ``None`` the state is yielded after
+    every step, and otherwise the points of ``t_eval`` passed by each step are evaluated using
+    the dense output of the step. The yielded states are therefore the same as the states
+    returned by :meth:`scipy_solve_ivp`, but only the current state is kept in memory. The
+    ``events`` and ``args`` arguments of ``solve_ivp`` are not supported.
 
-    Raises:
-        QiskitError: If unsupported kwarg present.
+    Args:
+        rhs: Callable of the form :math:`f(t, y)`.
+        t_span: Interval to solve over.
+        y0: Initial state.
+        method: Solver method.
+        t_eval: Points at which to evaluate the solution.
+        generator: Optional generator :math:`G(t)`, if ``rhs`` is given by
+                   :math:`f(t, y) = G(t)y`.
+        dense_output: Whether to construct the interpolant ``sol`` of the solution. If
+                      ``True``, the interpolants of all steps are stored.
+        kwargs: Optional arguments to be passed to the :class:`OdeSolver`.
+
+    Yields:
+        tuple: The time and the state at that time.
+
+    Returns:
+        OdeResult: Results object containing the solver statistics and status, and the
+        interpolant ``sol`` if ``dense_output`` is ``True``.
     """
+    rhs, y0, type_converter, embed_real = _setup_solve_ivp(
+        rhs, t_span, y0, method, generator, kwargs
+    )
+
+    def outer_state(y):
+        if embed_real:
+            y = r2c(y)
+        return type_converter.inner_to_outer(y)
+
+    t0, tf = map(float, Array(t_span, backend="numpy").data)
+    if method in SCIPY_METHODS:
+        method = SCIPY_METHODS[method]
+    solver = method(rhs, t0, y0.data, tf, **kwargs)
 
-    if kwargs.get("dense_output", False) is True:
-        raise QiskitError("dense_output not supported for solve_ivp.")
+    t_eval_idx = 0
+    if t_eval is None:
+        yield t0, outer_state(solver.y)
+    else:
+        t_eval = np.asarray(Array(t_eval, backend="numpy").data)
+        if tf < t0:
+            # order t_eval increasingly for np.searchsorted
+            t_eval = t_eval[::-1]
+            t_eval_idx = len(t_eval)
 
+    step_ts, interpolants = [t0], []
+    status = None
+    while status is None:
+        message = solver.step()
+        if solver.status == "finished":
+            status = 0
+        elif solver.status == "failed":
+            status = -1
+            break
+
+        sol = None
+        if dense_output:
+            sol = solver.dense_output()
+            interpolants.append(sol)
+            step_ts.append(solver.t)
+
+        if t_eval is None:
+            yield solver.t, outer_state(solver.y)
+            continue
+
+        # the points of t_eval passed by the step, including the end of the step
+        if solver.direction > 0:
+            t_eval_idx_new = np.searchsorted(t_eval, solver.t, side="right")
+            t_eval_step = t_eval[t_eval_idx:t_eval_idx_new]
+        else:
+            t_eval_idx_new = np.searchsorted(t_eval, solver.t, side="left")
+            t_eval_step = t_eval[t_eval_idx_new:t_eval_idx][::-1]
+
+        if t_eval_step.size > 0:
+            if sol is None:
+                sol = solver.dense_output()
+            for t, y in zip(t_eval_step, sol(t_eval_step).transpose()):
+                yield t, outer_state(y)
+            t_eval_idx = t_eval_idx_new
+
+    results = OdeResult(
+        nfev=solver.nfev,
+        njev=solver.njev,
+        nlu=solver.nlu,
+        status=status,
+        message=MESSAGES.get(status, message),
+        success=status >= 0,
+        sol=None,
+    )
+
+    if dense_output:
+        inner_sol = OdeSolution(step_ts, interpolants)
+
+        def time_first_inner_sol(t):
+            y = inner_sol(t)
+            if embed_real:
+                y = r2c(y)
+            return y.transpose()
+
+        results.sol = map_dense_output(
+            time_first_inner_sol, lambda _, y: type_converter.inner_to_outer(y)
+        )
+
+    return results
+
+
+def _setup_solve_ivp(
+    rhs: Callable,
+    t_span: Array,
+    y0: Array,
+    method: Union[str, OdeSolver],
+    generator: Optional[Callable],
+    kwargs: dict,
+) -> Tuple[Callable, Array, StateTypeConverter, bool]:
+    """Helper function for setting up the rhs and initial state used internally by
+    :meth:`scipy_solve_ivp` and :meth:`scipy_solve_ivp_iter`. If the Jacobian can be
+    constructed from ``generator``, it is set in ``kwargs``.
+
+    Returns:
+        Callable, Array, StateTypeConverter, bool: The internal rhs and initial state, the
+        converter between the internal and external states, and whether the problem is
+        embedded as a real problem.
+    """
     # solve_ivp requires 1d arrays internally
     internal_state_spec = {"type": "array", "ndim": 1}
     type_converter = StateTypeConverter.from_outer_instance_inner_type_spec(y0, internal_state_spec)
@@ -73,20 +262,23 @@ def scipy_solve_ivp(
     # TODO: Also check if model or y0 are complex
     #       if they are both real we don't need to embed.
     embed_real = method in REAL_METHODS
-    if embed_real:
-        rhs = real_rhs(rhs)
-        y0 = c2r(y0)
 
-    results = solve_ivp(rhs, t_span=t_span.data, y0=y0.data, t_eval=t_eval, method=method, **kwargs)
-    if embed_real:
-        results.y = r2c(results.y)
+    # for LMDEs the Jacobian is known exactly
+    if generator is not None and method in JAC_METHODS:
+        dim = _eval_generator(generator, t_span[0]).shape[0]
+        n_cols = len(y0) // dim
+        kwargs.setdefault(
+            "jac", lmde_jac(generator, n_cols, real_embedding=embed_real, dense=method == "LSODA")
+        )
+        if embed_real:
+            rhs = real_lmde_rhs(generator, dim, n_cols)
 
-    # convert to the standardized results format
-    # solve_ivp returns the states as a 2d array with columns being the states
-    results.y = results.y.transpose()
-    results.y = Array([type_converter.inner_to_outer(y) for y in results.y])
+    if embed_real:
+        if generator is None:
+            rhs = real_rhs(rhs)
+        y0 = c2r(y0)
 
-    return OdeResult(**dict(results))
+    return rhs, y0, type_converter, embed_real
 
 
 def real_rhs(rhs):
@@ -98,6 +290,119 @@ def real_rhs(rhs):
     return _real_rhs
 
 
+def real_lmde_rhs(generator: Callable, dim: int, n_cols: int) -> Callable:
+    r"""Construct the rhs for the real embedding of the LMDE :math:`\dot{y}(t) = G(t)y(t)`,
+    for :math:`y` of shape ``(dim, n_cols)`` flattened in column stacking order, with real and
+    imaginary parts concatenated as in :meth:`c2r`.
+
+    The rhs applies :math:`G = G_r + iG_i` to the real and imaginary parts of the state
+    directly, via
+
+    .. math::
+
+        \dot{y}_r = G_r y_r - G_i y_i, \quad \dot{y}_i = G_i y_r + G_r y_i,
+
+    with the matrix products written into the output array and a preallocated buffer, avoiding
+    conversions between complex and real arrays.
+
+    Args:
+        generator: The generator :math:`G(t)`, returning either an array or a sparse matrix.
+        dim: Dimension of the generator.
+        n_cols: Number of columns of the state.
+
+    Returns:
+        Callable: The rhs function of the real embedding.
+    """
+    size = dim * n_cols
+    buffer = np.empty((dim, n_cols))
+
+    def _rhs(t, y):
+        gen = _eval_generator(generator, t)
+        y_real = y[:size].reshape((dim, n_cols), order="F")
+        y_imag = y[size:].reshape((dim, n_cols), order="F")
+
+        # a new output array is required as solvers may store previous evaluations
+        out = np.empty(2 * size)
+        out_real = out[:size].reshape((dim, n_cols), order="F")
+        out_imag = out[size:].reshape((dim, n_cols), order="F")
+
+        if issparse(gen):
+            gen_real, gen_imag = gen.real, gen.imag
+            out_real[:] = gen_real @ y_real - gen_imag @ y_imag
+            out_imag[:] = gen_imag @ y_real + gen_real @ y_imag
+            return out
+
+        np.matmul(gen.real, y_real, out=out_real)
+        np.matmul(gen.real, y_imag, out=out_imag)
+        if np.iscomplexobj(gen):
+            np.matmul(gen.imag, y_imag, out=buffer)
+            out_real -= buffer
+            np.matmul(gen.imag, y_real, out=buffer)
+            out_imag += buffer
+
+        return out
+
+    return _rhs
+
+
+def lmde_jac(
+    generator: Callable,
+    n_cols: int,
+    real_embedding: Optional[bool] = False,
+    dense: Optional[bool] = False,
+) -> Callable:
+    r"""Construct the Jacobian of the LMDE :math:`\dot{y}(t) = G(t)y(t)`, for :math:`y` with
+    ``n_cols`` columns flattened in column stacking order. The Jacobian is the generator
+    :math:`K = I \otimes G` acting on the flattened state, or, for the real embedding, its
+    real block form
+
+    .. math::
+
+        \begin{pmatrix} K_r & -K_i \\ K_i & K_r \end{pmatrix}.
+
+    Sparse generators result in sparse Jacobians, unless ``dense`` is ``True``. For
+    ``n_cols > 1`` the Jacobian is block diagonal, and is also constructed as a sparse matrix
+    for dense generators, unless ``dense`` is ``True``.
+
+    Args:
+        generator: The generator :math:`G(t)`, returning either an array or a sparse matrix.
+        n_cols: Number of columns of the state.
+        real_embedding: Whether to return the Jacobian of the real embedding.
+        dense: Whether to always return a dense array.
+
+    Returns:
+        Callable: The Jacobian function ``jac(t, y)``.
+    """
+
+    # pylint: disable=unused-argument
+    def _jac(t, y):
+        gen = _eval_generator(generator, t)
+
+        if n_cols > 1 and (issparse(gen) or not dense):
+            gen = sparse_block_diag([gen] * n_cols, format="csr")
+
+        if issparse(gen):
+            if real_embedding:
+                gen = sparse_bmat([[gen.real, -gen.imag], [gen.imag, gen.real]], format="csr")
+            return gen.toarray() if dense else gen
+
+        if n_cols > 1:
+            gen = np.kron(np.eye(n_cols), gen)
+        if real_embedding:
+            gen = np.block([[gen.real, -gen.imag], [gen.imag, gen.real]])
+        return gen
+
+    return _jac
+
+
+def _eval_generator(generator: Callable, t: float):
+    """Evaluate a generator as a raw array, passing sparse matrices through."""
+    gen = generator(t)
+    if issparse(gen):
+        return gen
+    return Array(gen).data
+
+
 def c2r(arr):
     """Convert complex array to a real array"""
     return np.concatenate([np.real(arr), np.imag(arr)])
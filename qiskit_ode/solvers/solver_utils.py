@@ -16,7 +16,7 @@
 Utility functions for solvers.
 """
 
-from typing import Optional, Union, List, Tuple
+from typing import Callable, Optional, Union, List, Tuple, Iterator
 import numpy as np
 from scipy.integrate._ivp.ivp import OdeResult
 
@@ -112,3 +112,92 @@ def trim_t_results(
         results.y = Array(results.y[:-1])
 
     return results
+
+
+def output_time_mask(
+    t_list: Array,
+    t_span: Union[List, Tuple, Array],
+    t_eval: Optional[Union[List, Tuple, Array]] = None,
+) -> np.ndarray:
+    """Determine which of the merged times returned by :meth:`merge_t_args` are output times,
+    i.e. the times kept by :meth:`trim_t_results`.
+
+    Args:
+        t_list: Merged time point list.
+        t_span: Interval to solve over.
+        t_eval: Time points to include in returned results.
+
+    Returns:
+        np.ndarray: Boolean array indicating the output times in ``t_list``.
+    """
+    mask = np.ones(len(t_list), dtype=bool)
+    if t_eval is None:
+        return mask
+
+    t_span = Array(t_span, backend="numpy")
+    mask[0] = t_eval[0] == t_span[0]
+    mask[-1] = t_eval[-1] == t_span[1]
+
+    return mask
+
+
+def collect_solver_iter(
+    solver_iter: Iterator[Tuple[float, Array]], output_func: Optional[Callable] = None
+) -> OdeResult:
+    """Run a solver iterator to completion, collecting the yielded states into an
+    ``OdeResult``. Solver iterators yield the time and state at each output time, and return
+    an ``OdeResult`` containing any additional information about the solve, which is included
+    in the collected results.
+
+    Args:
+        solver_iter: Iterator yielding tuples ``(t, y)``.
+        output_func: Optional function ``output_func(t, y)`` applied to each state as it is
+                     yielded, in which case only the outputs are stored.
+
+    Returns:
+        OdeResult: Results object, with ``results.y`` containing the states, or their outputs.
+    """
+    t_list, ys = [], []
+    while True:
+        try:
+            t, y = next(solver_iter)
+        except StopIteration as stop:
+            results = stop.value if stop.value is not None else OdeResult()
+            break
+
+        if output_func is not None:
+            y = output_func(t, y)
+        t_list.append(t)
+        ys.append(Array(y).data)
+
+    results.t = Array(t_list)
+    results.y = Array(ys)
+
+    return results
+
+
+def map_dense_output(sol: Callable, state_map: Callable, stack: Optional[bool] = True) -> Callable:
+    """Compose a dense output interpolant with a map applied to each of its states.
+    The map is only applied when the returned interpolant is evaluated.
+
+    Args:
+        sol: Interpolant returning the state at a given time, or, for a 1d array of times,
+             a sequence of states with the first axis indexing time.
+        state_map: Function ``state_map(t, y)`` to apply to the state ``y`` at time ``t``.
+        stack: Whether to stack the mapped states into an :class:`Array` when evaluating at a
+               1d array of times, or to return them as a list.
+
+    Returns:
+        Callable: The composed interpolant.
+    """
+
+    def mapped_sol(t):
+        if np.ndim(t) == 1:
+            states = [state_map(time, y) for time, y in zip(t, sol(t))]
+            if stack:
+                return Array([Array(state).data for state in states])
+            return states
+
+        return state_map(t, sol(t))
+
+    return mapped_sol
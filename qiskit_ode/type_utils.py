@@ -20,6 +20,13 @@ reshaping arrays, and handling qiskit types that wrap arrays.
 from typing import Union, List
 
 import numpy as np
+from scipy.sparse import (
+    issparse,
+    csr_matrix,
+    spmatrix,
+    identity as sparse_identity,
+    kron as sparse_kron,
+)
 
 from qiskit.quantum_info.operators import Operator
 
@@ -236,7 +243,7 @@ def type_spec_from_instance(y):
     return type_spec
 
 
-def vec_commutator(A: Array):
+def vec_commutator(A: Union[Array, spmatrix, List[spmatrix]]):
     r"""Linear algebraic vectorization of the linear map X -> [A, X]
     in column-stacking convention. In column-stacking convention we have
 
@@ -252,11 +259,20 @@ def vec_commutator(A: Array):
 
     Args:
         A: Either a 2d array representing the matrix A described above,
-           or a 3d array representing a list of matrices.
+           or a 3d array representing a list of matrices. If given as a
+           ``scipy.sparse`` matrix or a list of them, the result is
+           constructed in CSR format.
 
     Returns:
         Array: vectorized version of the map.
     """
+    if isinstance(A, list):
+        return [vec_commutator(sub_A) for sub_A in A]
+
+    if issparse(A):
+        iden = sparse_identity(A.shape[-1], format="csr")
+        return csr_matrix(sparse_kron(iden, A) - sparse_kron(A.transpose(), iden))
+
     iden = Array(np.eye(A.shape[-1]))
     axes = list(range(A.ndim))
     axes[-1] = axes[-2]
@@ -264,7 +280,7 @@ def vec_commutator(A: Array):
     return np.kron(iden, A) - np.kron(A.transpose(axes), iden)
 
 
-def vec_dissipator(L: Array):
+def vec_dissipator(L: Union[Array, spmatrix, List[spmatrix]]):
     r"""Linear algebraic vectorization of the linear map
     X -> L X L^\dagger - 0.5 * (L^\dagger L X + X L^\dagger L)
     in column stacking convention.
@@ -275,9 +291,23 @@ def vec_dissipator(L: Array):
         \overline{L} \otimes L - 0.5(id \otimes L^\dagger L +
             (L^\dagger L)^T \otimes id)
 
-    Note: this function is also "vectorized" in the programming sense.
+    Note: this function is also "vectorized" in the programming sense. If ``L`` is
+    given as a ``scipy.sparse`` matrix or a list of them, the result is constructed
+    in CSR format.
     """
-    iden = Array(np.eye(L.shape[-1]))
+    if isinstance(L, list):
+        return [vec_dissipator(sub_L) for sub_L in L]
+
+    if issparse(L):
+        iden = sparse_identity(L.shape[-1], format="csr")
+        LdagL = L.conj().transpose() @ L
+        return csr_matrix(
+            sparse_kron(L.conj(), L)
+            - 0.5 * (sparse_kron(iden, LdagL) + sparse_kron(LdagL.transpose(), iden))
+        )
+
+    dim = L.shape[-1]
+    iden = Array(np.eye(dim))
     axes = list(range(L.ndim))
 
     axes[-1] = axes[-2]
@@ -286,10 +316,13 @@ def vec_dissipator(L: Array):
     LdagL = Lconj.transpose(axes) @ L
     LdagLtrans = LdagL.transpose(axes)
 
-    return np.kron(Lconj, iden) @ np.kron(iden, L) - 0.5 * (
-        np.kron(iden, LdagL) + np.kron(LdagLtrans, iden)
+    # assemble kron(Lconj, L) directly, rather than as kron(Lconj, iden) @ kron(iden, L)
+    Lconj_kron_L = np.einsum("...ij,...kl->...ikjl", Lconj, L).reshape(
+        L.shape[:-2] + (dim * dim, dim * dim)
     )
 
+    return Lconj_kron_L - 0.5 * (np.kron(iden, LdagL) + np.kron(LdagLtrans, iden))
+
 
 def to_array(op: Union[Operator, Array, List[Operator], List[Array]]):
     """Convert an operator or list of operators to an Array.
@@ -297,13 +330,16 @@ def to_array(op: Union[Operator, Array, List[Operator], List[Array]]):
     Args:
         op: Either an Operator to be converted to an array, a list of Operators
             to be converted to a 3d array, or an array (which simply gets
-            returned)
+            returned). ``scipy.sparse`` matrices are also returned unchanged.
     Returns:
         Array: Array version of input
     """
-    if op is None or isinstance(op, Array):
+    if op is None or isinstance(op, Array) or issparse(op):
         return op
 
+    if isinstance(op, list) and len(op) > 0 and issparse(op[0]):
+        return Array(np.array([sub_op.toarray() for sub_op in op]))
+
     if isinstance(op, list) and isinstance(op[0], Operator):
         shape = op[0].data.shape
         dtype = op[0].data.dtype
@@ -316,3 +352,31 @@ def to_array(op: Union[Operator, Array, List[Operator], List[Array]]):
         return Array(op.data)
 
     return Array(op)
+
+
+def to_csr(
+    op: Union[Operator, Array, spmatrix, List[Operator], List[Array], List[spmatrix]]
+) -> Union[csr_matrix, List[csr_matrix]]:
+    """Convert an operator or list of operators to ``scipy.sparse`` CSR format.
+
+    Args:
+        op: Either an operator, given as an Operator, a 2d array, or a ``scipy.sparse`` matrix,
+            or a list of operators or a 3d array.
+    Returns:
+        Union[csr_matrix, List[csr_matrix]]: CSR version of a single operator, or a list of CSR
+        matrices for a list of operators.
+    """
+    if op is None:
+        return op
+
+    if issparse(op):
+        return csr_matrix(op)
+
+    if isinstance(op, list):
+        return [to_csr(sub_op) for sub_op in op]
+
+    op = to_array(op)
+    if op.ndim == 3:
+        return [csr_matrix(sub_op) for sub_op in op.data]
+
+    return csr_matrix(op.data)
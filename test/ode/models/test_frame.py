@@ -227,6 +227,29 @@ class TestFrame(QiskitOdeTestCase):
 
         self.assertAllClose(value, expected, rtol=1e-10, atol=1e-10)
 
+    def test_state_frame_transformations_time_array(self):
+        """Test state_into_frame and state_out_of_frame on stacks of states."""
+        rng = np.random.default_rng(3148)
+        rand_op = rng.uniform(low=-10, high=10, size=(4, 4)) + 1j * rng.uniform(
+            low=-10, high=10, size=(4, 4)
+        )
+        frame = Frame(Array(rand_op - rand_op.conj().transpose()))
+
+        times = np.linspace(0.0, 1.0, 7)
+        for state_shape in [(4,), (4, 3)]:
+            ys = Array(
+                rng.uniform(size=(7,) + state_shape) + 1j * rng.uniform(size=(7,) + state_shape)
+            )
+            for y_in_frame_basis in [False, True]:
+                for return_in_frame_basis in [False, True]:
+                    for transform in [frame.state_into_frame, frame.state_out_of_frame]:
+                        value = transform(times, ys, y_in_frame_basis, return_in_frame_basis)
+                        expected = [
+                            transform(t, y, y_in_frame_basis, return_in_frame_basis)
+                            for t, y in zip(times, ys)
+                        ]
+                        self.assertAllClose(value, Array(expected), rtol=1e-10, atol=1e-10)
+
     def test_operator_into_frame(self):
         """Test operator_into_frame."""
         rng = np.random.default_rng(94994)
@@ -318,6 +341,48 @@ class TestFrame(QiskitOdeTestCase):
 
         self.assertAllClose(value, expected, rtol=1e-10, atol=1e-10)
 
+    def test_diagonal_frame(self):
+        """Test transformations for a frame specified by its diagonal."""
+        rng = np.random.default_rng(5123)
+        frame_diag = Array(-1j * rng.uniform(low=-10, high=10, size=4))
+        frame = Frame(frame_diag)
+
+        t = 1.2314
+        y = Array(rng.uniform(size=(4, 4)) + 1j * rng.uniform(size=(4, 4)))
+        phases = np.exp(t * frame_diag)
+
+        self.assertAllClose(frame.state_into_frame(t, y), np.diag(phases.conj()) @ y)
+        self.assertAllClose(frame.state_out_of_frame(t, y), np.diag(phases) @ y)
+        self.assertAllClose(
+            frame.generator_into_frame(t, y),
+            np.diag(phases.conj()) @ y @ np.diag(phases) - np.diag(frame_diag),
+        )
+        self.assertAllClose(
+            frame.generator_out_of_frame(t, y),
+            np.diag(phases) @ y @ np.diag(phases.conj()) + np.diag(frame_diag),
+        )
+
+        # the operator is not modified by adding the frame diagonal
+        y_copy = y.copy()
+        frame.generator_into_frame(t, y, operator_in_frame_basis=True)
+        self.assertAllClose(y, y_copy)
+
+    def test_diagonal_2d_frame(self):
+        """Test that a frame specified by a diagonal 2d array is not diagonalized, and gives
+        the same transformations as a frame specified by its diagonal."""
+        rng = np.random.default_rng(9812)
+        frame_diag = Array(-1j * rng.uniform(low=-10, high=10, size=4))
+        frame = Frame(np.diag(frame_diag))
+        diag_frame = Frame(frame_diag)
+
+        self.assertAllClose(frame.frame_diag, frame_diag)
+        self.assertAllClose(frame.frame_basis, np.eye(4))
+
+        t = 1.2314
+        y = Array(rng.uniform(size=(4, 4)) + 1j * rng.uniform(size=(4, 4)))
+        self.assertAllClose(frame.state_into_frame(t, y), diag_frame.state_into_frame(t, y))
+        self.assertAllClose(frame.generator_into_frame(t, y), diag_frame.generator_into_frame(t, y))
+
     def test_generator_into_frame(self):
         """Test operator_out_of_frame."""
         rng = np.random.default_rng(111)
@@ -431,8 +496,7 @@ class TestFrame(QiskitOdeTestCase):
         self.assertAllClose(ops_w_conj_cutoff, operators)
 
         # same test but with frame given as a 2d array
-        # in this case diagonalization will occur, causing eigenvalues to
-        # be sorted in ascending order. This will flip Y and Z
+        # as the frame is diagonal, it is not diagonalized, and the basis is unchanged
         frame_op = -1j * np.pi * Array([[1.0, 0], [0, -1.0]])
         carrier_freqs = Array([1.0, 2.0, 3.0])
 
@@ -442,10 +506,8 @@ class TestFrame(QiskitOdeTestCase):
             operators, carrier_freqs=carrier_freqs
         )
 
-        expected_ops = Array([self.X.data, -self.Y.data, -self.Z.data])
-
-        self.assertAllClose(ops_w_cutoff, expected_ops)
-        self.assertAllClose(ops_w_conj_cutoff, expected_ops)
+        self.assertAllClose(ops_w_cutoff, operators)
+        self.assertAllClose(ops_w_conj_cutoff, operators)
 
     def test_operators_into_frame_basis_with_cutoff(self):
         """Test function for construction of operators with cutoff."""
@@ -508,3 +570,30 @@ class TestFrameJax(TestFrame, TestJaxBase):
 
         frame = Frame(self.Z + 1j * self.X)
         self.assertTrue(jnp.isnan(frame.frame_diag[0]))
+
+
+class TestFramePhases(QiskitOdeTestCase):
+    """Tests for Frame.frame_phases."""
+
+    def setUp(self):
+        self.frame = Frame(Array(-1j * np.array([0.0, 12.31, 53.7, 101.2])))
+
+    def test_scalar_times(self):
+        """Test evaluation at repeated and irregularly spaced times."""
+        rng = np.random.default_rng(2341)
+        for t in np.cumsum(rng.uniform(size=10)):
+            expected = np.exp(t * self.frame.frame_diag)
+            self.assertAllClose(self.frame.frame_phases(t), expected)
+            self.assertAllClose(self.frame.frame_phases(t), expected)
+
+    def test_time_arrays(self):
+        """Test evaluation at uniform and non-uniform arrays of times."""
+        for times in [
+            np.linspace(-1.0, 3.0, 23),
+            np.linspace(0.0, 10.0, 201),
+            np.array([0.0, 0.1, 0.3, 1.2]),
+        ]:
+            expected = np.exp(np.multiply.outer(times, self.frame.frame_diag))
+            output = self.frame.frame_phases(times)
+            self.assertAllClose(output, expected, rtol=1e-12, atol=1e-12)
+            self.assertAllClose(self.frame.frame_phases(Array(times)), output, rtol=0, atol=0)
@@ -15,6 +15,7 @@
 
 import numpy as np
 from scipy.linalg import expm
+from scipy.sparse import csr_matrix, issparse
 from qiskit import QiskitError
 from qiskit.quantum_info.operators import Operator
 from qiskit_ode.models import GeneratorModel
@@ -211,6 +212,16 @@ class TestGeneratorModel(QiskitOdeTestCase):
 
         self.assertAllClose(value, expected)
 
+        # lmult should agree with evaluate for vector and matrix states
+        y_vec = Array(np.arange(len(frame_op)) + 1j)
+        y_mat = Array(np.outer(y_vec, y_vec.conj()))
+        for y in [y_vec, y_mat, y_mat[:, :1]]:
+            self.assertAllClose(model.lmult(1.0, y), expected @ y)
+            self.assertAllClose(
+                model.lmult(1.0, y, in_frame_basis=True),
+                model.evaluate(1.0, in_frame_basis=True) @ y,
+            )
+
     def test_lmult_rmult_no_frame_basic_model(self):
         """Test evaluation with no frame in the basic model."""
 
@@ -297,6 +308,23 @@ class TestGeneratorModel(QiskitOdeTestCase):
         )
         self.assertAllClose(eval_rwa, expected)
 
+    def test_evaluate_time_array(self):
+        """Test evaluation on an array of times, in a frame with a cutoff frequency."""
+
+        def drive_func(t):
+            return t ** 2 + t ** 3 * 1j
+
+        self.basic_model.signals = [Constant(self.w), Signal(drive_func, self.w)]
+        self.basic_model.frame = self.basic_model.drift
+        self.basic_model.cutoff_freq = 2 * self.w
+
+        times = np.array([0.0, 0.31, 1.2, 2.1231 * np.pi])
+        for in_frame_basis in [False, True]:
+            values = self.basic_model.evaluate(times, in_frame_basis=in_frame_basis)
+            expected = [self.basic_model.evaluate(t, in_frame_basis=in_frame_basis) for t in times]
+            self.assertEqual(values.shape, (4, 2, 2))
+            self.assertAllClose(values, Array(expected))
+
     def assertAllClose(self, A, B, rtol=1e-8, atol=1e-8):
         """Call np.allclose and assert true."""
         self.assertTrue(np.allclose(A, B, rtol=rtol, atol=atol))
@@ -309,6 +337,86 @@ class TestGeneratorModelJax(TestGeneratorModel, TestJaxBase):
     """
 
 
+class TestGeneratorModelSparse(QiskitOdeTestCase):
+    """Tests for GeneratorModel in sparse evaluation mode, compared to dense evaluation."""
+
+    def setUp(self):
+        self.X = Array(Operator.from_label("X").data)
+        self.Y = Array(Operator.from_label("Y").data)
+        self.Z = Array(Operator.from_label("Z").data)
+
+        def drive_func(t):
+            return t ** 2 + t ** 3 * 1j
+
+        self.w = 2.0
+        self.operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * 0.5 * self.X / 2]
+        self.signals = [Constant(self.w), Signal(drive_func, self.w)]
+
+        self.dense_model = GeneratorModel(operators=self.operators, signals=self.signals)
+        self.sparse_model = GeneratorModel(
+            operators=[csr_matrix(op.data) for op in self.operators], signals=self.signals
+        )
+
+    def test_evaluation_mode(self):
+        """Test automatic selection and setting of the evaluation mode."""
+        self.assertTrue(self.dense_model.evaluation_mode == "dense")
+        self.assertTrue(self.sparse_model.evaluation_mode == "sparse")
+        self.assertTrue(all(issparse(op) for op in self.sparse_model.operators))
+
+        model = GeneratorModel(
+            operators=self.operators, signals=self.signals, evaluation_mode="sparse"
+        )
+        self.assertTrue(issparse(model.evaluate(0.1)))
+
+        model.evaluation_mode = "dense"
+        self.assertTrue(isinstance(model.operators, Array))
+        self.assertAllClose(model.evaluate(0.1), self.dense_model.evaluate(0.1))
+
+        with self.assertRaises(QiskitError):
+            model.evaluation_mode = "banana"
+
+    def test_evaluate_frames(self):
+        """Test evaluation and lmult in diagonal and non-diagonal frames."""
+        y = Array([[1.0, 2.0j], [0.5, -1.0]])
+        for frame in [None, Array([1j, -1j]), -1j * (self.Y + self.Z)]:
+            self.dense_model.frame = frame
+            self.sparse_model.frame = frame
+            for in_frame_basis in [False, True]:
+                value = self.sparse_model.evaluate(1.123, in_frame_basis=in_frame_basis)
+                expected = self.dense_model.evaluate(1.123, in_frame_basis=in_frame_basis)
+                self.assertTrue(issparse(value))
+                self.assertAllClose(value.toarray(), expected)
+
+                value = self.sparse_model.lmult(1.123, y, in_frame_basis=in_frame_basis)
+                expected = self.dense_model.lmult(1.123, y, in_frame_basis=in_frame_basis)
+                self.assertAllClose(value, expected)
+
+    def test_cutoff_freq(self):
+        """Test evaluation in the frame of the drift with a cutoff frequency."""
+        for model in [self.dense_model, self.sparse_model]:
+            model.frame = -1j * 2 * np.pi * self.w * self.Z / 2
+            model.cutoff_freq = 2 * self.w
+
+        value = self.sparse_model.evaluate(2.1231 * np.pi)
+        expected = self.dense_model.evaluate(2.1231 * np.pi)
+        self.assertAllClose(value.toarray(), expected)
+
+    def test_drift(self):
+        """Test drift is returned as a sparse matrix."""
+        drift = self.sparse_model.drift
+        self.assertTrue(issparse(drift))
+        self.assertAllClose(drift.toarray(), self.dense_model.drift)
+
+    def test_time_array_error(self):
+        """Test that evaluation at an array of times raises an error."""
+        with self.assertRaises(QiskitError):
+            self.sparse_model.evaluate(np.array([0.0, 1.0]))
+
+    def assertAllClose(self, A, B, rtol=1e-8, atol=1e-8):
+        """Call np.allclose and assert true."""
+        self.assertTrue(np.allclose(A, B, rtol=rtol, atol=atol))
+
+
 class TestCallableGenerator(QiskitOdeTestCase):
     """Tests for CallableGenerator."""
 
@@ -15,6 +15,7 @@
 
 import numpy as np
 from scipy.linalg import expm
+from scipy.sparse import csr_matrix, issparse
 from qiskit.quantum_info.operators import Operator
 from qiskit_ode.models import HamiltonianModel
 from qiskit_ode.signals import Constant, Signal, VectorSignal
@@ -206,6 +207,16 @@ class TestHamiltonianModel(QiskitOdeTestCase):
 
         self.assertAllClose(value, expected)
 
+        # lmult should agree with evaluate for vector and matrix states
+        y_vec = Array(np.arange(len(frame_op)) + 1j)
+        y_mat = Array(np.outer(y_vec, y_vec.conj()))
+        for y in [y_vec, y_mat, y_mat[:, :1]]:
+            self.assertAllClose(model.lmult(1.0, y), expected @ y)
+            self.assertAllClose(
+                model.lmult(1.0, y, in_frame_basis=True),
+                model.evaluate(1.0, in_frame_basis=True) @ y,
+            )
+
     def test_cutoff_freq(self):
         """Test evaluation with a cutoff frequency."""
 
@@ -236,9 +247,63 @@ class TestHamiltonianModel(QiskitOdeTestCase):
         )
         self.assertAllClose(eval_rwa, expected)
 
+        y = Array([[1.0, 2.0j], [0.5, 3.0]])
+        self.assertAllClose(self.basic_hamiltonian.lmult(t, y), expected @ y)
+
+    def test_evaluate_time_array(self):
+        """Test evaluation on an array of times in a frame."""
+
+        self.basic_hamiltonian.frame = self.basic_hamiltonian.drift
+
+        times = np.array([0.0, 0.31, 1.2, 2.1231 * np.pi])
+        for in_frame_basis in [False, True]:
+            values = self.basic_hamiltonian.evaluate(times, in_frame_basis=in_frame_basis)
+            expected = [
+                self.basic_hamiltonian.evaluate(t, in_frame_basis=in_frame_basis) for t in times
+            ]
+            self.assertEqual(values.shape, (4, 2, 2))
+            self.assertAllClose(values, Array(expected))
+
 
 class TestHamiltonianModelJax(TestHamiltonianModel, TestJaxBase):
     """Jax version of TestHamiltonianModel tests.
 
     Note: This class has no body but contains tests due to inheritance.
     """
+
+
+class TestHamiltonianModelSparse(QiskitOdeTestCase):
+    """Tests for HamiltonianModel in sparse evaluation mode."""
+
+    def setUp(self):
+        self.X = Array(Operator.from_label("X").data)
+        self.Z = Array(Operator.from_label("Z").data)
+
+        self.operators = [2 * np.pi * self.Z / 2, 2 * np.pi * 0.5 * self.X / 2]
+        self.signals = [Constant(2.0), Signal(1.0, 2.0)]
+
+    def test_evaluate(self):
+        """Test evaluation in a frame compared to dense evaluation."""
+        frame = -1j * 2 * np.pi * self.Z / 2
+        sparse_model = HamiltonianModel(
+            operators=[csr_matrix(op.data) for op in self.operators],
+            signals=self.signals,
+            frame=frame,
+        )
+        dense_model = HamiltonianModel(operators=self.operators, signals=self.signals, frame=frame)
+
+        for in_frame_basis in [False, True]:
+            value = sparse_model.evaluate(1.123, in_frame_basis=in_frame_basis)
+            expected = dense_model.evaluate(1.123, in_frame_basis=in_frame_basis)
+            self.assertTrue(issparse(value))
+            self.assertAllClose(value.toarray(), expected)
+
+        y = Array([1.0, 1.0j])
+        self.assertAllClose(sparse_model(1.123, y), dense_model(1.123, y))
+
+    def test_validation(self):
+        """Test that non-Hermitian sparse operators raise an error."""
+        with self.assertRaises(Exception):
+            HamiltonianModel(
+                operators=[csr_matrix(np.array([[0.0, 1.0], [0.0, 0.0]]))], signals=[Constant(1.0)]
+            )
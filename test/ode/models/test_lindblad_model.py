@@ -15,6 +15,8 @@
 
 import numpy as np
 from scipy.linalg import expm
+from scipy.sparse import csr_matrix, issparse
+from qiskit import QiskitError
 from qiskit.quantum_info.operators import Operator
 from qiskit_ode.models import HamiltonianModel, LindbladModel
 from qiskit_ode.signals import Constant, Signal, VectorSignal
@@ -192,3 +194,121 @@ class TestLindbladModelJax(TestLindbladModel, TestJaxBase):
 
     Note: This class has no body but contains tests due to inheritance.
     """
+
+
+class TestLindbladModelSparse(QiskitOdeTestCase):
+    """Tests for LindbladModel in sparse_vectorized evaluation mode."""
+
+    def test_sparse_vectorized(self):
+        """Test sparse_vectorized evaluation mode against dense evaluation."""
+        X = Array(Operator.from_label("X").data)
+        Z = Array(Operator.from_label("Z").data)
+        w, r = 2.0, 0.5
+        ham_operators = [2 * np.pi * Z / 2, 2 * np.pi * r * X / 2]
+        ham_signals = [Constant(w), Signal(1.0, w)]
+        noise_operators = [Array([[0.0, 0.0], [1.0, 0.0]])]
+
+        dense_lindblad = LindbladModel(
+            hamiltonian_operators=ham_operators,
+            hamiltonian_signals=ham_signals,
+            noise_operators=noise_operators,
+        )
+        sparse_lindblad = LindbladModel(
+            hamiltonian_operators=[csr_matrix(op.data) for op in ham_operators],
+            hamiltonian_signals=ham_signals,
+            noise_operators=[csr_matrix(op.data) for op in noise_operators],
+        )
+        self.assertTrue(sparse_lindblad.evaluation_mode == "sparse_vectorized")
+        self.assertTrue(all(issparse(op) for op in sparse_lindblad.operators))
+
+        frame_op = -1j * np.kron(np.eye(2), Z) + 1j * np.kron(Z.transpose(), np.eye(2))
+        sparse_lindblad.frame = frame_op
+        dense_lindblad.frame = frame_op
+
+        A = Array([[1.0, 2.0], [3.0, 4.0]])
+        t = 1.123
+        value = sparse_lindblad.lmult(t, A.flatten(order="F"))
+        expected = dense_lindblad.lmult(t, A.flatten(order="F"))
+        self.assertAllClose(value, expected)
+
+        # switch to dense
+        sparse_lindblad.evaluation_mode = "dense_vectorized"
+        self.assertAllClose(sparse_lindblad.evaluate(t), dense_lindblad.evaluate(t))
+
+        with self.assertRaises(QiskitError):
+            sparse_lindblad.evaluation_mode = "vectorized"
+
+
+class TestLindbladModelMatrixModes(QiskitOdeTestCase):
+    """Tests for LindbladModel in the matrix evaluation modes."""
+
+    def setUp(self):
+        rng = np.random.default_rng(5631)
+        dim = 5
+        num_ham = 3
+        num_diss = 2
+
+        rand_ham = rng.uniform(low=-1, high=1, size=(num_ham, dim, dim)) + 1j * rng.uniform(
+            low=-1, high=1, size=(num_ham, dim, dim)
+        )
+        self.ham_ops = Array(rand_ham + rand_ham.conj().transpose([0, 2, 1]))
+        ham_coeffs = rng.uniform(size=num_ham) + 1j * rng.uniform(size=num_ham)
+        self.ham_sigs = VectorSignal(
+            lambda t: ham_coeffs, Array(rng.uniform(size=num_ham)), Array(rng.uniform(size=num_ham))
+        )
+        self.noise_ops = Array(
+            rng.uniform(low=-1, high=1, size=(num_diss, dim, dim))
+            + 1j * rng.uniform(low=-1, high=1, size=(num_diss, dim, dim))
+        )
+        self.noise_sigs = [Constant(0.3), Signal(1.0, 0.5)]
+
+        self.vectorized_model = LindbladModel(
+            hamiltonian_operators=self.ham_ops,
+            hamiltonian_signals=self.ham_sigs,
+            noise_operators=self.noise_ops,
+            noise_signals=self.noise_sigs,
+        )
+
+        rho = rng.uniform(size=(dim, dim)) + 1j * rng.uniform(size=(dim, dim))
+        self.y = Array(rho.flatten(order="F"))
+        y_batch = rng.uniform(size=(dim ** 2, 3)) + 1j * rng.uniform(size=(dim ** 2, 3))
+        self.y_batch = Array(y_batch)
+
+    def test_lmult(self):
+        """Test lmult against the vectorized model, including a batch of states."""
+        for mode in ["dense", "sparse"]:
+            model = LindbladModel(
+                hamiltonian_operators=self.ham_ops,
+                hamiltonian_signals=self.ham_sigs,
+                noise_operators=self.noise_ops,
+                noise_signals=self.noise_sigs,
+                evaluation_mode=mode,
+            )
+
+            t = 0.7231
+            self.assertAllClose(model.lmult(t, self.y), self.vectorized_model.lmult(t, self.y))
+
+            self.assertAllClose(
+                model.lmult(t, self.y_batch), self.vectorized_model.lmult(t, self.y_batch)
+            )
+
+    def test_mode_switching(self):
+        """Test switching between matrix and vectorized modes."""
+        self.vectorized_model.evaluation_mode = "sparse"
+        self.assertTrue(all(issparse(op) for op in self.vectorized_model.operators))
+
+        value = self.vectorized_model.lmult(0.5, self.y)
+        self.vectorized_model.evaluation_mode = "dense_vectorized"
+        self.assertAllClose(value, self.vectorized_model.lmult(0.5, self.y))
+
+    def test_errors(self):
+        """Test errors for operations unsupported in matrix modes."""
+        self.vectorized_model.evaluation_mode = "dense"
+
+        with self.assertRaises(QiskitError):
+            self.vectorized_model.evaluate(0.5)
+
+        with self.assertRaises(QiskitError):
+            self.vectorized_model.frame = np.eye(25) * 1j
+
+        self.assertTrue(self.vectorized_model.drift is None)
@@ -17,7 +17,7 @@ Tests for signals.
 
 import numpy as np
 
-from qiskit_ode.signals import Constant, PiecewiseConstant, Signal
+from qiskit_ode.signals import Constant, PiecewiseConstant, Signal, VectorSignal
 from qiskit_ode.dispatch import Array
 
 from ..common import QiskitOdeTestCase, TestJaxBase
@@ -194,6 +194,95 @@ class TestSignals(QiskitOdeTestCase):
         )
         self.assertAlmostEqual((pwc1 + pwc2).envelope_value(4.0), expected, places=8)
 
+    def test_vector_signal_time_array(self):
+        """Test evaluation of a VectorSignal on an array of times."""
+
+        signal_list = [
+            Constant(2.0),
+            Signal(lambda t: 2.0 * t ** 2, carrier_freq=0.1, phase=-0.1),
+            PiecewiseConstant(dt=1.0, samples=[0.0, 1.0, 2.0, 3.0], carrier_freq=0.5),
+        ]
+        vector_signal = VectorSignal.from_signal_list(signal_list)
+
+        times = np.array([0.0, 1.5, 2.2, 3.9])
+        values = vector_signal.value(times)
+        expected = np.array([vector_signal.value(t) for t in times])
+
+        self.assertEqual(values.shape, (4, 3))
+        self.assertTrue(np.allclose(values, expected))
+        self.assertTrue(
+            np.allclose(vector_signal.envelope_value(times)[:, 2], [0.0, 1.0, 2.0, 3.0])
+        )
+
+    def test_vector_signal_pwc_samples(self):
+        """Test the stacked samples of a VectorSignal of piecewise constant signals."""
+
+        signal_list = [
+            PiecewiseConstant(dt=0.5, samples=[1.0, 2.0j, 3.0], carrier_freq=0.2, phase=0.1),
+            Constant(0.5),
+            PiecewiseConstant(dt=0.5, samples=[4.0, 5.0, 6.0, 7.0], carrier_freq=0.3),
+        ]
+        vector_signal = VectorSignal.from_signal_list(signal_list)
+
+        self.assertAllClose(
+            vector_signal.samples,
+            [[1.0, 0.5, 4.0], [2.0j, 0.5, 5.0], [3.0, 0.5, 6.0], [0.0, 0.5, 7.0]],
+        )
+        self.assertEqual(vector_signal.dt, 0.5)
+
+        times = np.array([0.0, 0.6, 1.2, 1.4])
+        expected = [[sig.value(t) for sig in signal_list] for t in times]
+        self.assertAllClose(vector_signal.value(times), expected)
+        self.assertAllClose(vector_signal.value(0.6), expected[1])
+        self.assertAllClose(vector_signal.conjugate().value(times), np.conjugate(expected))
+
+        # the shorter signal is zero after its last sample
+        self.assertAllClose(vector_signal.value(1.6), [0.0, 0.5, signal_list[2].value(1.6)])
+
+        # signals on different grids are not stacked
+        signal_list[2] = PiecewiseConstant(dt=0.25, samples=[4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+        vector_signal = VectorSignal.from_signal_list(signal_list)
+        self.assertIsNone(vector_signal.samples)
+        expected = [[sig.value(t) for sig in signal_list] for t in times]
+        self.assertAllClose(vector_signal.value(times), expected)
+
+    def test_time_arrays(self):
+        """Test evaluation of signals on arrays of times against evaluation at each time."""
+
+        # an envelope that can only be evaluated at a single time
+        def step(t):
+            return 1.0 if t < 1.0 else 2.0j
+
+        signal = Signal(step, carrier_freq=0.2, phase=0.3)
+        vectorized_signal = Signal(lambda t: np.cos(t), carrier_freq=0.1, vectorized=True)
+        pwc = PiecewiseConstant(dt=0.5, samples=[1.0, 2.0, 3.0, 4.0, 5.0], carrier_freq=0.4)
+        signals = [
+            Constant(0.3),
+            Signal(2.0, carrier_freq=0.5),
+            signal,
+            vectorized_signal,
+            pwc,
+            signal * pwc,
+            signal + vectorized_signal,
+            signal.conjugate(),
+        ]
+
+        times = np.array([0.0, 0.3, 1.1, 2.4])
+        for sig in signals:
+            self.assertTrue(
+                np.allclose(sig.envelope_value(times), [sig.envelope_value(t) for t in times])
+            )
+            self.assertTrue(np.allclose(sig.value(times), [sig.value(t) for t in times]))
+
+        self.assertTrue(np.allclose(signal.to_pwc(0.5, 4).samples, [1.0, 1.0, 2.0j, 2.0j]))
+
+        vector_signal = VectorSignal(
+            lambda t: Array([t, step(t)]), carrier_freqs=[0.0, 0.1], phases=[0.0, 0.0]
+        )
+        values = vector_signal.value(times)
+        self.assertEqual(values.shape, (4, 2))
+        self.assertTrue(np.allclose(values, [vector_signal.value(t) for t in times]))
+
 
 class TestSignalsJax(QiskitOdeTestCase, TestJaxBase):
     """Tests with some JAX functionality."""
@@ -213,6 +302,21 @@ class TestSignalsJax(QiskitOdeTestCase, TestJaxBase):
         expected = 3.0
         self.assertEqual(val2, expected)
 
+    def test_jit_VectorSignal_pwc(self):
+        """Verify that jit works through a VectorSignal of piecewise constant signals."""
+
+        vector_signal = VectorSignal.from_signal_list(
+            [
+                PiecewiseConstant(dt=1.0, samples=Array([1.0, 2.0, 3.0])),
+                PiecewiseConstant(dt=1.0, samples=Array([4.0, 5.0, 6.0])),
+            ]
+        )
+
+        jit_eval = jit(lambda t: vector_signal.value(t).data)
+
+        self.assertAllClose(jit_eval(1.5), Array([2.0, 5.0]))
+        self.assertAllClose(jit_eval(Array([0.5, 2.41]).data), Array([[1.0, 4.0], [3.0, 6.0]]))
+
     def test_grad_PiecewiseConstant(self):
         """Verify that grad works through PiecewiseConstant."""
 
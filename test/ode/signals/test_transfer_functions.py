@@ -16,7 +16,17 @@ Tests for signal transfer functions.
 """
 
 import numpy as np
-from qiskit_ode.signals import Convolution, PiecewiseConstant, Sampler, IQMixer, Signal
+
+from qiskit import QiskitError
+
+from qiskit_ode.signals import (
+    Convolution,
+    FFTConvolution,
+    PiecewiseConstant,
+    Sampler,
+    IQMixer,
+    Signal,
+)
 
 from ..common import QiskitOdeTestCase
 
@@ -76,6 +86,69 @@ class TestTransferFunctions(QiskitOdeTestCase):
         self.assertAlmostEqual(convolved.value(25.0), convolved2.value(25.0), places=6)
         self.assertAlmostEqual(convolved.value(30.0), convolved2.value(30.0), places=6)
 
+    def test_fft_convolution(self):
+        """Test FFTConvolution against Convolution."""
+
+        def gaussian(t):
+            return np.exp(-(t ** 2) / 8.0)
+
+        rng = np.random.default_rng(4123)
+        samples = rng.uniform(size=150)
+        for carrier_freq in [0.0, 0.13]:
+            signal = PiecewiseConstant(dt=0.5, samples=samples, carrier_freq=carrier_freq)
+            expected = Convolution(gaussian)(signal)
+            convolved = FFTConvolution(gaussian)(signal)
+
+            self.assertEqual(convolved.duration, expected.duration)
+            self.assertAllClose(convolved.samples, expected.samples)
+            self.assertEqual(convolved.carrier_freq, 0.0)
+
+        # overlap-add with a short kernel
+        signal = PiecewiseConstant(dt=0.5, samples=samples, carrier_freq=0.13, start_time=1.0)
+        convolved = FFTConvolution(gaussian, kernel_duration=20, chunk_size=32)(signal)
+
+        kernel = gaussian(0.5 * np.arange(20))
+        expected = np.convolve(
+            kernel / np.sum(kernel), signal.value(1.0 + 0.5 * np.arange(150)).data
+        )
+        self.assertEqual(convolved.duration, 169)
+        self.assertEqual(convolved.start_time, 1.0)
+        self.assertAllClose(convolved.samples, expected)
+
+        # Convolution samples from time zero rather than from the start time of the signal
+        signal = PiecewiseConstant(dt=0.5, samples=samples, start_time=1.0)
+        expected = Convolution(gaussian)(PiecewiseConstant(dt=0.5, samples=samples))
+        convolved = FFTConvolution(gaussian)(signal)
+        self.assertEqual(convolved.start_time, 1.0)
+        self.assertAllClose(convolved.samples, expected.samples)
+
+    def test_fft_convolution_unhashable_func(self):
+        """Test FFTConvolution with an unhashable convolution function, applied repeatedly."""
+
+        class Gaussian:
+            """Unhashable convolution function."""
+
+            def __init__(self, sigma):
+                self.sigma = sigma
+
+            def __eq__(self, other):
+                return isinstance(other, Gaussian) and self.sigma == other.sigma
+
+            def __call__(self, t):
+                return np.exp(-(t ** 2) / (2 * self.sigma ** 2))
+
+        signal = PiecewiseConstant(dt=0.5, samples=np.linspace(0.0, 1.0, 50))
+        expected = Convolution(Gaussian(2.0))(signal)
+
+        convolution = FFTConvolution(Gaussian(2.0), kernel_duration=50, chunk_size=16)
+        for _ in range(2):
+            self.assertAllClose(convolution(signal).samples, expected.samples)
+
+    def test_fft_convolution_chunk_size_requires_kernel_duration(self):
+        """Test that chunk_size without kernel_duration raises an error."""
+        with self.assertRaises(QiskitError):
+            FFTConvolution(lambda t: np.exp(-(t ** 2)), chunk_size=16)
+
     def test_sampler(self):
         """Test the sampler."""
         dt = 0.5
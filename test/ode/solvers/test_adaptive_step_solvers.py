@@ -0,0 +1,92 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+# pylint: disable=invalid-name
+
+"""
+Direct tests of adaptive step solvers.
+"""
+
+import numpy as np
+
+from scipy.integrate import solve_ivp
+from scipy.linalg import expm
+
+from qiskit_ode.solvers import scipy_adaptive_expm_solver
+
+from ..common import QiskitOdeTestCase
+
+
+class TestAdaptiveExpmSolver(QiskitOdeTestCase):
+    """Test cases for scipy_adaptive_expm_solver."""
+
+    def setUp(self):
+        X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+        self.X = X
+        self.generator = lambda t: -1j * (np.cos(3 * t) * Z + (1.0 + t * t) * X)
+
+        # reference solution for the time-dependent generator
+        self.y0 = np.array([1.0, 0.0], dtype=complex)
+        self.t_span = [0.0, 2.0]
+        self.t_eval = [0.0, 0.5, 1.3, 2.0]
+        self.expected = solve_ivp(
+            lambda t, y: self.generator(t) @ y,
+            self.t_span,
+            self.y0,
+            method="DOP853",
+            t_eval=self.t_eval,
+            rtol=1e-13,
+            atol=1e-13,
+        ).y.transpose()
+
+    def test_tolerances(self):
+        """Test that tightening the tolerances reduces the error and increases the step count."""
+        errors, n_steps = [], []
+        for tol in [1e-5, 1e-9]:
+            results = scipy_adaptive_expm_solver(
+                self.generator, self.t_span, self.y0, t_eval=self.t_eval, rtol=tol, atol=tol
+            )
+            self.assertAllClose(results.t, self.t_eval)
+            errors.append(np.max(np.abs(results.y - self.expected)))
+            n_steps.append(results.n_steps)
+
+            # tolerance is local, allow for accumulation
+            self.assertTrue(errors[-1] < 100 * tol)
+            self.assertEqual(results.nfev, 1 + 2 * (results.n_steps + results.n_rejected))
+
+        self.assertTrue(errors[1] < errors[0])
+        self.assertTrue(n_steps[1] > n_steps[0])
+
+    def test_backwards(self):
+        """Test integrating backwards."""
+        results = scipy_adaptive_expm_solver(
+            self.generator, [2.0, 0.0], self.expected[-1], rtol=1e-10, atol=1e-10
+        )
+        self.assertAllClose(results.y[-1], self.y0, atol=1e-8)
+
+    def test_constant_generator(self):
+        """Test that a long interval with constant generator is crossed in few steps."""
+        results = scipy_adaptive_expm_solver(
+            lambda t: -1j * self.X, [0.0, 1000.0], self.y0, first_step=0.1
+        )
+
+        self.assertAllClose(results.y[-1], expm(-1j * 1000.0 * self.X) @ self.y0)
+        self.assertTrue(results.n_steps < 6)
+        self.assertEqual(results.n_rejected, 0)
+
+    def test_max_dt(self):
+        """Test that max_dt bounds the step size."""
+        results = scipy_adaptive_expm_solver(
+            lambda t: -1j * self.X, [0.0, 1.0], self.y0, max_dt=0.1
+        )
+        self.assertEqual(results.n_steps, 10)
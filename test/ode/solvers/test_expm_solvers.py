@@ -15,12 +15,29 @@
 Direct tests of jax_expm_solver
 """
 
+from functools import partial
+
 import numpy as np
 
 from scipy.linalg import expm
+from scipy.sparse import csr_matrix
 
 from qiskit_ode.dispatch import Array
-from qiskit_ode.solvers import scipy_expm_solver, jax_expm_solver
+from qiskit_ode.solvers import (
+    scipy_expm_solver,
+    jax_expm_solver,
+    scipy_expm_parallel_solver,
+    jax_expm_parallel_solver,
+    scipy_expm_multiply_solver,
+    scipy_pwc_expm_solver,
+)
+from qiskit_ode.solvers.fixed_step_solvers import (
+    get_pwc_step_times,
+    get_fixed_step_schedule,
+    tree_product,
+    expm_anti_hermitian,
+    jax_expm_anti_hermitian,
+)
 
 from ..common import QiskitOdeTestCase, TestJaxBase
 
@@ -172,6 +189,237 @@ class TestExpmSolver(QiskitOdeTestCase):
         self.assertAllClose(expected_y, results.y)
 
 
+class TestExpmSolverAntiHermitian(TestExpmSolver):
+    """Test cases for scipy_expm_solver with anti_hermitian=True."""
+
+    def setUp(self):
+        super().setUp()
+        self.expm_solver = partial(scipy_expm_solver, anti_hermitian=True)
+
+    def test_expm_anti_hermitian(self):
+        """Test expm_anti_hermitian against expm, including for stacks of matrices."""
+        rng = np.random.default_rng(2131)
+        mats = rng.uniform(-1, 1, (3, 4, 4)) + 1j * rng.uniform(-1, 1, (3, 4, 4))
+        anti_herm = mats - mats.conj().transpose((0, 2, 1))
+
+        output = expm_anti_hermitian(anti_herm)
+        self.assertAllClose(output, np.array([expm(mat) for mat in anti_herm]))
+        self.assertAllClose(output[0] @ output[0].conj().transpose(), np.eye(4), atol=1e-14)
+
+
+class TestExpmParallelSolver(TestExpmSolver):
+    """Test cases for scipy_expm_parallel_solver."""
+
+    def setUp(self):
+        super().setUp()
+        self.expm_solver = scipy_expm_parallel_solver
+
+    def test_tree_product(self):
+        """Test tree_product for even and odd numbers of matrices."""
+        rng = np.random.default_rng(9231)
+        mats = rng.uniform(-1, 1, (7, 3, 3))
+
+        for n in range(1, 8):
+            expected = np.eye(3)
+            for mat in mats[:n]:
+                expected = mat @ expected
+            self.assertAllClose(tree_product(mats[:n]), expected)
+
+    def test_get_fixed_step_schedule(self):
+        """Test get_fixed_step_schedule."""
+        t_list = np.array([0.0, 0.3, 1.0])
+        h_list = np.array([0.1, 0.35])
+        n_steps_list = np.array([3, 2])
+
+        step_times, step_sizes, interval_end_idx = get_fixed_step_schedule(
+            t_list, h_list, n_steps_list
+        )
+
+        self.assertAllClose(step_times, np.array([0.0, 0.1, 0.2, 0.3, 0.65]))
+        self.assertAllClose(step_sizes, np.array([0.1, 0.1, 0.1, 0.35, 0.35]))
+        self.assertAllClose(interval_end_idx, np.array([2, 4]))
+
+    def test_agrees_with_scipy_expm_solver(self):
+        """Test agreement with the sequential solver."""
+        t_span = np.array([0.0, 1.0])
+        t_eval = np.array([0.1, 0.33, 0.5, 0.78])
+        y0 = np.eye(2, dtype=complex)
+
+        results = self.expm_solver(self.linear_generator, t_span, y0, max_dt=0.07, t_eval=t_eval)
+        expected = scipy_expm_solver(self.linear_generator, t_span, y0, max_dt=0.07, t_eval=t_eval)
+
+        self.assertAllClose(expected.t, results.t)
+        self.assertAllClose(expected.y, results.y)
+
+
+class TestExpmSolverVectorizedGenerator(QiskitOdeTestCase):
+    """Test cases for scipy_expm_solver and scipy_expm_parallel_solver with a generator
+    evaluated on the whole grid of step midpoints at once.
+    """
+
+    def setUp(self):
+        # generator accepting either a single time or a 1d array of times
+        def vectorized_generator(t):
+            t = np.expand_dims(t, (-2, -1))
+            return -1j * (
+                np.array([[0.0, 1.0], [1.0, 0.0]]) + t * np.array([[0.0, -1j], [1j, 0.0]])
+            )
+
+        self.vectorized_generator = vectorized_generator
+
+    def test_vectorized_generator(self):
+        """Test agreement with evaluating the generator once per step."""
+        t_span = np.array([0.0, 1.0])
+        t_eval = np.array([0.1, 0.33, 0.5, 0.78])
+        y0 = np.eye(2, dtype=complex)
+
+        expected = scipy_expm_solver(
+            self.vectorized_generator, t_span, y0, max_dt=0.07, t_eval=t_eval
+        )
+
+        for solver in [scipy_expm_solver, scipy_expm_parallel_solver]:
+            results = solver(
+                self.vectorized_generator,
+                t_span,
+                y0,
+                max_dt=0.07,
+                t_eval=t_eval,
+                vectorized_generator=True,
+            )
+            self.assertAllClose(expected.t, results.t)
+            self.assertAllClose(expected.y, results.y)
+
+    def test_chunk_size(self):
+        """Test that the results do not depend on the number of steps processed together."""
+        t_span = np.array([0.0, 1.0])
+        t_eval = np.array([0.1, 0.33, 0.5, 0.78])
+        y0 = np.eye(2, dtype=complex)
+
+        expected = scipy_expm_solver(
+            self.vectorized_generator, t_span, y0, max_dt=0.07, t_eval=t_eval
+        )
+        for chunk_size in [1, 3, 100]:
+            results = scipy_expm_solver(
+                self.vectorized_generator,
+                t_span,
+                y0,
+                max_dt=0.07,
+                t_eval=t_eval,
+                vectorized_generator=True,
+                chunk_size=chunk_size,
+            )
+            self.assertAllClose(expected.t, results.t)
+            self.assertAllClose(expected.y, results.y)
+
+    def test_vectorized_generator_backwards(self):
+        """Test agreement with evaluating the generator once per step, backwards in time."""
+        t_span = np.array([1.0, 0.0])
+        y0 = np.array([1.0, 0.0], dtype=complex)
+
+        expected = scipy_expm_solver(self.vectorized_generator, t_span, y0, max_dt=0.07)
+        results = scipy_expm_solver(
+            self.vectorized_generator, t_span, y0, max_dt=0.07, vectorized_generator=True
+        )
+
+        self.assertAllClose(expected.y, results.y)
+
+
+class TestExpmMultiplySolver(TestExpmSolver):
+    """Test cases for scipy_expm_multiply_solver."""
+
+    def setUp(self):
+        super().setUp()
+        self.expm_solver = scipy_expm_multiply_solver
+
+    def test_sparse_generator(self):
+        """Test solving with a generator returning sparse matrices."""
+
+        def sparse_generator(t):
+            return csr_matrix(self.linear_generator(t))
+
+        t_span = np.array([0.0, 1.0])
+        t_eval = np.array([0.3, 0.5, 0.78])
+        y0 = np.array([1.0, 0.0], dtype=complex)
+
+        results = self.expm_solver(sparse_generator, t_span, y0, max_dt=0.1, t_eval=t_eval)
+        expected = scipy_expm_solver(self.linear_generator, t_span, y0, max_dt=0.1, t_eval=t_eval)
+
+        self.assertAllClose(expected.y, results.y)
+
+
+class TestPWCExpmSolver(QiskitOdeTestCase):
+    """Test cases for scipy_pwc_expm_solver."""
+
+    def setUp(self):
+        self.X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        self.Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+        self.samples = np.array([1.0, 0.5, 1.0, 1.0, 0.0, 0.5])
+        self.dt = 0.2
+        self.n_gen_calls = 0
+
+        def generator(t):
+            self.n_gen_calls += 1
+            idx = int(t // self.dt)
+            return -1j * (self.Z + self.samples[idx] * self.X)
+
+        self.generator = generator
+
+    def test_get_pwc_step_times(self):
+        """Test alignment of steps with sample boundaries."""
+
+        step_times = get_pwc_step_times(0.1, 0.8, 0.2)
+        self.assertAllClose(step_times, [0.1, 0.2, 0.4, 0.6, 0.8])
+
+        step_times = get_pwc_step_times(0.8, 0.1, 0.2)
+        self.assertAllClose(step_times, [0.8, 0.6, 0.4, 0.2, 0.1])
+
+        step_times = get_pwc_step_times(0.0, 0.5, 0.2, start_time=0.1)
+        self.assertAllClose(step_times, [0.0, 0.1, 0.3, 0.5])
+
+    def test_exact_solution(self):
+        """Test that the solution is exact for piecewise constant generators."""
+
+        t_span = [0.0, 1.2]
+        t_eval = [0.0, 0.5, 1.2]
+        y0 = np.eye(2, dtype=complex)
+
+        results = scipy_pwc_expm_solver(self.generator, t_span, y0, dt=self.dt, t_eval=t_eval)
+
+        self.assertAllClose(results.t, t_eval)
+
+        def gen(idx):
+            return -1j * (self.Z + self.samples[idx] * self.X)
+
+        expected_y1 = expm(0.1 * gen(2)) @ expm(0.2 * gen(1)) @ expm(0.2 * gen(0))
+        expected_y2 = (
+            expm(0.2 * gen(5))
+            @ expm(0.2 * gen(4))
+            @ expm(0.2 * gen(3))
+            @ expm(0.1 * gen(2))
+            @ expected_y1
+        )
+
+        self.assertAllClose(results.y, np.array([y0, expected_y1, expected_y2]))
+
+    def test_cache(self):
+        """Test that exponentials of repeated samples are only computed once."""
+
+        def cache_key(t):
+            return np.array([self.samples[int(t // self.dt)]])
+
+        results = scipy_pwc_expm_solver(
+            self.generator, [0.0, 1.2], np.eye(2, dtype=complex), dt=self.dt, cache_key=cache_key
+        )
+
+        # only 3 distinct sample values
+        self.assertEqual(self.n_gen_calls, 3)
+
+        expected = np.eye(2, dtype=complex)
+        for sample in self.samples:
+            expected = expm(-1j * 0.2 * (self.Z + sample * self.X)) @ expected
+        self.assertAllClose(results.y[-1], expected)
+
+
 class TestJaxExpmSolver(TestExpmSolver, TestJaxBase):
     """Test cases for jax_expm_solver."""
 
@@ -184,6 +432,20 @@ class TestJaxExpmSolver(TestExpmSolver, TestJaxBase):
 
         self.expm_solver = jax_expm_solver
 
+    def test_uneven_intervals(self):
+        """Test t_eval intervals requiring very different numbers of steps."""
+        t_span = np.array([0.0, 3.0])
+        t_eval = np.array([0.01, 0.02, 2.9])
+        y0 = np.eye(2, dtype=complex)
+
+        results = self.expm_solver(self.linear_generator, t_span, y0, max_dt=0.1, t_eval=t_eval)
+        expected = scipy_expm_solver(
+            lambda t: np.array(self.linear_generator(t)), t_span, y0, max_dt=0.1, t_eval=t_eval
+        )
+
+        self.assertAllClose(expected.t, results.t)
+        self.assertAllClose(expected.y, results.y)
+
     def test_t_span_with_jit(self):
         """Test handling of t_span as a list with jit."""
 
@@ -207,3 +469,42 @@ class TestJaxExpmSolver(TestExpmSolver, TestJaxBase):
         expected_y = jexpm(1.0 * gen)
 
         self.assertAllClose(expected_y, output)
+
+
+class TestJaxExpmSolverAntiHermitian(TestJaxExpmSolver):
+    """Test cases for jax_expm_solver with anti_hermitian=True."""
+
+    def setUp(self):
+        super().setUp()
+        self.expm_solver = partial(jax_expm_solver, anti_hermitian=True)
+
+    def test_jax_expm_anti_hermitian(self):
+        """Test jax_expm_anti_hermitian against expm."""
+        mat = -1j * jnp.array([[1.0, 2.0 - 1j], [2.0 + 1j, -0.5]])
+        self.assertAllClose(jax_expm_anti_hermitian(mat), jexpm(mat))
+
+
+class TestJaxExpmParallelSolver(TestJaxExpmSolver):
+    """Test cases for jax_expm_parallel_solver."""
+
+    def setUp(self):
+        super().setUp()
+        self.expm_solver = jax_expm_parallel_solver
+
+    def test_agrees_with_jax_expm_solver(self):
+        """Test agreement with the sequential solver, including under jit."""
+        from jax import jit
+
+        t_span = np.array([0.0, 1.0])
+        t_eval = np.array([0.1, 0.33, 0.5, 0.78])
+        y0 = jnp.eye(2, dtype=complex)
+
+        def func(amp):
+            results = jax_expm_parallel_solver(
+                lambda t: amp * self.linear_generator(t), t_span, y0, max_dt=0.07, t_eval=t_eval
+            )
+            return Array(results.y).data
+
+        expected = jax_expm_solver(self.linear_generator, t_span, y0, max_dt=0.07, t_eval=t_eval)
+
+        self.assertAllClose(expected.y, jit(func)(1.0))
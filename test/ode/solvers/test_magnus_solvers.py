@@ -0,0 +1,108 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+# pylint: disable=invalid-name
+
+"""
+Direct tests of Magnus expansion based solvers.
+"""
+
+import numpy as np
+
+from scipy.integrate import solve_ivp
+from scipy.linalg import expm
+
+from qiskit import QiskitError
+from qiskit_ode.solvers import scipy_magnus_solver, jax_magnus_solver
+
+from ..common import QiskitOdeTestCase, TestJaxBase
+
+try:
+    import jax.numpy as jnp
+# pylint: disable=broad-except
+except Exception:
+    pass
+
+
+class TestMagnusSolver(QiskitOdeTestCase):
+    """Test cases for scipy_magnus_solver."""
+
+    def setUp(self):
+        X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+        self.constant_generator = lambda t: -1j * X
+        self.generator = lambda t: -1j * (np.cos(3 * t) * Z + (1.0 + t * t) * X)
+
+        self.magnus_solver = scipy_magnus_solver
+
+        # reference solution for the time-dependent generator
+        self.y0 = np.array([1.0, 0.0], dtype=complex)
+        self.t_span = [0.0, 2.0]
+        self.expected = solve_ivp(
+            lambda t, y: self.generator(t) @ y,
+            self.t_span,
+            self.y0,
+            method="DOP853",
+            rtol=1e-13,
+            atol=1e-13,
+        ).y[:, -1]
+
+    def test_constant_generator(self):
+        """Test that the solution is exact for a constant generator with t_eval."""
+        t_eval = [0.3, 0.5, 0.78]
+        y0 = np.eye(2, dtype=complex)
+        results = self.magnus_solver(
+            self.constant_generator, [0.0, 1.0], y0, max_dt=0.1, t_eval=t_eval, order=6
+        )
+
+        self.assertAllClose(t_eval, results.t)
+        gen = self.constant_generator(0.0)
+        self.assertAllClose(np.array([expm(t * gen) for t in t_eval]), results.y)
+
+    def test_convergence_order(self):
+        """Test that the error scales according to the order of the expansion."""
+        for order in [2, 4, 6]:
+            errors = []
+            for max_dt in [0.1, 0.05]:
+                results = self.magnus_solver(
+                    self.generator, self.t_span, self.y0, max_dt=max_dt, order=order
+                )
+                errors.append(np.linalg.norm(results.y[-1] - self.expected))
+
+            self.assertTrue(np.abs(np.log2(errors[0] / errors[1]) - order) < 0.2)
+
+    def test_backwards(self):
+        """Test integrating backwards."""
+        results = self.magnus_solver(
+            self.generator, [2.0, 0.0], self.expected, max_dt=0.01, order=6
+        )
+        self.assertAllClose(results.y[-1], self.y0, atol=1e-10)
+
+    def test_invalid_order(self):
+        """Test error raised for unsupported order."""
+        with self.assertRaises(QiskitError):
+            self.magnus_solver(self.generator, self.t_span, self.y0, max_dt=0.1, order=3)
+
+
+class TestJaxMagnusSolver(TestMagnusSolver, TestJaxBase):
+    """Test cases for jax_magnus_solver."""
+
+    def setUp(self):
+        super().setUp()
+
+        X = jnp.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        Z = jnp.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+        self.constant_generator = lambda t: -1j * X
+        self.generator = lambda t: -1j * (jnp.cos(3 * t) * Z + (1.0 + t * t) * X)
+
+        self.magnus_solver = jax_magnus_solver
@@ -0,0 +1,106 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+# pylint: disable=invalid-name
+
+"""
+Direct tests of fixed-step Runge-Kutta solvers.
+"""
+
+import numpy as np
+
+from scipy.integrate import solve_ivp
+
+from qiskit_ode.dispatch import Array
+from qiskit_ode.solvers import scipy_rk4_solver, jax_rk4_solver
+
+from ..common import QiskitOdeTestCase, TestJaxBase
+
+try:
+    import jax.numpy as jnp
+# pylint: disable=broad-except
+except Exception:
+    pass
+
+
+class TestRK4Solver(QiskitOdeTestCase):
+    """Test cases for scipy_rk4_solver."""
+
+    def setUp(self):
+        X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+        self.rhs = lambda t, y: -1j * (np.cos(3 * t) * Z + (1.0 + t * t) * X) @ y
+
+        self.rk4_solver = scipy_rk4_solver
+
+        # reference solution
+        self.y0 = np.array([1.0, 0.0], dtype=complex)
+        self.t_span = [0.0, 2.0]
+        self.expected = solve_ivp(
+            self.rhs, self.t_span, self.y0, method="DOP853", rtol=1e-13, atol=1e-13
+        ).y[:, -1]
+
+    def test_t_eval(self):
+        """Test handling of t_eval for a problem with polynomial solution, which is exact."""
+
+        # pylint: disable=unused-argument
+        def cubic_rhs(t, y):
+            return 3 * t * t + 0.0 * y
+
+        t_eval = [0.3, 0.5, 0.78]
+        results = self.rk4_solver(cubic_rhs, [0.0, 1.0], np.array([0.0]), max_dt=0.1, t_eval=t_eval)
+
+        self.assertAllClose(t_eval, results.t)
+        self.assertAllClose(np.array(t_eval) ** 3, Array(results.y)[:, 0])
+
+    def test_convergence_order(self):
+        """Test that the error scales with the fourth power of the step size."""
+        errors = []
+        for max_dt in [0.1, 0.05]:
+            results = self.rk4_solver(self.rhs, self.t_span, self.y0, max_dt=max_dt)
+            errors.append(np.linalg.norm(results.y[-1] - self.expected))
+
+        self.assertTrue(np.abs(np.log2(errors[0] / errors[1]) - 4) < 0.2)
+
+    def test_backwards(self):
+        """Test integrating backwards."""
+        results = self.rk4_solver(self.rhs, [2.0, 0.0], self.expected, max_dt=0.001)
+        self.assertAllClose(results.y[-1], self.y0, atol=1e-10)
+
+
+class TestJaxRK4Solver(TestRK4Solver, TestJaxBase):
+    """Test cases for jax_rk4_solver."""
+
+    def setUp(self):
+        super().setUp()
+
+        X = jnp.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+        Z = jnp.array([[1.0, 0.0], [0.0, -1.0]], dtype=complex)
+
+        self.rhs = lambda t, y: -1j * (jnp.cos(3 * t) * Z + (1.0 + t * t) * X) @ y
+
+        self.rk4_solver = jax_rk4_solver
+
+    def test_jit_grad(self):
+        """Test that the solver can be compiled and differentiated."""
+        from jax import jit, grad
+
+        X = jnp.array([[0.0, 1.0], [1.0, 0.0]], dtype=complex)
+
+        def func(amp):
+            results = jax_rk4_solver(
+                lambda t, y: -1j * amp * X @ y, [0.0, 1.0], self.y0, max_dt=0.01
+            )
+            return jnp.abs(Array(results.y[-1]).data[0]) ** 2
+
+        self.assertAllClose(jit(func)(1.0), np.cos(1.0) ** 2)
+        self.assertAllClose(jit(grad(func))(1.0), -np.sin(2.0))
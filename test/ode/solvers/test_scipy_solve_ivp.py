@@ -0,0 +1,111 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+# pylint: disable=invalid-name
+
+"""
+Tests for scipy_solve_ivp.
+"""
+
+import numpy as np
+from scipy.linalg import expm
+from scipy.sparse import csr_matrix, issparse
+
+from qiskit_ode.solvers import scipy_solve_ivp
+from qiskit_ode.solvers.scipy_solve_ivp import real_lmde_rhs, lmde_jac, real_rhs, c2r
+from qiskit_ode.dispatch import Array
+
+from ..common import QiskitOdeTestCase
+
+
+class TestRealLMDEEmbedding(QiskitOdeTestCase):
+    """Tests for the real embedding of LMDEs constructed from the generator."""
+
+    def setUp(self):
+        rng = np.random.default_rng(5213)
+        self.gen = rng.uniform(-1, 1, (3, 3)) + 1j * rng.uniform(-1, 1, (3, 3))
+        self.rng = rng
+
+    def _test_embedding(self, gen, n_cols):
+        """Compare rhs and Jacobian to the wrapped complex rhs."""
+        rhs = real_lmde_rhs(lambda t: t * gen, 3, n_cols)
+        jac = lmde_jac(lambda t: t * gen, n_cols, real_embedding=True)
+        expected_rhs = real_rhs(
+            lambda t, y: (t * gen @ y.reshape((3, n_cols), order="F")).flatten(order="F")
+        )
+
+        y = self.rng.uniform(-1, 1, 3 * n_cols) + 1j * self.rng.uniform(-1, 1, 3 * n_cols)
+        z = c2r(y)
+
+        self.assertAllClose(rhs(2.0, z), expected_rhs(2.0, z))
+        self.assertAllClose(jac(2.0, z) @ z, expected_rhs(2.0, z))
+
+    def test_vector_state(self):
+        """Test embedding for vector states."""
+        self._test_embedding(self.gen, 1)
+
+    def test_matrix_state(self):
+        """Test embedding for matrix states."""
+        self._test_embedding(self.gen, 2)
+
+    def test_real_generator(self):
+        """Test embedding for a real generator."""
+        self._test_embedding(self.gen.real, 2)
+
+    def test_sparse_generator(self):
+        """Test embedding and Jacobians for a sparse generator."""
+        sparse_gen = csr_matrix(self.gen)
+        y = self.rng.uniform(-1, 1, 6) + 1j * self.rng.uniform(-1, 1, 6)
+        z = c2r(y)
+
+        rhs = real_lmde_rhs(lambda t: sparse_gen, 3, 2)
+        self.assertAllClose(rhs(0.0, z), real_lmde_rhs(lambda t: self.gen, 3, 2)(0.0, z))
+
+        real_jac = lmde_jac(lambda t: sparse_gen, 2, real_embedding=True)(0.0, z)
+        self.assertTrue(issparse(real_jac))
+        self.assertAllClose(real_jac @ z, rhs(0.0, z))
+
+        jac = lmde_jac(lambda t: sparse_gen, 2)(0.0, y)
+        self.assertTrue(issparse(jac))
+        self.assertAllClose(jac.toarray(), np.kron(np.eye(2), self.gen))
+
+        dense_jac = lmde_jac(lambda t: sparse_gen, 2, dense=True)(0.0, y)
+        self.assertFalse(issparse(dense_jac))
+
+    def test_dense_generator_jac(self):
+        """Test that Jacobians for dense generators and multiple columns are sparse unless
+        dense Jacobians are required."""
+        y = self.rng.uniform(-1, 1, 6) + 1j * self.rng.uniform(-1, 1, 6)
+
+        jac = lmde_jac(lambda t: self.gen, 2)(0.0, y)
+        self.assertTrue(issparse(jac))
+        self.assertAllClose(jac.toarray(), np.kron(np.eye(2), self.gen))
+
+        dense_jac = lmde_jac(lambda t: self.gen, 2, dense=True)(0.0, y)
+        self.assertFalse(issparse(dense_jac))
+        self.assertAllClose(dense_jac, np.kron(np.eye(2), self.gen))
+
+        self.assertFalse(issparse(lmde_jac(lambda t: self.gen, 1)(0.0, y[:3])))
+
+    def test_solve(self):
+        """Test solving with the generator for methods using a Jacobian."""
+        y0 = Array(np.eye(3, dtype=complex))
+        for method in ["BDF", "LSODA", "Radau"]:
+            results = scipy_solve_ivp(
+                lambda t, y: self.gen @ y,
+                Array([0.0, 1.0]),
+                y0,
+                method,
+                generator=lambda t: self.gen,
+                atol=1e-10,
+                rtol=1e-10,
+            )
+            self.assertAllClose(results.y[-1], expm(self.gen), atol=1e-7)
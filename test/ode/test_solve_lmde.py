@@ -15,10 +15,14 @@
 
 import numpy as np
 from scipy.linalg import expm
+from scipy.sparse import csr_matrix
 
-from qiskit_ode.models import GeneratorModel
-from qiskit_ode.signals import Constant, Signal
-from qiskit_ode import solve_lmde
+from qiskit import QiskitError
+from qiskit.quantum_info import Operator, Statevector
+
+from qiskit_ode.models import GeneratorModel, HamiltonianModel, LindbladModel
+from qiskit_ode.signals import Constant, Signal, PiecewiseConstant
+from qiskit_ode import solve_lmde, solve_lmde_iter
 from qiskit_ode.solve import setup_lmde_frames_and_generator, lmde_y0_reshape
 from qiskit_ode.dispatch import Array
 
@@ -62,6 +66,12 @@ class TestLMDESetup(QiskitOdeTestCase):
             np.allclose(generator.frame.frame_operator, -1j * 2 * np.pi * self.w * self.Z / 2)
         )
 
+        # the drift is diagonal, so the solver frame basis is the identity
+        self.assertAllClose(generator.frame.frame_basis, np.eye(2))
+        self.assertAllClose(
+            generator.frame.frame_diag, -1j * 2 * np.pi * self.w * Array([0.5, -0.5])
+        )
+
     def test_y0_reshape(self):
         """Test automatic detection of vectorized LMDE."""
 
@@ -170,6 +180,55 @@ class Testsolve_lmde_Base(QiskitOdeTestCase):
 
         self.assertAllClose(results.y[-1], expected)
 
+    def _batched_y0_tests(self, method, **kwargs):
+        """Solve a batch of initial states and compare to individual solves."""
+        y0_batch = Array([[1.0, 0.0], [0.0, 1.0], [1.0 / np.sqrt(2), 1j / np.sqrt(2)]])
+
+        results = solve_lmde(
+            self.basic_generator,
+            t_span=self.t_span,
+            y0=y0_batch,
+            method=method,
+            t_eval=[0.0, 0.5, 1.0],
+            batched_y0=True,
+            **kwargs,
+        )
+
+        self.assertTrue(Array(results.y).shape == (3, 3, 2))
+        for idx, y0 in enumerate(y0_batch):
+            single_results = solve_lmde(
+                self.basic_generator,
+                t_span=self.t_span,
+                y0=y0,
+                method=method,
+                t_eval=[0.0, 0.5, 1.0],
+                **kwargs,
+            )
+            self.assertAllClose(Array(results.y)[:, idx], single_results.y, atol=1e-6, rtol=1e-6)
+
+    def _batched_vectorized_y0_tests(self, method, **kwargs):
+        """Solve a batch of matrix states for a vectorized generator."""
+        gen = -1j * 2 * np.pi * self.X.data / 2
+        ident = np.eye(2, dtype=complex)
+
+        # vectorized generator for the map rho -> G rho
+        def vec_generator(t):
+            return Array(np.kron(ident, gen))
+
+        y0_batch = Array([[[1.0, 0.0], [0.0, 0.0]], [[0.5, 0.5], [0.5, 0.5]]], dtype=complex)
+
+        results = solve_lmde(
+            vec_generator,
+            t_span=self.t_span,
+            y0=y0_batch,
+            method=method,
+            batched_y0=True,
+            **kwargs,
+        )
+
+        expected = np.array([expm(gen) @ y0 for y0 in y0_batch.data])
+        self.assertAllClose(results.y[-1], expected, atol=1e-6, rtol=1e-6)
+
 
 class Testsolve_lmde_scipy_expm(Testsolve_lmde_Base):
     """Basic tests for solve_lmde with method=='expm'."""
@@ -178,6 +237,621 @@ class Testsolve_lmde_scipy_expm(Testsolve_lmde_Base):
         """Test scipy_expm_solver."""
         self._fixed_step_LMDE_method_tests("scipy_expm")
 
+    def test_batched_y0(self):
+        """Test batched initial states with scipy_expm_solver."""
+        self._batched_y0_tests("scipy_expm", max_dt=0.1)
+
+    def test_batched_vectorized_y0(self):
+        """Test batched vectorized initial states with scipy_expm_solver."""
+        self._batched_vectorized_y0_tests("scipy_expm", max_dt=0.1)
+
+
+class Testsolve_lmde_vectorized_generator(Testsolve_lmde_Base):
+    """Tests for solve_lmde with models evaluated on the whole grid of step midpoints."""
+
+    def test_generator_model(self):
+        """Test agreement with evaluating the model once per step."""
+        operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(lambda t: t + 0.5j * t ** 2, 1.0)]
+        model = GeneratorModel(operators=operators, signals=signals, frame=-1j * self.Z)
+
+        for method in ["scipy_expm", "scipy_expm_parallel"]:
+            results = solve_lmde(
+                model,
+                t_span=[0.0, 1.0],
+                y0=self.y0,
+                t_eval=[0.0, 0.4, 1.0],
+                method=method,
+                max_dt=0.01,
+            )
+            expected = solve_lmde(
+                model,
+                t_span=[0.0, 1.0],
+                y0=self.y0,
+                t_eval=[0.0, 0.4, 1.0],
+                method=method,
+                max_dt=0.01,
+                vectorized_generator=False,
+            )
+            self.assertAllClose(results.y, expected.y, atol=1e-12)
+
+
+class Testsolve_lmde_scipy_expm_parallel(Testsolve_lmde_Base):
+    """Basic tests for solve_lmde with method=='scipy_expm_parallel'."""
+
+    def test_scipy_expm_parallel_solver(self):
+        """Test scipy_expm_parallel_solver."""
+        self._fixed_step_LMDE_method_tests("scipy_expm_parallel")
+
+
+class Testsolve_lmde_jax_expm_parallel(Testsolve_lmde_Base, TestJaxBase):
+    """Basic tests for solve_lmde with method=='jax_expm_parallel'."""
+
+    def test_jax_expm_parallel_solver(self):
+        """Test jax_expm_parallel_solver."""
+        self._fixed_step_LMDE_method_tests("jax_expm_parallel")
+
+
+class Testsolve_lmde_scipy_adaptive_expm(Testsolve_lmde_Base):
+    """Basic tests for solve_lmde with method=='scipy_adaptive_expm'."""
+
+    def test_scipy_adaptive_expm_solver(self):
+        """Test scipy_adaptive_expm_solver."""
+        results = solve_lmde(
+            self.basic_generator, t_span=self.t_span, y0=self.y0, method="scipy_adaptive_expm"
+        )
+
+        expected = expm(-1j * np.pi * self.X.data)
+
+        self.assertAllClose(results.y[-1], expected)
+        self.assertTrue(results.n_steps > 0)
+
+    def test_batched_y0(self):
+        """Test batched initial states with scipy_adaptive_expm_solver."""
+        self._batched_y0_tests("scipy_adaptive_expm")
+
+
+class Testsolve_lmde_scipy_magnus(Testsolve_lmde_Base):
+    """Basic tests for solve_lmde with method=='scipy_magnus'."""
+
+    def test_scipy_magnus_solver(self):
+        """Test scipy_magnus_solver."""
+        self._fixed_step_LMDE_method_tests("scipy_magnus")
+
+
+class Testsolve_lmde_jax_magnus(Testsolve_lmde_Base, TestJaxBase):
+    """Basic tests for solve_lmde with method=='jax_magnus'."""
+
+    def test_jax_magnus_solver(self):
+        """Test jax_magnus_solver."""
+        self._fixed_step_LMDE_method_tests("jax_magnus")
+
+
+class Testsolve_lmde_scipy_expm_multiply(Testsolve_lmde_Base):
+    """Basic tests for solve_lmde with method=='scipy_expm_multiply'."""
+
+    def test_scipy_expm_multiply_solver(self):
+        """Test scipy_expm_multiply_solver."""
+        self._fixed_step_LMDE_method_tests("scipy_expm_multiply")
+
+    def test_sparse_generator(self):
+        """Test scipy_expm_multiply_solver with a sparse callable generator."""
+
+        def sparse_generator(t):
+            return csr_matrix(self.basic_generator(t).data)
+
+        results = solve_lmde(
+            sparse_generator,
+            t_span=self.t_span,
+            y0=self.y0,
+            method="scipy_expm_multiply",
+            max_dt=0.1,
+        )
+
+        self.assertAllClose(results.y[-1], expm(-1j * np.pi * self.X.data))
+
+
+class Testsolve_lmde_anti_hermitian(Testsolve_lmde_Base):
+    """Tests for solve_lmde with HamiltonianModels, using eigendecomposition based
+    exponentials.
+    """
+
+    def test_hamiltonian_model(self):
+        """Test that HamiltonianModel solutions agree with GeneratorModel solutions."""
+        operators = [2 * np.pi * self.Z / 2, 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        ham_model = HamiltonianModel(operators=operators, signals=signals)
+        gen_model = GeneratorModel(operators=[-1j * op for op in operators], signals=signals)
+
+        ham_results = solve_lmde(
+            ham_model, t_span=[0.0, 2.0], y0=self.y0, method="scipy_expm", max_dt=0.01
+        )
+        gen_results = solve_lmde(
+            gen_model, t_span=[0.0, 2.0], y0=self.y0, method="scipy_expm", max_dt=0.01
+        )
+
+        self.assertAllClose(ham_results.y[-1], gen_results.y[-1], atol=1e-10)
+        unitary = np.array(ham_results.y[-1])
+        self.assertAllClose(unitary @ unitary.conj().transpose(), np.eye(2), atol=1e-14)
+
+
+class Testsolve_lmde_scipy_pwc_expm(Testsolve_lmde_Base):
+    """Tests for solve_lmde with method=='scipy_pwc_expm'."""
+
+    def test_piecewise_constant_model(self):
+        """Test automatic detection of the sample grid for a GeneratorModel."""
+        samples = np.array([0.0, 1.0, 1.0, 0.5, 0.0, 0.0, 1.0])
+        dt = 0.15
+        operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * self.X / 2]
+        signals = [Constant(1.0), PiecewiseConstant(dt, samples)]
+        model = GeneratorModel(operators=operators, signals=signals)
+
+        results = solve_lmde(model, t_span=[0.0, 1.0], y0=self.y0, method="scipy_pwc_expm")
+
+        expected = np.eye(2, dtype=complex)
+        for idx, sample in enumerate(samples):
+            h = min(dt, 1.0 - idx * dt)
+            gen = -1j * 2 * np.pi * (self.Z.data + sample * self.X.data) / 2
+            expected = expm(h * gen) @ expected
+
+        self.assertAllClose(results.y[-1], expected)
+
+    def test_callable_generator(self):
+        """Test scipy_pwc_expm with a callable generator and explicit dt."""
+        results = solve_lmde(
+            self.basic_generator, t_span=self.t_span, y0=self.y0, method="scipy_pwc_expm", dt=0.25
+        )
+        expected = expm(-1j * np.pi * self.X.data)
+        self.assertAllClose(results.y[-1], expected)
+
+
+class Testsolve_lmde_jac_methods(Testsolve_lmde_Base):
+    """Tests for solve_lmde with solve_ivp methods using a Jacobian."""
+
+    def test_real_methods(self):
+        """Test methods using a Jacobian, with the real embedding built from the generator."""
+        for method in ["BDF", "LSODA", "Radau"]:
+            results = solve_lmde(
+                self.basic_generator,
+                t_span=self.t_span,
+                y0=self.y0,
+                method=method,
+                atol=1e-10,
+                rtol=1e-10,
+            )
+            self.assertAllClose(results.y[-1], expm(-1j * np.pi * self.X.data), atol=1e-7)
+
+    def test_batched_y0(self):
+        """Test batched initial states with LSODA and BDF."""
+        self._batched_y0_tests("LSODA", atol=1e-10, rtol=1e-10)
+        self._batched_y0_tests("BDF", atol=1e-10, rtol=1e-10)
+
+    def test_sparse_generator(self):
+        """Test methods using a Jacobian with a sparse callable generator."""
+
+        def sparse_generator(t):
+            return csr_matrix(self.basic_generator(t).data)
+
+        for method in ["BDF", "LSODA", "Radau"]:
+            results = solve_lmde(
+                sparse_generator,
+                t_span=self.t_span,
+                y0=Array([1.0, 0.0], dtype=complex),
+                method=method,
+                atol=1e-10,
+                rtol=1e-10,
+            )
+            expected = expm(-1j * np.pi * self.X.data)[:, 0]
+            self.assertAllClose(results.y[-1], expected, atol=1e-7)
+
+
+class Testsolve_lmde_sparse_model(Testsolve_lmde_Base):
+    """Tests for solve_lmde with models in sparse evaluation mode."""
+
+    def test_hamiltonian_model(self):
+        """Test a sparse HamiltonianModel, solved in the frame of the drift, against the
+        dense model."""
+        operators = [2 * np.pi * self.Z / 2, 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        dense_model = HamiltonianModel(operators=operators, signals=signals)
+        sparse_model = HamiltonianModel(
+            operators=operators, signals=signals, evaluation_mode="sparse"
+        )
+
+        y0 = Array([1.0, 0.0], dtype=complex)
+        t_eval = [0.0, 0.4, 1.0]
+        expected = solve_lmde(
+            dense_model, t_span=self.t_span, y0=y0, t_eval=t_eval, atol=1e-10, rtol=1e-10
+        )
+        for method, kwargs in [
+            ("DOP853", {"atol": 1e-10, "rtol": 1e-10}),
+            ("BDF", {"atol": 1e-10, "rtol": 1e-10}),
+            ("scipy_expm_multiply", {"max_dt": 0.001}),
+        ]:
+            results = solve_lmde(
+                sparse_model, t_span=self.t_span, y0=y0, t_eval=t_eval, method=method, **kwargs
+            )
+            self.assertAllClose(results.y, expected.y, atol=1e-6)
+
+    def test_auto_solver_frame(self):
+        """Test that the drift is only used as the default solver frame if it is diagonal."""
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        model = HamiltonianModel(
+            operators=[self.Z, self.X], signals=signals, evaluation_mode="sparse"
+        )
+        _, _, generator = setup_lmde_frames_and_generator(model)
+        self.assertAllClose(generator.frame.frame_diag, -1j * np.array([1.0, -1.0]))
+
+        model = HamiltonianModel(
+            operators=[self.X, self.Z], signals=signals, evaluation_mode="sparse"
+        )
+        _, _, generator = setup_lmde_frames_and_generator(model)
+        self.assertTrue(generator.frame.frame_operator is None)
+
+        model = LindbladModel(
+            hamiltonian_operators=[self.X, self.Z],
+            hamiltonian_signals=signals,
+            evaluation_mode="sparse_vectorized",
+        )
+        _, _, generator = setup_lmde_frames_and_generator(model)
+        self.assertTrue(generator.frame.frame_operator is None)
+
+    def test_expm_methods_error(self):
+        """Test that methods computing dense matrix exponentials raise an error."""
+        operators = [2 * np.pi * self.Z / 2, 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        y0 = Array([1.0, 0.0], dtype=complex)
+        hamiltonian = HamiltonianModel(
+            operators=operators, signals=signals, evaluation_mode="sparse"
+        )
+        lindbladian = LindbladModel(
+            hamiltonian_operators=operators,
+            hamiltonian_signals=signals,
+            evaluation_mode="sparse_vectorized",
+        )
+        for model, state in [(hamiltonian, y0), (lindbladian, np.outer(y0, y0))]:
+            for method in ["scipy_expm", "scipy_magnus", "scipy_adaptive_expm"]:
+                with self.assertRaisesRegex(QiskitError, "scipy_expm_multiply"):
+                    solve_lmde(model, t_span=self.t_span, y0=state, method=method, max_dt=0.1)
+
+
+class Testsolve_lmde_lindblad_matrix_mode(Testsolve_lmde_Base):
+    """Tests for solve_lmde with a LindbladModel in a matrix evaluation mode."""
+
+    def test_matrix_modes(self):
+        """Test matrix modes against the vectorized model."""
+        kwargs = {
+            "hamiltonian_operators": [2 * np.pi * self.Z / 2, 2 * np.pi * 0.3 * self.X / 2],
+            "hamiltonian_signals": [Constant(1.0), Signal(1.0, 1.0)],
+            "noise_operators": [Array([[0.0, 0.0], [1.0, 0.0]])],
+            "noise_signals": [Constant(0.1)],
+        }
+        rho0 = Array([[0.5, 0.5], [0.5, 0.5]], dtype=complex)
+        solver_kwargs = {"t_eval": [0.0, 0.4, 1.0], "atol": 1e-10, "rtol": 1e-10}
+
+        expected = solve_lmde(LindbladModel(**kwargs), t_span=self.t_span, y0=rho0, **solver_kwargs)
+        for mode in ["dense", "sparse"]:
+            for method in ["DOP853", "BDF"]:
+                results = solve_lmde(
+                    LindbladModel(evaluation_mode=mode, **kwargs),
+                    t_span=self.t_span,
+                    y0=rho0,
+                    method=method,
+                    **solver_kwargs,
+                )
+                self.assertAllClose(results.y, expected.y, atol=1e-7)
+
+
+class Testsolve_lmde_dense_output(Testsolve_lmde_Base):
+    """Tests for dense output of solve_lmde."""
+
+    def test_dense_output_frames(self):
+        """Test that the interpolant agrees with results at t_eval, with frames."""
+        operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        model = GeneratorModel(operators=operators, signals=signals, frame=-1j * self.X)
+
+        t_eval = [0.1, 0.45, 0.8]
+        for method in ["DOP853", "LSODA"]:
+            kwargs = {"method": method, "atol": 1e-10, "rtol": 1e-10}
+            results = solve_lmde(model, t_span=self.t_span, y0=self.y0, dense_output=True, **kwargs)
+            expected = solve_lmde(model, t_span=self.t_span, y0=self.y0, t_eval=t_eval, **kwargs)
+
+            self.assertAllClose(results.sol(t_eval), expected.y, atol=1e-7)
+            self.assertAllClose(results.sol(0.8), expected.y[-1], atol=1e-7)
+
+    def test_dense_output_batched_y0(self):
+        """Test dense output with a batch of initial states."""
+        y0_batch = Array([[1.0, 0.0], [0.0, 1.0]], dtype=complex)
+        results = solve_lmde(
+            self.basic_generator,
+            t_span=self.t_span,
+            y0=y0_batch,
+            method="DOP853",
+            batched_y0=True,
+            dense_output=True,
+            atol=1e-10,
+            rtol=1e-10,
+        )
+
+        expected = expm(-1j * np.pi * 0.3 * self.X.data) @ y0_batch.data.transpose()
+        self.assertAllClose(results.sol(0.3), expected.transpose(), atol=1e-7)
+
+
+class Testsolve_lmde_iter(Testsolve_lmde_Base):
+    """Tests for solve_lmde_iter."""
+
+    def setUp(self):
+        super().setUp()
+        operators = [-1j * 2 * np.pi * self.Z / 2, -1j * 2 * np.pi * 0.3 * self.X / 2]
+        signals = [Constant(1.0), Signal(1.0, 1.0)]
+        self.model = GeneratorModel(operators=operators, signals=signals, frame=-1j * self.X)
+
+    def test_fixed_step_method(self):
+        """Test that a fixed step method gives the same results as solve_lmde."""
+        t_eval = [0.1, 0.45, 0.8]
+        kwargs = {"method": "scipy_expm", "max_dt": 0.01, "t_eval": t_eval}
+        expected = solve_lmde(self.model, t_span=self.t_span, y0=self.y0, **kwargs)
+        output = list(solve_lmde_iter(self.model, t_span=self.t_span, y0=self.y0, **kwargs))
+
+        self.assertAllClose(Array([t for t, _ in output]), t_eval)
+        self.assertAllClose(Array([y for _, y in output]), expected.y)
+
+    def test_ode_method_t_eval(self):
+        """Test that an adaptive method yields the same states as solve_lmde."""
+        for method in ["RK45", "DOP853"]:
+            kwargs = {"method": method, "t_eval": [0.0, 0.1, 0.45, 0.8, 1.0]}
+            expected = solve_lmde(self.model, t_span=self.t_span, y0=self.y0, **kwargs)
+            output = list(solve_lmde_iter(self.model, t_span=self.t_span, y0=self.y0, **kwargs))
+
+            self.assertAllClose(Array([t for t, _ in output]), kwargs["t_eval"])
+            self.assertAllClose(Array([y for _, y in output]), expected.y, atol=1e-12)
+
+    def test_ode_method_t_span(self):
+        """Test an ODE method with a state yielded at each step when t_eval is unspecified."""
+        kwargs = {"method": "DOP853", "atol": 1e-10, "rtol": 1e-10, "output_frame": None}
+        expected = solve_lmde(self.model, t_span=self.t_span, y0=self.y0, **kwargs)
+        output = list(solve_lmde_iter(self.model, t_span=self.t_span, y0=self.y0, **kwargs))
+
+        self.assertTrue(len(output) == len(expected.t))
+        self.assertAllClose([t for t, _ in output], expected.t)
+        self.assertAllClose([y for _, y in output], expected.y)
+
+    def test_early_stop(self):
+        """Test that the solve only proceeds as far as iterated."""
+        calls = []
+
+        def generator(t):
+            calls.append(t)
+            return self.basic_generator(t)
+
+        output = solve_lmde_iter(
+            generator, t_span=self.t_span, y0=self.y0, method="scipy_expm", max_dt=0.1
+        )
+        t, y = next(output)
+        self.assertTrue(t == 0.0)
+        self.assertAllClose(y, self.y0)
+        self.assertTrue(max(calls) == 0.0)
+
+        t, y = next(output)
+        self.assertTrue(t == 1.0)
+        self.assertAllClose(y, expm(-1j * np.pi * self.X.data))
+
+    def test_batched_y0(self):
+        """Test a batch of initial states."""
+        y0_batch = Array([[1.0, 0.0], [0.0, 1.0]], dtype=complex)
+        output = list(
+            solve_lmde_iter(
+                self.basic_generator,
+                t_span=self.t_span,
+                y0=y0_batch,
+                method="scipy_expm",
+                max_dt=0.1,
+                t_eval=[0.5, 1.0],
+                batched_y0=True,
+            )
+        )
+
+        expected = expm(-1j * np.pi * self.X.data) @ y0_batch.data.transpose()
+        self.assertTrue(output[-1][1].shape == (2, 2))
+        self.assertAllClose(output[-1][1], expected.transpose())
+
+
+class Testsolve_lmde_observables(Testsolve_lmde_Base):
+    """Tests for solve_lmde with observables."""
+
+    def setUp(self):
+        super().setUp()
+        self.ham_model = HamiltonianModel(
+            operators=[2 * np.pi * self.Z / 2, 2 * np.pi * 0.3 * self.X / 2],
+            signals=[Constant(1.0), Signal(1.0, 1.0)],
+        )
+        self.observables = [self.X, self.Y, self.Z]
+        self.kwargs = {"method": "DOP853", "atol": 1e-10, "rtol": 1e-10, "t_eval": [0.0, 0.4, 1.0]}
+
+    def test_pure_state(self):
+        """Test expectation values in a pure state, with output frame differing from the
+        solver frame."""
+        y0 = Array([1.0, 1.0], dtype=complex) / np.sqrt(2)
+        results = solve_lmde(
+            self.ham_model, t_span=self.t_span, y0=y0, observables=self.observables, **self.kwargs
+        )
+        states = solve_lmde(self.ham_model, t_span=self.t_span, y0=y0, **self.kwargs).y
+
+        expected = [[np.vdot(y, op @ y) for op in self.observables] for y in states]
+        self.assertTrue("y" not in results)
+        self.assertAllClose(results.observables, expected, atol=1e-8)
+
+    def test_same_frames(self):
+        """Test expectation values computed directly in the solver frame basis."""
+        y0 = Array([1.0, 1.0], dtype=complex) / np.sqrt(2)
+        frame = -1j * 2 * np.pi * self.X / 2
+        kwargs = dict(self.kwargs, solver_frame=frame, output_frame=frame)
+        results = solve_lmde(
+            self.ham_model, t_span=self.t_span, y0=y0, observables=self.observables, **kwargs
+        )
+        states = solve_lmde(self.ham_model, t_span=self.t_span, y0=y0, **kwargs).y
+
+        expected = [[np.vdot(y, op @ y) for op in self.observables] for y in states]
+        self.assertAllClose(results.observables, expected, atol=1e-8)
+
+    def test_lindblad_model(self):
+        """Test expectation values for density matrices, and vectorized density matrices."""
+        model = LindbladModel.from_hamiltonian(
+            hamiltonian=self.ham_model, noise_operators=[Array([[0.0, 0.0], [1.0, 0.0]])]
+        )
+        rho0 = Array([[0.5, 0.5], [0.5, 0.5]], dtype=complex)
+        states = solve_lmde(model, t_span=self.t_span, y0=rho0, **self.kwargs).y
+        expected = [[np.trace(op @ rho) for op in self.observables] for rho in states]
+
+        results = solve_lmde(
+            model, t_span=self.t_span, y0=rho0, observables=self.observables, **self.kwargs
+        )
+        self.assertAllClose(results.observables, expected, atol=1e-8)
+
+        results = solve_lmde(
+            model,
+            t_span=self.t_span,
+            y0=rho0.flatten(order="F"),
+            observables=self.observables,
+            **self.kwargs,
+        )
+        self.assertAllClose(results.observables, expected, atol=1e-8)
+
+    def test_batched_y0(self):
+        """Test expectation values for a batch of initial states."""
+        y0_batch = Array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], dtype=complex) / np.sqrt(
+            Array([1.0, 1.0, 2.0])
+        ).reshape((3, 1))
+        results = solve_lmde(
+            self.ham_model,
+            t_span=self.t_span,
+            y0=y0_batch,
+            observables=self.observables,
+            batched_y0=True,
+            **self.kwargs,
+        )
+
+        self.assertTrue(results.observables.shape == (3, 3, 3))
+        for idx, y0 in enumerate(y0_batch):
+            single_results = solve_lmde(
+                self.ham_model,
+                t_span=self.t_span,
+                y0=y0,
+                observables=self.observables,
+                **self.kwargs,
+            )
+            self.assertAllClose(results.observables[:, idx], single_results.observables, atol=1e-8)
+
+    def test_callable(self):
+        """Test observables specified as a function of the output state."""
+        y0 = Array([1.0, 0.0], dtype=complex)
+        results = solve_lmde(
+            self.ham_model,
+            t_span=self.t_span,
+            y0=y0,
+            observables=lambda t, y: np.abs(Array(y).data) ** 2,
+            **self.kwargs,
+        )
+        states = solve_lmde(self.ham_model, t_span=self.t_span, y0=y0, **self.kwargs).y
+
+        self.assertAllClose(results.observables, np.abs(Array(states).data) ** 2, atol=1e-8)
+
+    def test_fixed_step_method(self):
+        """Test that the observables of a fixed step method are computed at exactly t_eval,
+        from the same states as returned by solve_lmde."""
+        y0 = Array([1.0, 1.0], dtype=complex) / np.sqrt(2)
+        kwargs = {"method": "scipy_expm", "max_dt": 0.01, "t_eval": [0.4, 0.75, 1.0]}
+        results = solve_lmde(
+            self.ham_model, t_span=self.t_span, y0=y0, observables=self.observables, **kwargs
+        )
+        states = solve_lmde(self.ham_model, t_span=self.t_span, y0=y0, **kwargs).y
+
+        expected = [[np.vdot(y, op @ y) for op in self.observables] for y in states]
+        self.assertAllClose(results.t, kwargs["t_eval"])
+        self.assertAllClose(results.observables, expected, atol=1e-12)
+
+    def test_adaptive_method_single_solve(self):
+        """Test that the observables of an adaptive method are computed within a single solve,
+        with the same steps and solver information as the solve returning the states."""
+        y0 = Array([1.0, 1.0], dtype=complex) / np.sqrt(2)
+        kwargs = {"method": "DOP853", "t_eval": np.linspace(0.0, 1.0, 11), "dense_output": True}
+        results = solve_lmde(
+            self.ham_model, t_span=self.t_span, y0=y0, observables=self.observables, **kwargs
+        )
+        plain_results = solve_lmde(self.ham_model, t_span=self.t_span, y0=y0, **kwargs)
+
+        expected = [[np.vdot(y, op @ y) for op in self.observables] for y in plain_results.y]
+        self.assertAllClose(results.observables, expected, atol=1e-12)
+        self.assertTrue(results.nfev == plain_results.nfev)
+        self.assertTrue(results.success)
+
+        y = plain_results.sol(0.55)
+        expected = [np.vdot(y, op @ y) for op in self.observables]
+        self.assertAllClose(results.sol(0.55), expected, atol=1e-12)
+
+    def test_incompatible_shape(self):
+        """Test error raised for observables of the wrong dimension."""
+        with self.assertRaises(QiskitError):
+            solve_lmde(
+                self.ham_model,
+                t_span=self.t_span,
+                y0=Array([1.0, 0.0], dtype=complex),
+                observables=[np.eye(3)],
+                **self.kwargs,
+            )
+
+
+class Testsolve_lmde_qiskit_states(Testsolve_lmde_Base):
+    """Tests for solve_lmde with initial states given as qiskit classes."""
+
+    def test_statevector(self):
+        """Test that a Statevector y0 gives Statevector outputs."""
+        results = solve_lmde(
+            self.basic_generator,
+            t_span=self.t_span,
+            y0=Statevector([1.0, 0.0]),
+            t_eval=[0.5, 1.0],
+            atol=1e-10,
+            rtol=1e-10,
+        )
+
+        self.assertTrue(all(isinstance(y, Statevector) for y in results.y))
+        for t, y in zip([0.5, 1.0], results.y):
+            self.assertAllClose(y.data, expm(-1j * np.pi * t * self.X.data)[:, 0])
+
+    def test_operator(self):
+        """Test that an Operator y0 gives Operator outputs."""
+        hamiltonian = HamiltonianModel(
+            operators=[2 * np.pi * self.X / 2], signals=[Constant(1.0)], frame=self.Z
+        )
+        results = solve_lmde(
+            hamiltonian,
+            t_span=self.t_span,
+            y0=Operator(np.eye(2)),
+            t_eval=[0.5, 1.0],
+            atol=1e-10,
+            rtol=1e-10,
+        )
+
+        self.assertTrue(all(isinstance(y, Operator) for y in results.y))
+        for t, y in zip([0.5, 1.0], results.y):
+            # outputs are in the frame of the model
+            expected = expm(1j * t * self.Z.data) @ expm(-1j * np.pi * t * self.X.data)
+            self.assertAllClose(y.data, expected, atol=1e-7)
+
+
+class Testsolve_lmde_solve_ode(Testsolve_lmde_Base):
+    """Tests for solve_lmde falling back on solve_ode."""
+
+    def test_batched_y0(self):
+        """Test batched initial states with an ODE method."""
+        self._batched_y0_tests("RK45", atol=1e-10, rtol=1e-10)
+
+    def test_batched_vectorized_y0(self):
+        """Test batched vectorized initial states with an ODE method."""
+        self._batched_vectorized_y0_tests("RK45", atol=1e-10, rtol=1e-10)
+
 
 class Testsolve_lmde_jax_expm(Testsolve_lmde_Base, TestJaxBase):
     """Basic tests for solve_lmde with method=='jax_expm'."""
@@ -185,3 +859,7 @@ class Testsolve_lmde_jax_expm(Testsolve_lmde_Base, TestJaxBase):
     def test_jax_expm_solver(self):
         """Test jax_expm_solver."""
         self._fixed_step_LMDE_method_tests("jax_expm")
+
+    def test_batched_y0(self):
+        """Test batched initial states with jax_expm_solver."""
+        self._batched_y0_tests("jax_expm", max_dt=0.1)
@@ -17,6 +17,7 @@ import numpy as np
 from scipy.linalg import expm
 
 from qiskit import QiskitError
+from qiskit.quantum_info import Operator
 from qiskit_ode import solve_ode
 from qiskit_ode.models import GeneratorModel
 from qiskit_ode.signals import Constant, Signal
@@ -102,6 +103,25 @@ class Testsolve_ode_Base(QiskitOdeTestCase):
         expected = Array([1.0 / 3])
         self.assertAllClose(results.y[-1], expected)
 
+    def _fixed_step_method_standard_tests(self, method):
+        """tests to run on a fixed step solver."""
+
+        results = solve_ode(
+            self.basic_rhs, t_span=self.t_span, y0=self.y0, method=method, max_dt=0.001
+        )
+
+        expected = expm(-1j * np.pi * self.X.data)
+
+        self.assertAllClose(results.y[-1], expected)
+
+        # pylint: disable=unused-argument
+        def quad_rhs(t, y):
+            return Array([t ** 2], dtype=float)
+
+        results = solve_ode(quad_rhs, t_span=[0.0, 1.0], y0=Array([0.0]), method=method, max_dt=0.1)
+        expected = Array([1.0 / 3])
+        self.assertAllClose(results.y[-1], expected)
+
 
 class Testsolve_ode_numpy(Testsolve_ode_Base):
     """Basic tests for `numpy`-based ODE solver methods."""
@@ -114,6 +134,46 @@ class Testsolve_ode_numpy(Testsolve_ode_Base):
         self._variable_step_method_standard_tests("BDF")
         self._variable_step_method_standard_tests("DOP853")
 
+    def test_dense_output(self):
+        """Test dense output for complex and real-embedded solve_ivp methods."""
+        t_eval = [0.1, 0.45, 0.8]
+        for method in ["DOP853", "LSODA"]:
+            results = solve_ode(
+                self.basic_rhs,
+                t_span=self.t_span,
+                y0=self.y0,
+                method=method,
+                dense_output=True,
+                atol=1e-10,
+                rtol=1e-10,
+            )
+            expected = [expm(-1j * np.pi * t * self.X.data) for t in t_eval]
+
+            self.assertEqual(results.sol(0.45).shape, (2, 2))
+            self.assertAllClose(results.sol(0.45), expected[1], atol=1e-7)
+            self.assertEqual(results.sol(t_eval).shape, (3, 2, 2))
+            self.assertAllClose(results.sol(t_eval), expected, atol=1e-7)
+
+    def test_dense_output_operator(self):
+        """Test dense output when y0 is an Operator."""
+        results = solve_ode(
+            self.basic_rhs,
+            t_span=self.t_span,
+            y0=Operator(np.eye(2, dtype=complex)),
+            method="DOP853",
+            dense_output=True,
+            atol=1e-10,
+            rtol=1e-10,
+        )
+
+        output = results.sol([0.45])
+        self.assertTrue(isinstance(output[0], Operator))
+        self.assertAllClose(output[0].data, expm(-1j * np.pi * 0.45 * self.X.data), atol=1e-7)
+
+    def test_standard_problems_rk4(self):
+        """Run standard tests for the fixed step `numpy` RK4 method."""
+        self._fixed_step_method_standard_tests("scipy_rk4")
+
 
 class Testsolve_ode_jax(Testsolve_ode_Base, TestJaxBase):
     """Basic tests for jax ODE solvers."""
@@ -121,3 +181,7 @@ class Testsolve_ode_jax(Testsolve_ode_Base, TestJaxBase):
     def test_standard_problems_jax(self):
         """Run standard tests for variable step `jax` methods."""
         self._variable_step_method_standard_tests("jax_odeint")
+
+    def test_standard_problems_rk4(self):
+        """Run standard tests for the fixed step `jax` RK4 method."""
+        self._fixed_step_method_standard_tests("jax_rk4")
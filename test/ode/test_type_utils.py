@@ -14,9 +14,16 @@
 """Tests for type_utils.py."""
 
 import numpy as np
+from scipy.sparse import csr_matrix, issparse
 from qiskit_ode.dispatch import Array
 
-from qiskit_ode.type_utils import convert_state, type_spec_from_instance, StateTypeConverter
+from qiskit_ode.type_utils import (
+    convert_state,
+    type_spec_from_instance,
+    StateTypeConverter,
+    vec_commutator,
+    vec_dissipator,
+)
 
 from .common import QiskitOdeTestCase, TestJaxBase
 
@@ -215,6 +222,36 @@ class TestTypeUtils(QiskitOdeTestCase):
 
         self.assertAllClose(output, expected_output)
 
+    def test_vec_commutator_dissipator(self):
+        """Test vectorized commutator and dissipator against their action on a matrix."""
+        rng = np.random.default_rng(2313)
+        ops = Array(rng.uniform(size=(2, 3, 3)) + 1j * rng.uniform(size=(2, 3, 3)))
+        rho = rng.uniform(size=(3, 3)) + 1j * rng.uniform(size=(3, 3))
+
+        vec_comms = vec_commutator(ops)
+        vec_disss = vec_dissipator(ops)
+        for op, vec_comm, vec_diss in zip(np.array(ops), vec_comms, vec_disss):
+            expected = op @ rho - rho @ op
+            output = np.array(vec_comm) @ rho.flatten(order="F")
+            self.assertAllClose(output.reshape((3, 3), order="F"), expected)
+
+            LdagL = op.conj().transpose() @ op
+            expected = op @ rho @ op.conj().transpose() - 0.5 * (LdagL @ rho + rho @ LdagL)
+            output = np.array(vec_diss) @ rho.flatten(order="F")
+            self.assertAllClose(output.reshape((3, 3), order="F"), expected)
+
+            # single operator
+            self.assertAllClose(vec_dissipator(Array(op)), vec_diss)
+
+        # sparse construction
+        sparse_ops = [csr_matrix(op) for op in np.array(ops)]
+        for sparse_out, dense_out in [
+            (vec_commutator(sparse_ops), vec_comms),
+            (vec_dissipator(sparse_ops), vec_disss),
+        ]:
+            self.assertTrue(all(issparse(out) for out in sparse_out))
+            self.assertAllClose(np.array([out.toarray() for out in sparse_out]), dense_out)
+
 
 class TestTypeUtilsJax(TestTypeUtils, TestJaxBase):
     """Jax version of TestTypeUtils tests.